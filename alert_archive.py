@@ -0,0 +1,372 @@
+"""
+Persistent archive of alerts and activities
+Stores every alert and activity in an embedded SQLite database, in one table
+per kind and day (e.g. alerts_20261019), so retention is a DROP TABLE and
+time-range queries only touch the days they cover. Writes are queued and
+flushed in batches by a background thread, off the request path. The
+in-memory histories in api_client / overseer_bot remain the hot views.
+"""
+import os
+import json
+import atexit
+import logging
+import queue
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+
+# Configuration from environment variables
+ARCHIVE_ENABLED = os.getenv('ARCHIVE_ENABLED', 'true').lower() == 'true'
+ARCHIVE_PATH = os.getenv('ARCHIVE_PATH', 'archive.db')
+ARCHIVE_RETENTION_DAYS = int(os.getenv('ARCHIVE_RETENTION_DAYS', '30'))
+
+# Batched writer: rows are written once ARCHIVE_BATCH_SIZE are queued or
+# ARCHIVE_FLUSH_INTERVAL seconds after the first one, whichever comes first.
+# A full queue drops rows (counted) rather than blocking the caller.
+ARCHIVE_BATCH_SIZE = 200
+ARCHIVE_FLUSH_INTERVAL = 2.0  # seconds
+ARCHIVE_QUEUE_SIZE = 10000
+ARCHIVE_PRUNE_INTERVAL = 3600  # seconds between retention checks
+ARCHIVE_RETRY_DELAY = 5.0  # seconds the writer pauses after a failed batch
+ARCHIVE_MAX_QUERY_LIMIT = 1000
+
+# Columns per kind, in insert order (the table prefix is the kind name)
+ARCHIVE_COLUMNS = {
+    'alerts': ('seq', 'timestamp', 'type', 'source', 'message', 'data'),
+    'activities': ('timestamp', 'type', 'description')
+}
+ARCHIVE_TABLE_DDL = {
+    'alerts': 'seq INTEGER, timestamp TEXT NOT NULL, type TEXT, source TEXT, message TEXT, data TEXT',
+    'activities': 'timestamp TEXT NOT NULL, type TEXT, description TEXT'
+}
+PARTITION_PATTERN = re.compile(r'^(alerts|activities)_(\d{8})$')
+
+_QUEUE = queue.Queue(maxsize=ARCHIVE_QUEUE_SIZE)
+_WRITER = None
+_WRITER_LOCK = threading.Lock()
+ARCHIVE_STATS = {
+    'queued': 0,
+    'written': 0,
+    'dropped': 0,
+    'batches': 0,
+    'errors': 0,
+    'partitions_dropped': 0,
+    'writer_restarts': 0,
+    'last_flush': None,
+    'last_error': None
+}
+ARCHIVE_STATS_LOCK = threading.Lock()
+
+
+def _count(key: str, amount: int = 1):
+    with ARCHIVE_STATS_LOCK:
+        ARCHIVE_STATS[key] += amount
+
+
+def connect() -> sqlite3.Connection:
+    """Open a connection to the archive (WAL mode, so readers never block the writer)"""
+    conn = sqlite3.connect(ARCHIVE_PATH, timeout=10)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+
+def partition_name(kind: str, timestamp: str) -> str:
+    """
+    Table holding a row of the given kind
+
+    Args:
+        kind: 'alerts' or 'activities'
+        timestamp: ISO timestamp of the row
+
+    Returns:
+        Table name such as 'alerts_20261019'
+    """
+    return f"{kind}_{timestamp[:10].replace('-', '')}"
+
+
+def list_partitions(conn: sqlite3.Connection, kind: str) -> List[str]:
+    """Existing partition tables of a kind, newest day first"""
+    rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    tables = [name for (name,) in rows if (match := PARTITION_PATTERN.match(name)) and match.group(1) == kind]
+    return sorted(tables, reverse=True)
+
+
+def _ensure_partition(conn: sqlite3.Connection, kind: str, table: str, known: set):
+    if table in known:
+        return
+    conn.execute(f'CREATE TABLE IF NOT EXISTS {table} ({ARCHIVE_TABLE_DDL[kind]})')
+    conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_timestamp ON {table} (timestamp)')
+    conn.execute(f'CREATE INDEX IF NOT EXISTS {table}_type ON {table} (type, timestamp)')
+    known.add(table)
+
+
+def write_batch(conn: sqlite3.Connection, batch: List[tuple], known: set):
+    """
+    Insert a batch of queued rows in a single transaction
+
+    Args:
+        conn: Writer connection
+        batch: (kind, row) tuples, rows ordered as in ARCHIVE_COLUMNS
+        known: Partition tables already created (updated in place)
+    """
+    grouped = {}
+    for kind, row in batch:
+        timestamp = row[ARCHIVE_COLUMNS[kind].index('timestamp')]
+        grouped.setdefault((kind, partition_name(kind, timestamp)), []).append(row)
+    with conn:
+        for (kind, table), rows in grouped.items():
+            _ensure_partition(conn, kind, table, known)
+            columns = ARCHIVE_COLUMNS[kind]
+            conn.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                rows
+            )
+
+
+def prune_partitions(conn: sqlite3.Connection, known: set) -> int:
+    """
+    Drop partitions older than ARCHIVE_RETENTION_DAYS
+
+    Returns:
+        Number of tables dropped
+    """
+    cutoff = (datetime.now() - timedelta(days=ARCHIVE_RETENTION_DAYS)).strftime('%Y%m%d')
+    dropped = 0
+    for kind in ARCHIVE_COLUMNS:
+        for table in list_partitions(conn, kind):
+            if table.rsplit('_', 1)[1] < cutoff:
+                conn.execute(f'DROP TABLE IF EXISTS {table}')
+                known.discard(table)
+                dropped += 1
+    if dropped:
+        conn.commit()
+        logging.info(f"Archive retention: dropped {dropped} partitions older than {ARCHIVE_RETENTION_DAYS} days")
+    return dropped
+
+
+def _record_error(message: str):
+    with ARCHIVE_STATS_LOCK:
+        ARCHIVE_STATS['errors'] += 1
+        ARCHIVE_STATS['last_error'] = f"{datetime.now().isoformat()} {message}"
+    logging.error(message)
+
+
+def writer_loop():
+    """
+    Background writer - drains the queue into the archive in batches
+    Runs in a daemon thread started on the first archived row
+
+    Any failure (unwritable path, locked or corrupt database, bad row) costs
+    only the batch in hand: it is logged, the connection is dropped and
+    reopened for the next batch after ARCHIVE_RETRY_DELAY seconds.
+    """
+    conn = None
+    known = set()
+    next_prune = 0
+    while True:
+        batch = [_QUEUE.get()]
+        deadline = time.monotonic() + ARCHIVE_FLUSH_INTERVAL
+        while len(batch) < ARCHIVE_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        stop = None in batch
+        batch = [item for item in batch if item is not None]
+        try:
+            if conn is None:
+                conn = connect()
+                known = set()
+            if batch:
+                write_batch(conn, batch, known)
+                with ARCHIVE_STATS_LOCK:
+                    ARCHIVE_STATS['written'] += len(batch)
+                    ARCHIVE_STATS['batches'] += 1
+                    ARCHIVE_STATS['last_flush'] = datetime.now().isoformat()
+            if time.monotonic() >= next_prune:
+                _count('partitions_dropped', prune_partitions(conn, known))
+                next_prune = time.monotonic() + ARCHIVE_PRUNE_INTERVAL
+        except Exception as e:
+            _record_error(f"Archive write failed ({len(batch)} rows lost): {e}")
+            if conn is not None:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+                conn = None
+            if not stop:
+                time.sleep(ARCHIVE_RETRY_DELAY)
+        finally:
+            for _ in range(len(batch) + int(stop)):
+                _QUEUE.task_done()
+        if stop:
+            if conn is not None:
+                conn.close()
+            return
+
+
+def _start_writer():
+    global _WRITER
+    with _WRITER_LOCK:
+        if _WRITER is not None and _WRITER.is_alive():
+            return
+        if _WRITER is None:
+            atexit.register(shutdown)
+        else:
+            _count('writer_restarts')
+            _record_error("Archive writer thread died; restarting it")
+        _WRITER = threading.Thread(target=writer_loop, daemon=True, name="archive-writer")
+        _WRITER.start()
+        logging.info(f"Archive writer started ({ARCHIVE_PATH}, {ARCHIVE_RETENTION_DAYS} day retention)")
+
+
+def _enqueue(kind: str, row: tuple):
+    if not ARCHIVE_ENABLED:
+        return
+    if _WRITER is None or not _WRITER.is_alive():
+        _start_writer()
+    try:
+        _QUEUE.put_nowait((kind, row))
+        _count('queued')
+    except queue.Full:
+        _count('dropped')
+
+
+def record_alert(alert: dict):
+    """
+    Queue an alert for archiving (never blocks)
+
+    Args:
+        alert: Alert dictionary as returned by /api/alerts
+    """
+    _enqueue('alerts', (
+        alert.get('seq'),
+        alert['timestamp'],
+        alert.get('type'),
+        alert.get('source'),
+        alert.get('message'),
+        json.dumps(alert.get('data'), default=str)
+    ))
+
+
+def record_activity(activity: dict):
+    """
+    Queue an activity for archiving (never blocks)
+
+    Args:
+        activity: Activity dictionary as returned by /api/activities
+    """
+    _enqueue('activities', (activity['timestamp'], activity.get('type'), activity.get('description')))
+
+
+def shutdown(timeout: float = 5.0):
+    """Flush queued rows and stop the writer (registered with atexit)"""
+    if _WRITER is None or not _WRITER.is_alive():
+        return
+    try:
+        _QUEUE.put(None, timeout=timeout)
+    except queue.Full:
+        return
+    _WRITER.join(timeout)
+
+
+def query(kind: str, start: Optional[str] = None, end: Optional[str] = None,
+          record_type: Optional[str] = None, source: Optional[str] = None, limit: int = 100) -> List[dict]:
+    """
+    Query archived rows, newest first
+
+    Only the day partitions overlapping [start, end) are read.
+
+    Args:
+        kind: 'alerts' or 'activities'
+        start: Inclusive ISO timestamp lower bound
+        end: Exclusive ISO timestamp upper bound
+        record_type: Only rows of this type
+        source: Only alerts from this source (ignored for activities)
+        limit: Maximum number of rows (capped at ARCHIVE_MAX_QUERY_LIMIT)
+
+    Returns:
+        Row dictionaries (alert 'data' decoded from JSON)
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    if kind not in ARCHIVE_COLUMNS:
+        raise ValueError(f"Unknown archive kind: {kind}")
+    limit = max(0, min(limit, ARCHIVE_MAX_QUERY_LIMIT))
+    if not os.path.exists(ARCHIVE_PATH) or not limit:
+        return []
+
+    conditions, params = [], []
+    if start:
+        conditions.append('timestamp >= ?')
+        params.append(start)
+    if end:
+        conditions.append('timestamp < ?')
+        params.append(end)
+    if record_type:
+        conditions.append('type = ?')
+        params.append(record_type)
+    if source and kind == 'alerts':
+        conditions.append('source = ?')
+        params.append(source)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    columns = ARCHIVE_COLUMNS[kind]
+    first_day = start[:10].replace('-', '') if start else None
+    last_day = end[:10].replace('-', '') if end else None
+
+    results = []
+    conn = connect()
+    try:
+        for table in list_partitions(conn, kind):
+            day = table.rsplit('_', 1)[1]
+            if (last_day and day > last_day) or (first_day and day < first_day):
+                continue
+            rows = conn.execute(
+                f"SELECT {', '.join(columns)} FROM {table} {where} ORDER BY timestamp DESC LIMIT ?",
+                params + [limit - len(results)]
+            ).fetchall()
+            results.extend(dict(zip(columns, row)) for row in rows)
+            if len(results) >= limit:
+                break
+    finally:
+        conn.close()
+
+    if kind == 'alerts':
+        for row in results:
+            row['data'] = json.loads(row['data']) if row['data'] else {}
+    return results
+
+
+def get_stats() -> dict:
+    """Writer counters, queue depth and partitions on disk"""
+    with ARCHIVE_STATS_LOCK:
+        stats = dict(ARCHIVE_STATS)
+    stats.update(
+        enabled=ARCHIVE_ENABLED,
+        path=ARCHIVE_PATH,
+        retention_days=ARCHIVE_RETENTION_DAYS,
+        pending=_QUEUE.qsize(),
+        writer_alive=_WRITER is not None and _WRITER.is_alive(),
+        partitions={}
+    )
+    if ARCHIVE_ENABLED and os.path.exists(ARCHIVE_PATH):
+        conn = None
+        try:
+            conn = connect()
+            stats['partitions'] = {kind: list_partitions(conn, kind) for kind in ARCHIVE_COLUMNS}
+        except sqlite3.Error as e:
+            stats['error'] = str(e)
+        finally:
+            if conn is not None:
+                conn.close()
+    return stats
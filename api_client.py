@@ -1,16 +1,29 @@
 """
-API Client for fetching status and alerts from overseer-bot-ai
+API Client for fetching status and alerts from upstream bots
+(overseer-bot-ai, Token-scalper and any others listed in the upstream registry)
 Polls external APIs and aggregates event data for dashboard display
 """
 import os
+import json
+import functools
+import math
+import hashlib
+import hmac
 import logging
+import random
 import requests
 import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain, islice
 from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
+import alert_archive
+import http_client
+
 
 # Configuration from environment variables
 OVERSEER_BOT_AI_URL = os.getenv('OVERSEER_BOT_AI_URL', '')
@@ -19,31 +32,109 @@ OVERSEER_BOT_AI_USERNAME = os.getenv('OVERSEER_BOT_AI_USERNAME', '')
 OVERSEER_BOT_AI_PASSWORD = os.getenv('OVERSEER_BOT_AI_PASSWORD', '')
 TOKEN_SCALPER_URL = os.getenv('TOKEN_SCALPER_URL', '')
 TOKEN_SCALPER_API_KEY = os.getenv('TOKEN_SCALPER_API_KEY', '')
+OVERSEER_BOT_AI_PUSH_SECRET = os.getenv('OVERSEER_BOT_AI_PUSH_SECRET', '')
+TOKEN_SCALPER_PUSH_SECRET = os.getenv('TOKEN_SCALPER_PUSH_SECRET', '')
+
+# Upstream registry: a JSON list of upstream definitions, inline or in a file
+# (see load_upstreams). The legacy variables above still define the
+# 'overseer_bot_ai' and 'token_scalper' upstreams unless the registry does.
+UPSTREAMS_JSON = os.getenv('UPSTREAMS_JSON', '')
+UPSTREAMS_FILE = os.getenv('UPSTREAMS_FILE', '')
 
 # Polling configuration
 POLL_INTERVAL = int(os.getenv('POLL_INTERVAL', '15'))  # seconds (default 15s)
 REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '5'))  # seconds
+POLL_MAX_WORKERS = int(os.getenv('POLL_MAX_WORKERS', '3'))  # endpoints fetched at once
+
+# Adaptive polling bounds. Unhealthy upstreams back off exponentially (with
+# jitter) up to POLL_MAX_INTERVAL; upstreams that just delivered new alerts
+# are polled every POLL_BOOST_INTERVAL for POLL_BOOST_DURATION seconds.
+POLL_MIN_INTERVAL = int(os.getenv('POLL_MIN_INTERVAL', '5'))
+POLL_MAX_INTERVAL = int(os.getenv('POLL_MAX_INTERVAL', '300'))
+POLL_BOOST_INTERVAL = int(os.getenv('POLL_BOOST_INTERVAL', '5'))
+POLL_BOOST_DURATION = int(os.getenv('POLL_BOOST_DURATION', '120'))
+POLL_BACKOFF_JITTER = 0.2  # +/- fraction applied to backed-off intervals
+POLL_BOOST_UNTIL = {}  # service -> epoch seconds (guarded by HEALTH_STATUS_LOCK)
+
+# Push ingestion: upstreams with a push secret may POST alerts to
+# /api/push/<name>, signed with HMAC-SHA256 over "<timestamp>.<body>".
+# Polling of an upstream pauses while its pushes (alerts or empty heartbeats)
+# keep arriving within PUSH_STALE_AFTER seconds, and resumes when they stop.
+PUSH_SIGNATURE_HEADER = 'X-Signature'
+PUSH_TIMESTAMP_HEADER = 'X-Signature-Timestamp'
+PUSH_MAX_SKEW = 300  # seconds a signed timestamp stays valid (replay window)
+PUSH_STALE_AFTER = int(os.getenv('PUSH_STALE_AFTER', '90'))
+# (service, endpoint) -> epoch seconds of the last accepted push that
+# delivered that endpoint's data (guarded by HEALTH_STATUS_LOCK)
+PUSH_LAST_SEEN = {}
+# Signatures accepted within the replay window, oldest first, so a captured
+# push cannot be delivered twice
+PUSH_SEEN_SIGNATURES = OrderedDict()  # signature -> epoch seconds
+PUSH_SEEN_SIGNATURES_LOCK = threading.Lock()
 
 # Alert storage
-ALERT_HISTORY = []
-ALERT_HISTORY_LOCK = threading.Lock()
 MAX_ALERTS = 100  # Keep last 100 alerts
+ALERT_HISTORY = deque(maxlen=MAX_ALERTS)  # AlertRecord, oldest first
+ALERT_HISTORY_LOCK = threading.Lock()
+MAX_ALERT_QUERY_LIMIT = MAX_ALERTS
 
-# Health status tracking
-HEALTH_STATUS = {
-    'overseer_bot_ai': {
-        'status': 'unknown',
-        'last_check': None,
-        'last_success': None,
-        'error': None
-    },
-    'token_scalper': {
-        'status': 'unknown',
-        'last_check': None,
-        'last_success': None,
-        'error': None
-    }
+# Secondary indexes over ALERT_HISTORY (guarded by ALERT_HISTORY_LOCK).
+# Each holds the records of one type / source in sequence order, so records
+# leave them from the left exactly when they leave the history. Sequence
+# cursors bisect; timestamps are wall-clock (they can step back) and are
+# filtered record by record, which is cheap at MAX_ALERTS records.
+ALERT_INDEX_BY_TYPE = {}    # type -> deque of AlertRecord
+ALERT_INDEX_BY_SOURCE = {}  # source -> deque of AlertRecord
+ALERT_SEQ = 0               # sequence number of the newest alert (cursor basis)
+
+# Upstream payloads are not stored as-is: each alert keeps only the fields
+# listed for its type, with strings truncated and nested values cut down, so
+# memory per alert stays bounded. The lists follow the Token-scalper alert
+# schema (see handle_rug_pull_alert in overseer_bot.py); an upstream can
+# override them per type with the "fields" option of its registry entry.
+# Alerts of other types keep the ALERT_DEFAULT_FIELDS they have, then other
+# keys up to ALERT_FIELD_MAX_ITEMS in total.
+ALERT_TOKEN_FIELDS = ('id', 'alert_id', 'token_name', 'token_symbol', 'token_address', 'chain')
+ALERT_FIELDS = {
+    'rug_pull': ALERT_TOKEN_FIELDS + ('severity', 'details'),
+    'rugpull': ALERT_TOKEN_FIELDS + ('severity', 'details'),
+    'high_potential': ALERT_TOKEN_FIELDS + ('opportunity_score', 'reasons'),
+    'airdrop': ALERT_TOKEN_FIELDS + ('name', 'website', 'value_estimate'),
+    'trade': ALERT_TOKEN_FIELDS + ('side', 'amount', 'price', 'value_usd', 'tx_hash'),
+    'status': ('changed', 'previous')
 }
+ALERT_DEFAULT_FIELDS = ALERT_TOKEN_FIELDS + ('seq', 'severity', 'details', 'price', 'url')
+ALERT_FIELD_MAX_CHARS = 200   # longer strings are truncated
+ALERT_FIELD_MAX_ITEMS = 10    # entries kept from nested lists / dicts and unknown alert types
+
+# Incremental alert ingestion: the newest timestamp seen is sent as a cursor
+# (upstreams that ignore it still work) and alerts are deduplicated locally
+ALERTS_SINCE_PARAM = os.getenv('ALERTS_SINCE_PARAM', 'since')
+ALERT_SEEN_MAX = 1000  # alert identities remembered per source
+ALERT_RATE_WINDOW = 15 * 60  # seconds covered by the ingestion rate
+INGESTION_STATE = {}  # source -> {'seen': OrderedDict, 'cursor': str, 'fetched': n, 'new': n, 'times': deque}
+INGESTION_LOCK = threading.Lock()
+
+# Latest /api/status snapshot per upstream. Only changes to the watched
+# fields are written to the alert history.
+STATUS_WATCH_FIELDS = [
+    field.strip() for field in os.getenv('STATUS_WATCH_FIELDS', 'status,version,error').split(',')
+    if field.strip()
+]
+STATUS_STORE = {}  # service -> snapshot record
+STATUS_STORE_LOCK = threading.Lock()
+
+# Conditional GET validators per (service, endpoint): ETag / Last-Modified
+# from the last full response, the full URL (query string included) they
+# belong to, plus the size of that body for savings stats. They are only
+# sent again for the same URL, so a moved 'since' cursor never gets a 304
+# meant for the previous one.
+CONDITIONAL_VALIDATORS = {}
+CONDITIONAL_VALIDATORS_LOCK = threading.Lock()
+
+# Health status tracking (one entry per upstream, filled in after the
+# registry is loaded at the bottom of this module)
+HEALTH_STATUS = {}
 HEALTH_STATUS_LOCK = threading.Lock()
 
 # Error tracking to reduce log noise
@@ -124,36 +215,119 @@ def format_invalid_url_error(url: str) -> str:
     return f"Invalid URL format: '{url}'. Must start with http:// or https://"
 
 
-def add_alert(alert_type: str, source: str, data: dict, message: str = None):
+class AlertRecord:
+    """Compact alert history entry (fixed attributes, no per-instance __dict__)"""
+    __slots__ = ('seq', 'timestamp', 'type', 'source', 'data', 'message')
+    
+    def __init__(self, seq: int, timestamp: str, alert_type: str, source: str, data: dict, message: str):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.type = alert_type
+        self.source = source
+        self.data = data
+        self.message = message
+    
+    def to_dict(self) -> dict:
+        """JSON-ready dictionary in the shape /api/alerts has always returned"""
+        return {
+            'seq': self.seq,
+            'timestamp': self.timestamp,
+            'type': self.type,
+            'source': self.source,
+            'data': self.data,
+            'message': self.message
+        }
+
+
+def compact_value(value, depth: int = 1):
+    """
+    Bound the size of one alert field value
+    
+    Args:
+        value: Value from an upstream payload
+        depth: Levels of nested lists / dicts still allowed
+        
+    Returns:
+        The value with strings truncated to ALERT_FIELD_MAX_CHARS and nested
+        containers cut to ALERT_FIELD_MAX_ITEMS entries (deeper ones as strings)
+    """
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, dict) and depth > 0:
+        return {
+            str(key)[:ALERT_FIELD_MAX_CHARS]: compact_value(item, depth - 1)
+            for key, item in list(value.items())[:ALERT_FIELD_MAX_ITEMS]
+        }
+    if isinstance(value, (list, tuple)) and depth > 0:
+        return [compact_value(item, depth - 1) for item in value[:ALERT_FIELD_MAX_ITEMS]]
+    return str(value)[:ALERT_FIELD_MAX_CHARS]
+
+
+def extract_alert_fields(alert_type: str, data: dict, fields: Optional[List[str]] = None) -> dict:
+    """
+    Keep only the fields worth storing for an alert type
+    
+    Args:
+        alert_type: Type of alert (selects the field list in ALERT_FIELDS)
+        data: Alert data as received
+        fields: Field list overriding ALERT_FIELDS (an upstream's "fields" option)
+        
+    Returns:
+        New dictionary with the listed fields that are present, compacted.
+        Types without a field list keep ALERT_DEFAULT_FIELDS first, then
+        the remaining keys, up to ALERT_FIELD_MAX_ITEMS fields.
+    """
+    if not isinstance(data, dict):
+        return {}
+    fields = fields or ALERT_FIELDS.get(alert_type)
+    if fields is None:
+        known = [field for field in ALERT_DEFAULT_FIELDS if field in data]
+        others = (key for key in data if key not in ALERT_DEFAULT_FIELDS)
+        fields = list(islice(chain(known, others), ALERT_FIELD_MAX_ITEMS))
+    return {str(field)[:ALERT_FIELD_MAX_CHARS]: compact_value(data[field]) for field in fields if field in data}
+
+
+def _unindex_alert_locked(index: dict, key: str):
+    records = index[key]
+    records.popleft()
+    if not records:
+        del index[key]
+
+
+def add_alert(alert_type: str, source: str, data: dict, message: str = None,
+              fields: Optional[List[str]] = None):
     """
     Add an alert to the history (thread-safe)
     
     Args:
         alert_type: Type of alert (e.g., 'trade', 'rugpull', 'airdrop', 'status')
         source: Source system (e.g., 'overseer-bot-ai', 'token-scalper')
-        data: Alert data dictionary (should contain only essential fields to avoid memory issues)
+        data: Alert data dictionary; only the fields listed for the alert
+            type are kept (see extract_alert_fields)
         message: Optional human-readable message
-    
-    Note: The data dictionary is stored as-is. Ensure external APIs return 
-    reasonably-sized data objects. Consider extracting only essential fields 
-    if the external API returns large responses.
+        fields: Optional field list overriding the one for the alert type
     """
-    global ALERT_HISTORY
+    global ALERT_SEQ
+    data = extract_alert_fields(alert_type, data, fields)
+    message = str(message or f"{alert_type.upper()} from {source}")[:ALERT_FIELD_MAX_CHARS]
     with ALERT_HISTORY_LOCK:
-        alert = {
-            'timestamp': datetime.now().isoformat(),
-            'type': alert_type,
-            'source': source,
-            'data': data,
-            'message': message or f"{alert_type.upper()} from {source}"
-        }
-        ALERT_HISTORY.append(alert)
-        
-        # Keep only the most recent alerts (bounded memory usage)
-        if len(ALERT_HISTORY) > MAX_ALERTS:
-            ALERT_HISTORY = ALERT_HISTORY[-MAX_ALERTS:]
+        ALERT_SEQ += 1
+        record = AlertRecord(ALERT_SEQ, datetime.now().isoformat(), alert_type, source, data, message)
         
-        logging.info(f"Alert added: {alert_type} from {source}")
+        # Fixed-size deque: the oldest alert drops off in O(1), and off the
+        # left end of its index entries with it
+        if len(ALERT_HISTORY) == ALERT_HISTORY.maxlen:
+            evicted = ALERT_HISTORY[0]
+            _unindex_alert_locked(ALERT_INDEX_BY_TYPE, evicted.type)
+            _unindex_alert_locked(ALERT_INDEX_BY_SOURCE, evicted.source)
+        ALERT_HISTORY.append(record)
+        ALERT_INDEX_BY_TYPE.setdefault(alert_type, deque()).append(record)
+        ALERT_INDEX_BY_SOURCE.setdefault(source, deque()).append(record)
+    
+    # Persist in the background; the deque above stays the hot view
+    alert_archive.record_alert(record.to_dict())
+    
+    logging.info(f"Alert added: {alert_type} from {source}")
 
 
 def get_alerts(limit: int = 50) -> List[dict]:
@@ -167,222 +341,943 @@ def get_alerts(limit: int = 50) -> List[dict]:
         List of alert dictionaries in reverse chronological order
     """
     with ALERT_HISTORY_LOCK:
-        return list(reversed(ALERT_HISTORY[-limit:]))
+        return [record.to_dict() for record in islice(reversed(ALERT_HISTORY), limit)]
+
+
+def _bisect_records(records, key, value) -> int:
+    """Index of the first record whose key(record) is greater than value (records sorted by key)"""
+    lo, hi = 0, len(records)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if key(records[mid]) <= value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def query_alerts(alert_type: str = None, source: str = None, since: str = None,
+                 after: int = None, cursor: int = None, limit: int = 50) -> dict:
+    """
+    Query the alert history through the type / source indexes (thread-safe)
+    
+    Args:
+        alert_type: Only alerts of this type
+        source: Only alerts from this source
+        since: Only alerts with a timestamp after this ISO timestamp
+        after: Only alerts with a sequence number above this one (what a
+            poller passes to fetch just the alerts it has not seen yet)
+        cursor: Only alerts with a sequence number below this one (the
+            next_cursor of a previous page, for paging back in time)
+        limit: Maximum number of alerts to return (capped at MAX_ALERT_QUERY_LIMIT)
+        
+    Returns:
+        Dictionary with 'alerts' (newest first), 'next_cursor' (None when
+        there are no older matches) and 'latest_seq' (newest alert overall)
+    """
+    limit = max(0, min(limit, MAX_ALERT_QUERY_LIMIT))
+    with ALERT_HISTORY_LOCK:
+        # Start from the smallest index that covers the filters
+        candidates = [ALERT_INDEX_BY_TYPE.get(alert_type, ()) if alert_type else None,
+                      ALERT_INDEX_BY_SOURCE.get(source, ()) if source else None]
+        candidates = [records for records in candidates if records is not None]
+        records = min(candidates, key=len) if candidates else ALERT_HISTORY
+        
+        lo, hi = 0, len(records)
+        if after is not None:
+            lo = _bisect_records(records, lambda r: r.seq, after)
+        if cursor is not None:
+            hi = _bisect_records(records, lambda r: r.seq, cursor - 1)
+        
+        def matches_filters(record):
+            return ((not alert_type or record.type == alert_type)
+                    and (not source or record.source == source)
+                    and (not since or record.timestamp > since))
+        
+        matches = []
+        index = hi
+        while index > lo and len(matches) < limit:
+            index -= 1
+            record = records[index]
+            if matches_filters(record):
+                matches.append(record.to_dict())
+        has_more = any(matches_filters(records[i]) for i in range(lo, index)) if matches else False
+        return {
+            'alerts': matches,
+            'next_cursor': matches[-1]['seq'] if has_more else None,
+            'latest_seq': ALERT_SEQ
+        }
+
+
+def alert_identity(alert: dict) -> str:
+    """
+    Stable identity of an upstream alert for deduplication
+    
+    Args:
+        alert: Alert dictionary as returned by the upstream
+        
+    Returns:
+        The alert's own id when it has one, otherwise a hash of its content
+    """
+    for key in ('id', 'alert_id', 'seq'):
+        if alert.get(key) is not None:
+            return f"{key}:{alert[key]}"
+    canonical = json.dumps(alert, sort_keys=True, separators=(',', ':'), default=str)
+    return 'sha1:' + hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _ingestion_state_locked(source: str) -> dict:
+    return INGESTION_STATE.setdefault(source, {
+        'seen': OrderedDict(),
+        'cursor': None,
+        'fetched': 0,
+        'new': 0,
+        'times': deque()
+    })
+
+
+def get_alert_cursor(source: str) -> Optional[str]:
+    """Newest alert timestamp ingested from a source, or None (thread-safe)"""
+    with INGESTION_LOCK:
+        return _ingestion_state_locked(source)['cursor']
+
+
+def filter_new_alerts(source: str, alerts: List[dict]) -> List[dict]:
+    """
+    Keep only alerts not ingested before and advance the source's cursor (thread-safe)
+    
+    Args:
+        source: Source system the alerts came from
+        alerts: Alerts returned by the upstream in this poll
+        
+    Returns:
+        The alerts that are new, in upstream order
+    """
+    now = time.time()
+    new_alerts = []
+    with INGESTION_LOCK:
+        state = _ingestion_state_locked(source)
+        seen = state['seen']
+        for alert in alerts:
+            if not isinstance(alert, dict):
+                continue
+            identity = alert_identity(alert)
+            if identity in seen:
+                continue
+            seen[identity] = True
+            if len(seen) > ALERT_SEEN_MAX:
+                seen.popitem(last=False)
+            new_alerts.append(alert)
+            timestamp = alert.get('timestamp')
+            if isinstance(timestamp, str) and (state['cursor'] is None or timestamp > state['cursor']):
+                state['cursor'] = timestamp
+        state['fetched'] += len(alerts)
+        state['new'] += len(new_alerts)
+        state['times'].extend([now] * len(new_alerts))
+        while state['times'] and now - state['times'][0] > ALERT_RATE_WINDOW:
+            state['times'].popleft()
+    return new_alerts
+
+
+def get_ingestion_stats() -> dict:
+    """
+    Alert ingestion counters per source (thread-safe)
+    
+    Returns:
+        Dictionary of source -> fetched/new/duplicate counts, cursor and the
+        rate of new alerts per minute over the last ALERT_RATE_WINDOW seconds
+    """
+    now = time.time()
+    with INGESTION_LOCK:
+        stats = {}
+        for source, state in INGESTION_STATE.items():
+            while state['times'] and now - state['times'][0] > ALERT_RATE_WINDOW:
+                state['times'].popleft()
+            stats[source] = {
+                'fetched': state['fetched'],
+                'new': state['new'],
+                'duplicates_skipped': state['fetched'] - state['new'],
+                'cursor': state['cursor'],
+                'new_per_minute': round(len(state['times']) / (ALERT_RATE_WINDOW / 60), 2)
+            }
+        return stats
+
+
+def update_status_snapshot(service: str, source: str, data: dict) -> List[str]:
+    """
+    Store the latest status of an upstream and alert on watched-field changes (thread-safe)
+    
+    Args:
+        service: Upstream name (key in UPSTREAMS)
+        source: Source name used for alerts (e.g., 'overseer-bot-ai')
+        data: Status payload returned by the upstream
+        
+    Returns:
+        Names of the watched fields that changed (all present ones on first sight)
+    """
+    now = datetime.now().isoformat()
+    watched = {field: data.get(field) for field in STATUS_WATCH_FIELDS}
+    with STATUS_STORE_LOCK:
+        record = STATUS_STORE.get(service)
+        if record is None:
+            previous = {}
+            changed = [field for field, value in watched.items() if value is not None]
+            record = STATUS_STORE[service] = {'polls': 0, 'changes': 0, 'changed_at': now}
+        else:
+            previous = record['watched']
+            changed = [field for field, value in watched.items() if previous.get(field) != value]
+        record.update(snapshot=data, watched=watched, updated_at=now)
+        record['polls'] += 1
+        if changed:
+            record['changes'] += 1
+            record['changed_at'] = now
+    
+    if changed:
+        boost_polling(service)
+        details = ', '.join(
+            f"{field}: {previous[field]} → {watched[field]}" if field in previous else f"{field}: {watched[field]}"
+            for field in changed
+        )
+        add_alert(
+            'status',
+            source,
+            {'changed': {field: watched[field] for field in changed}, 'previous': {field: previous.get(field) for field in changed}},
+            f"Status update: {details}"
+        )
+    return changed
+
 
+def get_upstream_status() -> dict:
+    """Latest status snapshot per upstream with change bookkeeping (thread-safe)"""
+    with STATUS_STORE_LOCK:
+        return {
+            service: {
+                'snapshot': record['snapshot'],
+                'updated_at': record['updated_at'],
+                'changed_at': record['changed_at'],
+                'polls': record['polls'],
+                'changes': record['changes']
+            }
+            for service, record in STATUS_STORE.items()
+        }
 
-def update_health_status(service: str, status: str, error: str = None):
+
+def update_health_status(service: str, status: str, error: str = None, endpoint: str = None):
     """
     Update health status for a service (thread-safe)
     
+    Failures are counted per endpoint and consecutive_failures (which drives
+    the polling backoff) is the longest streak, so an upstream whose status
+    and alerts endpoints both fail backs off one step per poll cycle, not two.
+    
     Args:
-        service: Service name ('overseer_bot_ai' or 'token_scalper')
+        service: Upstream name (key in UPSTREAMS)
         status: Status string ('healthy', 'unhealthy', 'unknown')
         error: Optional error message
+        endpoint: Endpoint the result is for; None for the whole upstream
+            (a healthy result then clears every endpoint's streak)
     """
     with HEALTH_STATUS_LOCK:
-        HEALTH_STATUS[service]['status'] = status
-        HEALTH_STATUS[service]['last_check'] = datetime.now().isoformat()
+        record = HEALTH_STATUS[service]
+        streaks = record['failure_streaks']
+        record['status'] = status
+        record['last_check'] = datetime.now().isoformat()
         if status == 'healthy':
-            HEALTH_STATUS[service]['last_success'] = datetime.now().isoformat()
-            HEALTH_STATUS[service]['error'] = None
+            record['last_success'] = datetime.now().isoformat()
+            record['error'] = None
+            if endpoint is None:
+                streaks.clear()
+            else:
+                streaks.pop(endpoint, None)
         else:
-            HEALTH_STATUS[service]['error'] = error
+            record['error'] = error
+            if status == 'unhealthy':
+                streaks[endpoint or 'upstream'] = streaks.get(endpoint or 'upstream', 0) + 1
+        record['consecutive_failures'] = max(streaks.values(), default=0)
+
+
+def boost_polling(service: str):
+    """Poll a service at POLL_BOOST_INTERVAL for the next POLL_BOOST_DURATION seconds"""
+    with HEALTH_STATUS_LOCK:
+        POLL_BOOST_UNTIL[service] = time.time() + POLL_BOOST_DURATION
+
+
+def _effective_interval_locked(service: str) -> float:
+    base = UPSTREAMS[service]['interval'] if service in UPSTREAMS else POLL_INTERVAL
+    failures = HEALTH_STATUS[service]['consecutive_failures']
+    if failures:
+        interval = base * 2 ** min(failures, 16)
+    elif POLL_BOOST_UNTIL.get(service, 0) > time.time():
+        interval = min(POLL_BOOST_INTERVAL, base)
+    else:
+        interval = base
+    return max(POLL_MIN_INTERVAL, min(interval, POLL_MAX_INTERVAL))
+
+
+def get_effective_interval(service: str, jitter: bool = False) -> float:
+    """
+    Current polling interval for a service (thread-safe)
+    
+    Args:
+        service: Upstream name (key in UPSTREAMS)
+        jitter: Randomize a backed-off interval by +/- POLL_BACKOFF_JITTER so
+            retries against a recovering upstream do not line up
+            
+    Returns:
+        Interval in seconds, within [POLL_MIN_INTERVAL, POLL_MAX_INTERVAL]
+    """
+    with HEALTH_STATUS_LOCK:
+        interval = _effective_interval_locked(service)
+        backing_off = HEALTH_STATUS[service]['consecutive_failures'] > 0
+    if jitter and backing_off:
+        interval *= random.uniform(1 - POLL_BACKOFF_JITTER, 1 + POLL_BACKOFF_JITTER)
+        interval = max(POLL_MIN_INTERVAL, min(interval, POLL_MAX_INTERVAL))
+    return interval
+
+
+def _endpoint_stats_locked(service: str, endpoint: str) -> dict:
+    return HEALTH_STATUS[service]['endpoints'].setdefault(endpoint, {
+        'cycles': 0,
+        'skipped_overlaps': 0,
+        'skipped_push': 0,
+        'last_duration_ms': None,
+        'max_duration_ms': 0,
+        'last_run': None,
+        'responses': 0,
+        'not_modified': 0,
+        'not_modified_ratio': 0.0,
+        'bytes_received': 0,
+        'bytes_saved': 0
+    })
+
+
+def record_response(service: str, endpoint: str, not_modified: bool, body_bytes: int, saved_bytes: int = 0):
+    """
+    Record the outcome of a (conditional) upstream GET (thread-safe)
+    
+    Args:
+        service: Upstream name (key in UPSTREAMS)
+        endpoint: Endpoint name within the service
+        not_modified: True for a 304 response
+        body_bytes: Size of the response body received
+        saved_bytes: Size of the full body a 304 avoided downloading
+    """
+    with HEALTH_STATUS_LOCK:
+        stats = _endpoint_stats_locked(service, endpoint)
+        stats['responses'] += 1
+        stats['not_modified'] += int(not_modified)
+        stats['not_modified_ratio'] = round(stats['not_modified'] / stats['responses'], 3)
+        stats['bytes_received'] += body_bytes
+        stats['bytes_saved'] += saved_bytes
+
+
+def conditional_get(service: str, endpoint: str, url: str, **kwargs):
+    """
+    GET an upstream endpoint with If-None-Match / If-Modified-Since
+    
+    Args:
+        service: Upstream name (key in UPSTREAMS)
+        endpoint: Endpoint name within the service (validators are kept per
+            endpoint, for the last full URL requested)
+        url: Request URL
+        **kwargs: Passed through to http_client.get (headers are copied, not modified)
+        
+    Returns:
+        The requests.Response for a changed (2xx) body, or None on 304 Not Modified
+        
+    Raises:
+        requests.exceptions.RequestException: On connection errors or HTTP errors
+    """
+    key = (service, endpoint)
+    full_url = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+    headers = dict(kwargs.pop('headers', None) or {})
+    with CONDITIONAL_VALIDATORS_LOCK:
+        validators = CONDITIONAL_VALIDATORS.get(key, {})
+    if validators.get('url') != full_url:
+        validators = {}
+    if validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    
+    response = http_client.get(url, headers=headers, **kwargs)
+    if response.status_code == 304:
+        record_response(service, endpoint, True, len(response.content), validators.get('body_bytes', 0))
+        return None
+    response.raise_for_status()
+    
+    record_response(service, endpoint, False, len(response.content))
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    with CONDITIONAL_VALIDATORS_LOCK:
+        if etag or last_modified:
+            CONDITIONAL_VALIDATORS[key] = {
+                'url': full_url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'body_bytes': len(response.content)
+            }
+        else:
+            CONDITIONAL_VALIDATORS.pop(key, None)
+    return response
+
+
+def record_poll_cycle(service: str, endpoint: str, duration_ms: float, overlapped: bool = False,
+                      paused: bool = False):
+    """
+    Record one polling cycle of an upstream endpoint (thread-safe)
+    
+    Args:
+        service: Upstream name (key in UPSTREAMS)
+        endpoint: Endpoint name within the service (e.g., 'status', 'alerts')
+        duration_ms: How long the fetch took, in milliseconds
+        overlapped: True if the cycle was skipped because the previous one
+            was still running
+        paused: True if the cycle was skipped because the upstream is pushing
+    """
+    with HEALTH_STATUS_LOCK:
+        stats = _endpoint_stats_locked(service, endpoint)
+        if paused:
+            stats['skipped_push'] += 1
+            return
+        if overlapped:
+            stats['skipped_overlaps'] += 1
+            return
+        stats['cycles'] += 1
+        stats['last_duration_ms'] = round(duration_ms, 1)
+        stats['max_duration_ms'] = round(max(stats['max_duration_ms'], duration_ms), 1)
+        stats['last_run'] = datetime.now().isoformat()
+
+
+def _push_active_locked(service: str, endpoint: str) -> bool:
+    last_seen = PUSH_LAST_SEEN.get((service, endpoint))
+    return last_seen is not None and time.time() - last_seen < PUSH_STALE_AFTER
+
+
+def push_active(service: str, endpoint: str) -> bool:
+    """True while pushes of an endpoint's data are recent enough to pause polling it (thread-safe)"""
+    with HEALTH_STATUS_LOCK:
+        return _push_active_locked(service, endpoint)
 
 
 def get_health_status() -> dict:
     """Get current health status for all services (thread-safe)"""
     with HEALTH_STATUS_LOCK:
-        return {k: v.copy() for k, v in HEALTH_STATUS.items()}
+        return {
+            k: dict(
+                v,
+                label=UPSTREAMS[k]['label'] if k in UPSTREAMS else k,
+                endpoints={name: stats.copy() for name, stats in v['endpoints'].items()},
+                push=v['push'].copy(),
+                failure_streaks=dict(v['failure_streaks']),
+                polling_paused=sorted(
+                    endpoint for (service, endpoint) in PUSH_LAST_SEEN
+                    if service == k and _push_active_locked(k, endpoint)
+                ),
+                effective_interval=_effective_interval_locked(k),
+                boosted=POLL_BOOST_UNTIL.get(k, 0) > time.time()
+            )
+            for k, v in HEALTH_STATUS.items()
+        }
+
+
+def _new_health_record() -> dict:
+    return {
+        'status': 'unknown',
+        'last_check': None,
+        'last_success': None,
+        'error': None,
+        'consecutive_failures': 0,
+        'failure_streaks': {},  # endpoint -> consecutive failures
+        'endpoints': {},
+        'push': {'accepted': 0, 'rejected': 0, 'alerts': 0, 'last_push': None, 'last_latency_ms': None}
+    }
 
 
-def fetch_overseer_bot_ai_status() -> Optional[dict]:
+def normalize_upstream(entry: dict) -> dict:
     """
-    Fetch status from overseer-bot-ai /api/status endpoint
+    Validate one upstream definition and fill in defaults
     
+    Args:
+        entry: Upstream definition from the registry, e.g.
+            {"name": "scalper_eu", "url": "https://...", "api_key_env": "SCALPER_EU_KEY",
+             "endpoints": {"status": "/api/status", "alerts": "/api/alerts"},
+             "interval": 30, "alerts": {"type_field": "kind", "type_map": {"rug": "rugpull"},
+                                        "fields": {"rugpull": ["token_address", "severity"]}}}
+        
     Returns:
-        Status data dictionary or None if failed
+        Normalized upstream dictionary
+        
+    Raises:
+        ValueError: If the definition is not usable
     """
-    if not OVERSEER_BOT_AI_URL:
-        return None
+    if not isinstance(entry, dict):
+        raise ValueError("upstream definition must be an object")
+    name = str(entry.get('name') or '').strip()
+    if not name or not name.replace('_', '').isalnum():
+        raise ValueError(f"invalid upstream name {name!r} (letters, digits and _ only)")
     
-    # Validate URL format
-    if not is_valid_url(OVERSEER_BOT_AI_URL):
-        error_msg = format_invalid_url_error(OVERSEER_BOT_AI_URL)
-        if should_log_error('overseer_bot_ai', 'invalid_url'):
-            logging.error(f"Invalid OVERSEER_BOT_AI_URL: {error_msg}")
-        update_health_status('overseer_bot_ai', 'unhealthy', error_msg)
-        return None
+    endpoints = entry.get('endpoints', {'status': '/api/status'})
+    if not isinstance(endpoints, dict) or not set(endpoints) <= {'status', 'alerts'}:
+        raise ValueError(f"{name}: endpoints must map 'status' and/or 'alerts' to paths")
+    
+    mapping = entry.get('alerts') or {}
+    if not isinstance(mapping, dict):
+        raise ValueError(f"{name}: alerts must be an object")
+    if not all(isinstance(mapping.get(option, ''), str) for option in
+               ('items_field', 'type_field', 'message_field', 'default_type')):
+        raise ValueError(f"{name}: alerts items_field, type_field, message_field and default_type must be strings")
+    type_map = mapping.get('type_map') or {}
+    if not isinstance(type_map, dict) or not all(
+        isinstance(key, str) and isinstance(value, str) for key, value in type_map.items()
+    ):
+        raise ValueError(f"{name}: alerts.type_map must map upstream types to type names")
+    fields = mapping.get('fields') or {}
+    if not isinstance(fields, dict) or not all(
+        isinstance(field_list, list) and all(isinstance(field, str) for field in field_list)
+        for field_list in fields.values()
+    ):
+        raise ValueError(f"{name}: alerts.fields must map alert types to lists of field names")
+    
+    interval = float(entry.get('interval', POLL_INTERVAL))
+    if interval <= 0:
+        raise ValueError(f"{name}: interval must be positive")
+    
+    # Secrets may be referenced by environment variable instead of inlined
+    api_key = entry.get('api_key') or os.getenv(entry.get('api_key_env', ''), '')
+    password = entry.get('password') or os.getenv(entry.get('password_env', ''), '')
+    push_secret = entry.get('push_secret') or os.getenv(entry.get('push_secret_env', ''), '')
+    
+    return {
+        'name': name,
+        'label': entry.get('label') or name.replace('_', '-').upper(),
+        'source': entry.get('source') or name.replace('_', '-'),
+        'url': str(entry.get('url') or '').strip(),
+        'api_key': api_key,
+        'username': entry.get('username', ''),
+        'password': password,
+        'push_secret': push_secret,
+        'endpoints': {endpoint: '/' + str(path).lstrip('/') for endpoint, path in endpoints.items()},
+        'interval': interval,
+        'alerts': {
+            'items_field': mapping.get('items_field', 'alerts'),
+            'type_field': mapping.get('type_field', 'type'),
+            'message_field': mapping.get('message_field', 'message'),
+            'default_type': mapping.get('default_type', 'unknown'),
+            'type_map': dict(type_map),
+            'fields': {str(alert_type): list(field_list) for alert_type, field_list in fields.items()}
+        }
+    }
+
+
+def load_upstreams() -> Dict[str, dict]:
+    """
+    Build the upstream registry
+    
+    Starts from the two upstreams defined by the legacy environment variables
+    and adds (or replaces, by name) the entries from UPSTREAMS_JSON, or from
+    the JSON file at UPSTREAMS_FILE. Invalid entries are logged and skipped.
+    
+    Returns:
+        Ordered dictionary of upstream name -> normalized definition
+    """
+    upstreams = OrderedDict()
+    for entry in (
+        {'name': 'overseer_bot_ai', 'label': 'OVERSEER-BOT-AI', 'source': 'overseer-bot-ai',
+         'url': OVERSEER_BOT_AI_URL, 'api_key': OVERSEER_BOT_AI_API_KEY,
+         'username': OVERSEER_BOT_AI_USERNAME, 'password': OVERSEER_BOT_AI_PASSWORD,
+         'push_secret': OVERSEER_BOT_AI_PUSH_SECRET,
+         'endpoints': {'status': '/api/status', 'alerts': '/api/alerts'}},
+        {'name': 'token_scalper', 'label': 'TOKEN-SCALPER', 'source': 'token-scalper',
+         'url': TOKEN_SCALPER_URL, 'api_key': TOKEN_SCALPER_API_KEY,
+         'push_secret': TOKEN_SCALPER_PUSH_SECRET,
+         'endpoints': {'status': '/api/status'}}
+    ):
+        upstreams[entry['name']] = normalize_upstream(entry)
+    
+    raw = UPSTREAMS_JSON
+    if not raw and UPSTREAMS_FILE:
+        try:
+            with open(UPSTREAMS_FILE, 'r') as f:
+                raw = f.read()
+        except OSError as e:
+            logging.error(f"Could not read UPSTREAMS_FILE {UPSTREAMS_FILE}: {e}")
+    if not raw:
+        return upstreams
     
     try:
-        url = f"{OVERSEER_BOT_AI_URL.rstrip('/')}/api/status"
-        headers = {}
-        auth = None
-        if OVERSEER_BOT_AI_API_KEY:
-            headers['Authorization'] = f"Bearer {OVERSEER_BOT_AI_API_KEY}"
-        elif OVERSEER_BOT_AI_USERNAME and OVERSEER_BOT_AI_PASSWORD:
-            auth = (OVERSEER_BOT_AI_USERNAME, OVERSEER_BOT_AI_PASSWORD)
+        entries = json.loads(raw)
+    except json.JSONDecodeError as e:
+        logging.error(f"Upstream registry is not valid JSON: {e}")
+        return upstreams
+    if isinstance(entries, dict):
+        entries = entries.get('upstreams', [])
+    for entry in entries if isinstance(entries, list) else []:
+        try:
+            upstream = normalize_upstream(entry)
+        except (ValueError, TypeError) as e:
+            logging.error(f"Skipping upstream definition: {e}")
+            continue
+        upstreams[upstream['name']] = upstream
+    return upstreams
+
+
+def upstream_request_kwargs(upstream: dict) -> dict:
+    """Headers, auth and timeout for a request to an upstream"""
+    headers = {}
+    auth = None
+    if upstream['api_key']:
+        headers['Authorization'] = f"Bearer {upstream['api_key']}"
+    elif upstream['username'] and upstream['password']:
+        auth = (upstream['username'], upstream['password'])
+    return {'headers': headers, 'auth': auth, 'timeout': REQUEST_TIMEOUT}
+
+
+def _check_upstream_url(upstream: dict, endpoint: str) -> bool:
+    """True if the upstream has a usable URL; records why not otherwise"""
+    if not upstream['url']:
+        return False
+    if not is_valid_url(upstream['url']):
+        error_msg = format_invalid_url_error(upstream['url'])
+        if should_log_error(upstream['name'], 'invalid_url'):
+            logging.error(f"Invalid URL for upstream {upstream['name']}: {error_msg}")
+        update_health_status(upstream['name'], 'unhealthy', error_msg, endpoint)
+        return False
+    return True
+
+
+def fetch_upstream_status(name: str) -> Optional[dict]:
+    """
+    Fetch status from an upstream's status endpoint
+    
+    Args:
+        name: Upstream name (key in UPSTREAMS)
         
-        response = requests.get(url, headers=headers, auth=auth, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+    Returns:
+        Status data dictionary, or None if failed or unchanged (304)
+    """
+    upstream = UPSTREAMS[name]
+    if not _check_upstream_url(upstream, 'status'):
+        return None
+    
+    try:
+        url = upstream['url'].rstrip('/') + upstream['endpoints']['status']
+        response = conditional_get(name, 'status', url, **upstream_request_kwargs(upstream))
+        update_health_status(name, 'healthy', endpoint='status')
+        reset_error_count(name, 'fetch_status')
+        if response is None:
+            return None  # 304: unchanged since the last poll
         
         data = response.json()
-        update_health_status('overseer_bot_ai', 'healthy')
-        reset_error_count('overseer_bot_ai', 'fetch_status')
         
-        # Add status as an alert
-        add_alert(
-            'status',
-            'overseer-bot-ai',
-            data,
-            f"Status update: {data.get('status', 'unknown')}"
-        )
+        # Keep the snapshot; only watched-field changes become alerts
+        if isinstance(data, dict):
+            update_status_snapshot(name, upstream['source'], data)
         
         return data
-    except requests.exceptions.RequestException as e:
-        if should_log_error('overseer_bot_ai', 'fetch_status'):
-            logging.error(f"Failed to fetch overseer-bot-ai status: {e}")
-        update_health_status('overseer_bot_ai', 'unhealthy', str(e))
+    except (requests.exceptions.RequestException, ValueError) as e:
+        if should_log_error(name, 'fetch_status'):
+            logging.error(f"Failed to fetch {upstream['source']} status: {e}")
+        update_health_status(name, 'unhealthy', str(e), 'status')
         return None
 
 
-def fetch_overseer_bot_ai_alerts() -> Optional[List[dict]]:
+def map_upstream_alert(upstream: dict, alert: dict) -> tuple:
     """
-    Fetch alerts from overseer-bot-ai /api/alerts endpoint
+    Apply an upstream's alert mapping
     
+    Args:
+        upstream: Normalized upstream definition
+        alert: Alert dictionary as returned by the upstream
+        
     Returns:
-        List of alert dictionaries or None if failed
+        Tuple of (alert type, message)
     """
-    if not OVERSEER_BOT_AI_URL:
-        return None
+    mapping = upstream['alerts']
+    upstream_type = alert.get(mapping['type_field'])
+    # Only scalar types can be mapped; lists, objects and empty values fall
+    # back to the default
+    if isinstance(upstream_type, (str, int, float)) and str(upstream_type):
+        upstream_type = str(upstream_type)[:ALERT_FIELD_MAX_CHARS]
+    else:
+        upstream_type = mapping['default_type']
+    alert_type = mapping['type_map'].get(upstream_type, upstream_type)
+    return alert_type, alert.get(mapping['message_field'], f"{alert_type} alert")
+
+
+def fetch_upstream_alerts(name: str) -> Optional[List[dict]]:
+    """
+    Fetch new alerts from an upstream's alerts endpoint
+    
+    Sends the newest ingested timestamp as a cursor and skips alerts that
+    were already ingested, so each upstream alert is stored once.
     
-    # Validate URL format
-    if not is_valid_url(OVERSEER_BOT_AI_URL):
-        error_msg = format_invalid_url_error(OVERSEER_BOT_AI_URL)
-        if should_log_error('overseer_bot_ai', 'invalid_url'):
-            logging.error(f"Invalid OVERSEER_BOT_AI_URL: {error_msg}")
-        update_health_status('overseer_bot_ai', 'unhealthy', error_msg)
+    Args:
+        name: Upstream name (key in UPSTREAMS)
+        
+    Returns:
+        List of newly ingested alert dictionaries or None if failed
+    """
+    upstream = UPSTREAMS[name]
+    if not _check_upstream_url(upstream, 'alerts'):
         return None
     
     try:
-        url = f"{OVERSEER_BOT_AI_URL.rstrip('/')}/api/alerts"
-        headers = {}
-        auth = None
-        if OVERSEER_BOT_AI_API_KEY:
-            headers['Authorization'] = f"Bearer {OVERSEER_BOT_AI_API_KEY}"
-        elif OVERSEER_BOT_AI_USERNAME and OVERSEER_BOT_AI_PASSWORD:
-            auth = (OVERSEER_BOT_AI_USERNAME, OVERSEER_BOT_AI_PASSWORD)
+        url = upstream['url'].rstrip('/') + upstream['endpoints']['alerts']
         
-        response = requests.get(url, headers=headers, auth=auth, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
+        # Ask only for alerts newer than the last one we ingested
+        params = {}
+        cursor = get_alert_cursor(upstream['source'])
+        if cursor:
+            params[ALERTS_SINCE_PARAM] = cursor
+        
+        response = conditional_get(name, 'alerts', url, params=params, **upstream_request_kwargs(upstream))
+        update_health_status(name, 'healthy', endpoint='alerts')
+        reset_error_count(name, 'fetch_alerts')
+        if response is None:
+            return []  # 304: no new alerts
         
         alerts = response.json()
-        update_health_status('overseer_bot_ai', 'healthy')
-        reset_error_count('overseer_bot_ai', 'fetch_alerts')
-        
-        # Add each alert to our history
-        if isinstance(alerts, list):
-            for alert in alerts:
-                alert_type = alert.get('type', 'unknown')
-                add_alert(
-                    alert_type,
-                    'overseer-bot-ai',
-                    alert,
-                    alert.get('message', f"{alert_type} alert")
-                )
-        
-        return alerts
-    except requests.exceptions.RequestException as e:
-        if should_log_error('overseer_bot_ai', 'fetch_alerts'):
-            logging.error(f"Failed to fetch overseer-bot-ai alerts: {e}")
-        update_health_status('overseer_bot_ai', 'unhealthy', str(e))
+        
+        # Accept both a bare list and an {"alerts": [...]} envelope
+        if isinstance(alerts, dict):
+            alerts = alerts.get(upstream['alerts']['items_field'], [])
+        if not isinstance(alerts, list):
+            return None
+        
+        # Add only alerts we have not ingested before
+        new_alerts = filter_new_alerts(upstream['source'], alerts)
+        if new_alerts:
+            boost_polling(name)
+        for alert in new_alerts:
+            alert_type, message = map_upstream_alert(upstream, alert)
+            add_alert(alert_type, upstream['source'], alert, message, upstream['alerts']['fields'].get(alert_type))
+        
+        return new_alerts
+    except (requests.exceptions.RequestException, ValueError) as e:
+        if should_log_error(name, 'fetch_alerts'):
+            logging.error(f"Failed to fetch {upstream['source']} alerts: {e}")
+        update_health_status(name, 'unhealthy', str(e), 'alerts')
         return None
 
 
-def fetch_token_scalper_status() -> Optional[dict]:
+UPSTREAM_FETCHERS = {
+    'status': fetch_upstream_status,
+    'alerts': fetch_upstream_alerts
+}
+
+
+def sign_push(secret: str, timestamp: str, body: bytes) -> str:
     """
-    Fetch status from Token-scalper /api/status endpoint
+    Signature an upstream sends in PUSH_SIGNATURE_HEADER
     
+    Args:
+        secret: The upstream's push secret
+        timestamp: Unix timestamp sent in PUSH_TIMESTAMP_HEADER
+        body: Raw request body
+        
     Returns:
-        Status data dictionary or None if failed
+        "sha256=<hex HMAC-SHA256 of '<timestamp>.<body>'>"
     """
-    if not TOKEN_SCALPER_URL:
-        return None
+    digest = hmac.new(secret.encode('utf-8'), timestamp.encode('utf-8') + b'.' + body, hashlib.sha256)
+    return 'sha256=' + digest.hexdigest()
+
+
+def claim_push_signature(signature: str) -> bool:
+    """
+    Remember an accepted signature for the replay window (thread-safe)
     
-    # Validate URL format
-    if not is_valid_url(TOKEN_SCALPER_URL):
-        error_msg = format_invalid_url_error(TOKEN_SCALPER_URL)
-        if should_log_error('token_scalper', 'invalid_url'):
-            logging.error(f"Invalid TOKEN_SCALPER_URL: {error_msg}")
-        update_health_status('token_scalper', 'unhealthy', error_msg)
-        return None
+    Returns:
+        False if the signature was already used within PUSH_MAX_SKEW seconds
+    """
+    now = time.time()
+    with PUSH_SEEN_SIGNATURES_LOCK:
+        while PUSH_SEEN_SIGNATURES and next(iter(PUSH_SEEN_SIGNATURES.values())) < now - PUSH_MAX_SKEW:
+            PUSH_SEEN_SIGNATURES.popitem(last=False)
+        if signature in PUSH_SEEN_SIGNATURES:
+            return False
+        PUSH_SEEN_SIGNATURES[signature] = now
+        return True
+
+
+def _record_push_rejected(name: str):
+    with HEALTH_STATUS_LOCK:
+        HEALTH_STATUS[name]['push']['rejected'] += 1
+
+
+def ingest_push(name: str, body: bytes, signature: str, timestamp: str) -> tuple:
+    """
+    Verify and ingest one push delivery from an upstream
     
-    try:
-        url = f"{TOKEN_SCALPER_URL.rstrip('/')}/api/status"
-        headers = {}
-        if TOKEN_SCALPER_API_KEY:
-            headers['Authorization'] = f"Bearer {TOKEN_SCALPER_API_KEY}"
-        
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        
-        data = response.json()
-        update_health_status('token_scalper', 'healthy')
-        reset_error_count('token_scalper', 'fetch_status')
-        
-        # Add status as an alert
-        add_alert(
-            'status',
-            'token-scalper',
-            data,
-            f"Status update: {data.get('status', 'unknown')}"
-        )
+    The body is a list of alerts, or an object with the alerts under the
+    upstream's items_field and/or a "status" object. Only the endpoints a
+    push actually delivers (alerts, status) have their polling paused; an
+    empty list is a heartbeat for the alerts endpoint. Each signature is
+    accepted once, so captured pushes cannot be replayed.
+    
+    Args:
+        name: Upstream name (key in UPSTREAMS)
+        body: Raw request body
+        signature: Value of PUSH_SIGNATURE_HEADER
+        timestamp: Value of PUSH_TIMESTAMP_HEADER
         
-        return data
-    except requests.exceptions.RequestException as e:
-        if should_log_error('token_scalper', 'fetch_status'):
-            logging.error(f"Failed to fetch token-scalper status: {e}")
-        update_health_status('token_scalper', 'unhealthy', str(e))
-        return None
+    Returns:
+        Tuple of (response dictionary, HTTP status code)
+    """
+    upstream = UPSTREAMS.get(name)
+    if upstream is None or not upstream['push_secret']:
+        return {"ok": False, "error": "Unknown upstream"}, 404
+    
+    try:
+        signed_at = float(timestamp)
+    except (TypeError, ValueError):
+        signed_at = math.nan
+    skew = abs(time.time() - signed_at)
+    expected = sign_push(upstream['push_secret'], timestamp or '', body)
+    if not math.isfinite(skew) or skew > PUSH_MAX_SKEW or not hmac.compare_digest(expected, signature or ''):
+        _record_push_rejected(name)
+        if should_log_error(name, 'push_signature'):
+            logging.warning(f"Rejected push from {upstream['source']}: bad or expired signature")
+        return {"ok": False, "error": "Invalid signature"}, 401
+    if not claim_push_signature(expected):
+        _record_push_rejected(name)
+        logging.warning(f"Rejected replayed push from {upstream['source']}")
+        return {"ok": False, "error": "Replayed delivery"}, 409
+    
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        _record_push_rejected(name)
+        return {"ok": False, "error": "Body must be JSON"}, 400
+    status = None
+    delivered = ['alerts']
+    if isinstance(payload, dict):
+        status = payload.get('status')
+        delivered = [endpoint for endpoint, present in (
+            ('alerts', upstream['alerts']['items_field'] in payload),
+            ('status', isinstance(status, dict))
+        ) if present]
+        payload = payload.get(upstream['alerts']['items_field'], [])
+    if not isinstance(payload, list) or not delivered:
+        _record_push_rejected(name)
+        return {"ok": False, "error": "Expected a list of alerts and/or a status object"}, 400
+    
+    new_alerts = filter_new_alerts(upstream['source'], payload)
+    for alert in new_alerts:
+        alert_type, message = map_upstream_alert(upstream, alert)
+        add_alert(alert_type, upstream['source'], alert, message, upstream['alerts']['fields'].get(alert_type))
+    if isinstance(status, dict):
+        update_status_snapshot(name, upstream['source'], status)
+    
+    now = time.time()
+    update_health_status(name, 'healthy')
+    with HEALTH_STATUS_LOCK:
+        for endpoint in delivered:
+            PUSH_LAST_SEEN[(name, endpoint)] = now
+        push = HEALTH_STATUS[name]['push']
+        push['accepted'] += 1
+        push['alerts'] += len(new_alerts)
+        push['last_push'] = datetime.now().isoformat()
+        push['last_latency_ms'] = round(max(now - signed_at, 0) * 1000, 1)
+    return {"ok": True, "received": len(payload), "new": len(new_alerts)}, 200
+
+
+def build_poll_jobs() -> List[dict]:
+    """
+    List the endpoints of every configured upstream, each on its own schedule
+    
+    Returns:
+        Job dictionaries with service, endpoint and fetch function (intervals
+        come from get_effective_interval at scheduling time)
+    """
+    jobs = []
+    for name, upstream in UPSTREAMS.items():
+        if not upstream['url']:
+            continue
+        for endpoint in upstream['endpoints']:
+            jobs.append({
+                'service': name,
+                'endpoint': endpoint,
+                'fetch': functools.partial(UPSTREAM_FETCHERS[endpoint], name),
+                'running': threading.Event()
+            })
+    return jobs
+
+
+def run_poll_job(job: dict):
+    """Fetch one endpoint and record how long the cycle took (runs on the poll pool)"""
+    started = time.monotonic()
+    try:
+        job['fetch']()
+    except Exception as e:
+        logging.error(f"Error polling {job['service']} {job['endpoint']}: {e}")
+    finally:
+        record_poll_cycle(job['service'], job['endpoint'], (time.monotonic() - started) * 1000)
+        job['running'].clear()
 
 
 def poll_external_apis():
     """
-    Main polling loop - fetches data from external APIs periodically
+    Main polling loop - schedules each upstream endpoint at a fixed rate
     Runs in a background daemon thread
     
+    Every endpoint has its own schedule and is fetched on a bounded pool of
+    POLL_MAX_WORKERS threads, so a hung upstream waiting out REQUEST_TIMEOUT
+    neither delays the other endpoints nor stretches their intervals. The
+    interval itself adapts per service (see get_effective_interval). Start
+    times stay on a fixed grid; if an endpoint's previous fetch is still
+    running when its next slot comes up, that slot is skipped (and counted)
+    rather than piling up requests against a slow upstream. Slots of an
+    endpoint whose data the upstream is currently pushing (see push_active)
+    are skipped too.
+    
     Note: This is an infinite loop that runs as a daemon thread. The thread
     will be automatically terminated when the main application exits. No
     explicit shutdown handling is required since this is a daemon thread.
-    
-    For production use, consider implementing graceful shutdown if needed:
-    - Use a threading.Event() to signal shutdown
-    - Check the event in the loop: while not shutdown_event.is_set()
-    - Set the event from main thread on shutdown
     """
-    logging.info(f"Starting API polling (interval: {POLL_INTERVAL}s)")
+    jobs = build_poll_jobs()
+    if not jobs:
+        return
+    logging.info(f"Starting API polling ({len(UPSTREAMS)} upstreams, {len(jobs)} endpoints)")
+    
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(POLL_MAX_WORKERS, len(jobs))),
+        thread_name_prefix="poll"
+    )
+    now = time.monotonic()
+    for job in jobs:
+        job['next_run'] = now
     
     while True:
         try:
-            # Fetch from overseer-bot-ai
-            if OVERSEER_BOT_AI_URL:
-                fetch_overseer_bot_ai_status()
-                fetch_overseer_bot_ai_alerts()
-            
-            # Fetch from token-scalper
-            if TOKEN_SCALPER_URL:
-                fetch_token_scalper_status()
-            
+            now = time.monotonic()
+            for job in jobs:
+                if now < job['next_run']:
+                    continue
+                # Advance along the fixed-rate grid, skipping slots already missed
+                interval = get_effective_interval(job['service'], jitter=True)
+                missed = int((now - job['next_run']) // interval)
+                job['next_run'] += (missed + 1) * interval
+                if push_active(job['service'], job['endpoint']):
+                    record_poll_cycle(job['service'], job['endpoint'], 0, paused=True)
+                    continue
+                if job['running'].is_set():
+                    record_poll_cycle(job['service'], job['endpoint'], 0, overlapped=True)
+                    continue
+                job['running'].set()
+                executor.submit(run_poll_job, job)
         except Exception as e:
             logging.error(f"Error in polling loop: {e}")
         
-        # Sleep until next poll
-        time.sleep(POLL_INTERVAL)
+        # Sleep until the next endpoint is due
+        time.sleep(max(min(job['next_run'] for job in jobs) - time.monotonic(), 0.05))
 
 
 def start_polling():
     """Start the background polling thread"""
-    if not OVERSEER_BOT_AI_URL and not TOKEN_SCALPER_URL:
-        logging.warning("No external API URLs configured. Polling disabled.")
+    if not any(upstream['url'] for upstream in UPSTREAMS.values()):
+        if not any(upstream['push_secret'] for upstream in UPSTREAMS.values()):
+            logging.warning("No external API URLs configured. Polling disabled.")
         return
     
     polling_thread = threading.Thread(target=poll_external_apis, daemon=True)
@@ -390,17 +1285,14 @@ def start_polling():
     logging.info("API polling thread started")
 
 
-# Initialize health status on module load
-if not OVERSEER_BOT_AI_URL:
-    update_health_status('overseer_bot_ai', 'disabled', 'No URL configured')
-elif not is_valid_url(OVERSEER_BOT_AI_URL):
-    error_msg = format_invalid_url_error(OVERSEER_BOT_AI_URL)
-    update_health_status('overseer_bot_ai', 'unhealthy', error_msg)
-    logging.warning(f"OVERSEER_BOT_AI_URL is invalid: {error_msg}")
-
-if not TOKEN_SCALPER_URL:
-    update_health_status('token_scalper', 'disabled', 'No URL configured')
-elif not is_valid_url(TOKEN_SCALPER_URL):
-    error_msg = format_invalid_url_error(TOKEN_SCALPER_URL)
-    update_health_status('token_scalper', 'unhealthy', error_msg)
-    logging.warning(f"TOKEN_SCALPER_URL is invalid: {error_msg}")
+# Load the upstream registry and initialize health status on module load
+UPSTREAMS = load_upstreams()
+for _name, _upstream in UPSTREAMS.items():
+    HEALTH_STATUS[_name] = _new_health_record()
+    if not _upstream['url']:
+        if not _upstream['push_secret']:
+            update_health_status(_name, 'disabled', 'No URL configured')
+    elif not is_valid_url(_upstream['url']):
+        error_msg = format_invalid_url_error(_upstream['url'])
+        update_health_status(_name, 'unhealthy', error_msg)
+        logging.warning(f"URL for upstream {_name} is invalid: {error_msg}")
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark: compiled intent matcher vs the legacy keyword chain
+
+Classifies 10k synthetic mentions with both approaches, REPEAT times
+each, and reports the median time with its spread, the median speedup
+with its range across runs, and how often the two disagree (mostly
+substring misroutes such as "sol" in "solid" under the legacy chain).
+The gain is small and noisy, so compare medians rather than single runs.
+
+Run from the repository root:
+    python benchmarks/intent_classifier_bench.py
+"""
+import os
+import random
+import statistics
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Importing the bot must not create overseer_ai.log in the working directory
+os.environ['OVERSEER_LOG_FILE'] = ''
+
+from overseer_bot import classify_message  # noqa: E402
+
+MENTION_COUNT = 10000
+REPEAT = 21
+
+SAMPLE_MENTIONS = [
+    "what's the sol price today?",
+    "is 0x1234567890abcdef1234567890abcdef12345678 a honeypot",
+    "gm overseer, how do I start playing",
+    "this game is solid, something else entirely",
+    "any airdrop or giveaway coming?",
+    "btc to the moon, eth lagging",
+    "how do I earn caps in the wasteland",
+    "good night vault 77",
+    "the design of the ncr faction is great",
+    "explain the token economy please",
+    "rugpull incoming? verify the contract",
+    "love the mojave vibes, fallout forever",
+    "lol this is amazing",
+    "who made this bot? incredible art direction",
+    "following for the memes",
+    "@someone you have to see this one",
+]
+
+
+def legacy_classify(message):
+    """The original any(word in message) chain from generate_contextual_response."""
+    message_lower = message.lower()
+    if any(word in message_lower for word in ['price', 'btc', 'eth', 'sol', 'bitcoin', 'ethereum', 'solana', 'market']):
+        token_symbol = None
+        if 'sol' in message_lower or 'solana' in message_lower:
+            token_symbol = 'SOL/USDT'
+        elif 'btc' in message_lower or 'bitcoin' in message_lower:
+            token_symbol = 'BTC/USDT'
+        elif 'eth' in message_lower or 'ethereum' in message_lower:
+            token_symbol = 'ETH/USDT'
+        return 'price', token_symbol
+    if any(word in message_lower for word in ['safe', 'scam', 'rug', 'honeypot', 'check', 'verify']) or '0x' in message_lower:
+        return 'safety', None
+    if any(word in message_lower for word in ['airdrop', 'free', 'claim', 'giveaway']):
+        return 'airdrop', None
+    if any(word in message_lower for word in ['help', 'how', 'what is', 'explain']):
+        return 'help', None
+    if any(word in message_lower for word in ['caps', 'earn', 'money', 'token']):
+        return 'caps', None
+    if any(word in message_lower for word in ['game', 'play', 'start', 'join']):
+        return 'game', None
+    if any(word in message_lower for word in ['vault', '77', 'overseer']):
+        return 'vault', None
+    if any(word in message_lower for word in ['fallout', 'wasteland', 'mojave', 'ncr', 'legion']):
+        return 'fallout', None
+    if any(word in message_lower for word in ['gm', 'good morning', 'morning']):
+        return 'gm', None
+    if any(word in message_lower for word in ['gn', 'good night', 'night']):
+        return 'gn', None
+    return None, None
+
+
+def compiled_classify(message):
+    intent, token_symbol, _ = classify_message(message)
+    return intent, token_symbol
+
+
+def time_runs(mentions):
+    """Per-run wall times of both classifiers, interleaved so drift hits both alike."""
+    legacy_times, compiled_times = [], []
+    for _ in range(REPEAT):
+        legacy_times.append(timeit.timeit(lambda: [legacy_classify(m) for m in mentions], number=1))
+        compiled_times.append(timeit.timeit(lambda: [compiled_classify(m) for m in mentions], number=1))
+    return legacy_times, compiled_times
+
+
+def describe(times):
+    median = statistics.median(times)
+    spread = statistics.stdev(times) / median
+    return (f"median {median * 1000:.1f} ms ({median / MENTION_COUNT * 1e6:.2f} us/mention), "
+            f"stdev {spread:.1%}")
+
+
+def main():
+    random.seed(77)
+    mentions = [random.choice(SAMPLE_MENTIONS) for _ in range(MENTION_COUNT)]
+
+    legacy_times, compiled_times = time_runs(mentions)
+    ratios = sorted(legacy / compiled for legacy, compiled in zip(legacy_times, compiled_times))
+    legacy_results = [legacy_classify(m) for m in mentions]
+    compiled_results = [compiled_classify(m) for m in mentions]
+    disagreements = sum(1 for a, b in zip(legacy_results, compiled_results) if a != b)
+
+    print(f"Mentions classified: {MENTION_COUNT}, runs: {REPEAT}")
+    print(f"Legacy keyword chain: {describe(legacy_times)}")
+    print(f"Compiled matcher:     {describe(compiled_times)}")
+    print(f"Speedup: median {statistics.median(ratios):.2f}x "
+          f"(per-run range {ratios[0]:.2f}x - {ratios[-1]:.2f}x)")
+    print(f"Routing differences: {disagreements} ({disagreements / MENTION_COUNT:.1%})")
+    for mention in SAMPLE_MENTIONS:
+        legacy, compiled = legacy_classify(mention), compiled_classify(mention)
+        if legacy != compiled:
+            print(f"  {mention!r}: legacy={legacy} compiled={compiled}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Shared HTTP client for all outbound requests-based calls
+Keeps per-host keep-alive connection pools, a retry policy and default timeouts
+so repeated calls to the same host reuse their TCP/TLS connections
+"""
+import os
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Connection pool sizing (per host)
+HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', '10'))  # hosts kept pooled
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '10'))          # connections per host
+
+# Retry policy for transient failures. Only idempotent methods are retried;
+# 429s are left to the callers, which have their own backoff.
+HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', '2'))
+HTTP_RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
+HTTP_RETRY_STATUSES = (500, 502, 503, 504)
+
+# Default (connect, read) timeout in seconds when a call does not pass one
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_READ_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '5'))
+
+USER_AGENT = 'overseer-bot/1.0 (+https://www.atomicfizzcaps.xyz)'
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to every request"""
+
+    def __init__(self, *args, timeout=None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def build_session() -> requests.Session:
+    """
+    Create a Session with pooled, retrying, timeout-enforcing adapters
+
+    Returns:
+        A new requests.Session
+    """
+    retry = Retry(
+        total=HTTP_RETRIES,
+        connect=HTTP_RETRIES,
+        read=HTTP_RETRIES,
+        status=HTTP_RETRIES,
+        backoff_factor=HTTP_RETRY_BACKOFF,
+        status_forcelist=HTTP_RETRY_STATUSES,
+        allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+        timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide shared Session (created on first use, thread-safe)
+
+    Returns:
+        The shared requests.Session
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = build_session()
+                logging.info("Shared HTTP session initialized")
+    return _SESSION
+
+
+def get(url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+    """
+    GET through the shared session
+
+    Args:
+        url: Request URL
+        timeout: Optional timeout overriding the default (connect, read) pair
+        **kwargs: Passed through to requests.Session.get
+
+    Returns:
+        The requests.Response
+    """
+    return get_session().get(url, timeout=timeout, **kwargs)
+
+
+def post(url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+    """
+    POST through the shared session (never retried automatically)
+
+    Args:
+        url: Request URL
+        timeout: Optional timeout overriding the default (connect, read) pair
+        **kwargs: Passed through to requests.Session.post
+
+    Returns:
+        The requests.Response
+    """
+    return get_session().post(url, timeout=timeout, **kwargs)
@@ -11,10 +11,21 @@ from flask import Flask, request, jsonify
 from flask_httpauth import HTTPBasicAuth
 import ccxt
 import re
+import bisect
+import sqlite3
+import hashlib
+import itertools
+import string
+import queue
 import threading
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # Import API client for external integrations
+import alert_archive
 import api_client
+import http_client
 
 # Wallet integrations (optional imports)
 WALLET_ENABLED = False
@@ -34,10 +45,12 @@ except ImportError as e:
 # ------------------------------------------------------------
 # CONFIG & LOGGING
 # ------------------------------------------------------------
+# Set OVERSEER_LOG_FILE empty to log to the console only (e.g. benchmarks)
+OVERSEER_LOG_FILE = os.getenv('OVERSEER_LOG_FILE', 'overseer_ai.log')
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - VAULT-TEC OVERSEER LOG - %(levelname)s - %(message)s',
-    handlers=[logging.FileHandler("overseer_ai.log"), logging.StreamHandler()]
+    handlers=([logging.FileHandler(OVERSEER_LOG_FILE)] if OVERSEER_LOG_FILE else []) + [logging.StreamHandler()]
 )
 
 GAME_LINK = "https://www.atomicfizzcaps.xyz"
@@ -172,6 +185,7 @@ if WALLET_ENABLED and ENABLE_WALLET_UI:
 
 # Initialize Twitter clients only if credentials are provided
 client = None
+post_client = None
 api_v1 = None
 
 if all([CONSUMER_KEY, CONSUMER_SECRET, ACCESS_TOKEN, ACCESS_SECRET, BEARER_TOKEN]):
@@ -184,6 +198,17 @@ if all([CONSUMER_KEY, CONSUMER_SECRET, ACCESS_TOKEN, ACCESS_SECRET, BEARER_TOKEN
             bearer_token=BEARER_TOKEN,
             wait_on_rate_limit=True
         )
+        # Tweets are sent through their own client: write rate limits are
+        # handled by the post dispatcher, and sleeping inside tweepy would
+        # hold critical alerts behind a broadcast. Reads keep sleeping.
+        post_client = tweepy.Client(
+            consumer_key=CONSUMER_KEY,
+            consumer_secret=CONSUMER_SECRET,
+            access_token=ACCESS_TOKEN,
+            access_token_secret=ACCESS_SECRET,
+            bearer_token=BEARER_TOKEN,
+            wait_on_rate_limit=False
+        )
 
         auth_v1 = tweepy.OAuth1UserHandler(
             CONSUMER_KEY, CONSUMER_SECRET, ACCESS_TOKEN, ACCESS_SECRET
@@ -198,6 +223,514 @@ else:
     logging.warning("Twitter API credentials not provided. Twitter bot features will be disabled.")
     logging.warning("Set CONSUMER_KEY, CONSUMER_SECRET, ACCESS_TOKEN, ACCESS_SECRET, and BEARER_TOKEN environment variables to enable Twitter features.")
 
+# ------------------------------------------------------------
+# OUTBOUND POST PIPELINE - PRIORITY LANES
+# ------------------------------------------------------------
+# All tweets go through a single dispatcher thread so that, when the write
+# quota is tight, safety alerts are sent before lore broadcasts.
+# Lower number = higher priority.
+POST_PRIORITY_CRITICAL = 0   # Rug pull / safety alerts
+POST_PRIORITY_ALERT = 1      # Price, high-potential and airdrop alerts
+POST_PRIORITY_REPLY = 2      # Mention replies
+POST_PRIORITY_BROADCAST = 3  # Broadcasts, diagnostics, summaries, game events
+
+POST_PRIORITY_NAMES = {
+    POST_PRIORITY_CRITICAL: 'critical',
+    POST_PRIORITY_ALERT: 'alert',
+    POST_PRIORITY_REPLY: 'reply',
+    POST_PRIORITY_BROADCAST: 'broadcast'
+}
+
+# Seconds a post may wait in its lane before it is dropped (None = never drop)
+POST_MAX_WAIT = {
+    POST_PRIORITY_CRITICAL: None,
+    POST_PRIORITY_ALERT: 15 * 60,
+    POST_PRIORITY_REPLY: 60 * 60,
+    POST_PRIORITY_BROADCAST: 30 * 60
+}
+
+# Maximum queued posts per lane; the oldest post in a full lane is dropped
+POST_LANE_CAPACITY = {
+    POST_PRIORITY_CRITICAL: 50,
+    POST_PRIORITY_ALERT: 20,
+    POST_PRIORITY_REPLY: 50,
+    POST_PRIORITY_BROADCAST: 5
+}
+
+POST_RATE_LIMIT_FALLBACK_PAUSE = 15 * 60  # seconds, when Twitter sends no reset header
+
+
+class OutboundPost:
+    """A tweet waiting in a priority lane for the dispatcher."""
+
+    def __init__(self, text, priority, label, job=None, media_ids=None,
+                 in_reply_to_tweet_id=None, activity=None, on_sent=None):
+        self.text = text
+        self.priority = priority
+        self.label = label
+        self.job = job or POST_PRIORITY_NAMES[priority]  # write budget accounting
+        self.media_ids = media_ids
+        self.in_reply_to_tweet_id = in_reply_to_tweet_id
+        self.activity = activity  # (type, description) recorded once sent
+        self.on_sent = on_sent    # callback(post) run by the dispatcher once sent
+        self.created_at = time.time()
+        self.status = 'queued'    # queued -> sent | failed | dropped
+        self.tweet_id = None
+        self.error = None
+        self._done = threading.Event()
+
+    def is_expired(self, now):
+        max_wait = POST_MAX_WAIT.get(self.priority)
+        return max_wait is not None and now - self.created_at > max_wait
+
+    def finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self._done.set()
+
+    def wait(self, timeout=None):
+        """Block until the post is sent, failed or dropped. Returns True if sent."""
+        self._done.wait(timeout)
+        return self.status == 'sent'
+
+
+class PostQueue:
+    """
+    Priority lanes for outbound tweets (thread-safe)
+
+    The highest non-empty lane is always served first. A lane whose class
+    has no write budget left is deferred, and posts that outlive their
+    lane's POST_MAX_WAIT are dropped instead of being sent late. While
+    Twitter reports a rate limit every lane is paused so that the backlog
+    is re-ordered by priority before anything else goes out.
+    """
+
+    def __init__(self):
+        self._lanes = {priority: deque() for priority in POST_PRIORITY_NAMES}
+        self._cond = threading.Condition()
+        self._paused_until = 0.0
+        self._stats = {
+            name: {'queued': 0, 'sent': 0, 'failed': 0, 'dropped': 0}
+            for name in POST_PRIORITY_NAMES.values()
+        }
+
+    def put(self, post, front=False):
+        with self._cond:
+            lane = self._lanes[post.priority]
+            if len(lane) >= POST_LANE_CAPACITY[post.priority]:
+                self._drop_locked(lane.popleft(), "lane full")
+            if front:
+                lane.appendleft(post)
+            else:
+                lane.append(post)
+                self._stats[POST_PRIORITY_NAMES[post.priority]]['queued'] += 1
+            self._cond.notify()
+
+    def get(self):
+        """Block until a post is ready to send and return it."""
+        with self._cond:
+            while True:
+                now = time.time()
+                self._expire_locked(now)
+                if now >= self._paused_until:
+                    for priority in sorted(self._lanes):
+                        if self._lanes[priority] and WRITE_BUDGET.can_spend(priority):
+                            return self._lanes[priority].popleft()
+                    # Nothing sendable: wait for a new post, or for write quota
+                    # to free up if posts are being held back by the budget
+                    backlog = any(self._lanes.values())
+                    self._cond.wait(WRITE_BUDGET_RECHECK_INTERVAL if backlog else None)
+                else:
+                    self._cond.wait(self._paused_until - now)
+
+    def pause(self, until):
+        """Hold every lane until the given epoch time (rate limit reset)."""
+        with self._cond:
+            self._paused_until = max(self._paused_until, until)
+
+    def record(self, post, status):
+        with self._cond:
+            self._stats[POST_PRIORITY_NAMES[post.priority]][status] += 1
+
+    def get_stats(self):
+        with self._cond:
+            return {
+                'paused_until': datetime.fromtimestamp(self._paused_until).isoformat()
+                if self._paused_until > time.time() else None,
+                'lanes': {
+                    POST_PRIORITY_NAMES[priority]: dict(self._stats[POST_PRIORITY_NAMES[priority]], depth=len(lane))
+                    for priority, lane in self._lanes.items()
+                }
+            }
+
+    def _expire_locked(self, now):
+        for lane in self._lanes.values():
+            while lane and lane[0].is_expired(now):
+                self._drop_locked(lane.popleft(), "waited too long")
+
+    def _drop_locked(self, post, reason):
+        self._stats[POST_PRIORITY_NAMES[post.priority]]['dropped'] += 1
+        post.finish('dropped', reason)
+        logging.warning(f"Dropped queued {post.label} ({reason})")
+
+
+POST_QUEUE = PostQueue()
+_POST_DISPATCHER_STARTED = False
+_POST_DISPATCHER_LOCK = threading.Lock()
+
+
+def enqueue_post(text, priority, label, job=None, media_ids=None, in_reply_to_tweet_id=None,
+                 activity=None, on_sent=None):
+    """
+    Queue a tweet in its priority lane.
+
+    Returns the OutboundPost, or None if the Twitter client is unavailable.
+    """
+    if not client:
+        logging.debug(f"Skipping {label}: Twitter client not initialized")
+        return None
+    post = OutboundPost(
+        text, priority, label,
+        job=job,
+        media_ids=media_ids,
+        in_reply_to_tweet_id=in_reply_to_tweet_id,
+        activity=activity,
+        on_sent=on_sent
+    )
+    POST_QUEUE.put(post)
+    logging.debug(f"Queued {label} in {POST_PRIORITY_NAMES[priority]} lane")
+    return post
+
+
+def get_rate_limit_reset(exception):
+    """Extract the rate limit reset time (epoch seconds) from a 429 response."""
+    response = getattr(exception, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+    try:
+        return float(headers.get('x-rate-limit-reset'))
+    except (TypeError, ValueError):
+        return time.time() + POST_RATE_LIMIT_FALLBACK_PAUSE
+
+
+def make_post_unique(text):
+    """Append the current time so a repeat of a recent post is accepted."""
+    suffix = f" [{datetime.now().strftime('%H:%M:%S')}]"
+    return truncate_to_weight(text, TWITTER_CHAR_LIMIT - twitter_weighted_length(suffix)) + suffix
+
+
+def send_post(post):
+    """Send one queued post to Twitter (dispatcher thread only)."""
+    never_drop = post.priority in DEDUPE_NEVER_DROP
+    if RECENT_POSTS.is_duplicate(post.text, 'stamped' if never_drop else 'dropped'):
+        if never_drop:
+            # Critical alerts and replies must go out; stamp them instead
+            post.text = make_post_unique(post.text)
+            logging.info(f"Stamped {post.label} with the time: duplicate of a recent post")
+        else:
+            # Same text went out recently; Twitter would reject it anyway
+            logging.warning(f"Dropped {post.label}: duplicate of a recent post")
+            POST_QUEUE.record(post, 'dropped')
+            post.finish('dropped', "duplicate")
+            return
+    try:
+        response = post_client.create_tweet(
+            text=post.text,
+            media_ids=post.media_ids,
+            in_reply_to_tweet_id=post.in_reply_to_tweet_id
+        )
+    except tweepy.TooManyRequests as e:
+        # Put the post back and hold every lane until the limit resets;
+        # anything more important queued meanwhile goes out first.
+        reset_at = get_rate_limit_reset(e)
+        logging.warning(f"Twitter rate limit hit while sending {post.label}; pausing posts until {datetime.fromtimestamp(reset_at).isoformat()}")
+        POST_QUEUE.pause(reset_at)
+        POST_QUEUE.put(post, front=True)
+        return
+    except tweepy.TweepyException as e:
+        # Rejected writes (duplicates, forbidden) still count against the quota
+        WRITE_BUDGET.record(post.priority, post.job)
+        logging.error(f"Failed to post {post.label}: {e}")
+        add_activity("ERROR", f"{post.label} failed: {str(e)}")
+        POST_QUEUE.record(post, 'failed')
+        post.finish('failed', str(e))
+        return
+
+    WRITE_BUDGET.record(post.priority, post.job)
+    RECENT_POSTS.add(post.text)
+    data = getattr(response, 'data', None) or {}
+    post.tweet_id = data.get('id')
+    POST_QUEUE.record(post, 'sent')
+    post.finish('sent')
+    logging.info(f"Posted {post.label}")
+    if post.activity:
+        add_activity(*post.activity)
+    if post.on_sent:
+        try:
+            post.on_sent(post)
+        except Exception as e:
+            logging.error(f"Post-send hook failed for {post.label}: {e}")
+
+
+def post_dispatcher_loop():
+    """Serve the priority lanes forever (runs as a daemon thread)."""
+    while True:
+        post = POST_QUEUE.get()
+        try:
+            send_post(post)
+        except Exception as e:
+            logging.error(f"Error in post dispatcher: {e}")
+            post.finish('failed', str(e))
+
+
+def start_post_dispatcher():
+    """Start the background post dispatcher thread (idempotent)."""
+    global _POST_DISPATCHER_STARTED
+    with _POST_DISPATCHER_LOCK:
+        if _POST_DISPATCHER_STARTED:
+            return
+        threading.Thread(target=post_dispatcher_loop, daemon=True).start()
+        _POST_DISPATCHER_STARTED = True
+    logging.info("Post dispatcher thread started")
+
+# ------------------------------------------------------------
+# TWITTER WRITE BUDGET PLANNER
+# ------------------------------------------------------------
+# Account write limits (tweets, replies and retweets). Defaults match the
+# Basic API tier; adjust to your plan.
+TWITTER_WRITE_LIMIT_24H = int(os.getenv('TWITTER_WRITE_LIMIT_24H', '100'))
+TWITTER_WRITE_LIMIT_15M = int(os.getenv('TWITTER_WRITE_LIMIT_15M', '25'))
+WRITE_BUDGET_FILE = "write_budget.json"
+WRITE_BUDGET_RECHECK_INTERVAL = 60  # seconds between re-checks of a held-back lane
+
+WRITE_BUDGET_WINDOWS = {
+    '24h': (24 * 3600, TWITTER_WRITE_LIMIT_24H),
+    '15m': (15 * 60, TWITTER_WRITE_LIMIT_15M)
+}
+
+# Writes held back for each class. A class may only spend quota that is not
+# reserved for the classes above it, so broadcasts stop well before the cap
+# and the last writes of the day are always available for safety alerts.
+WRITE_BUDGET_RESERVES = {
+    POST_PRIORITY_CRITICAL: {'24h': 10, '15m': 3},
+    POST_PRIORITY_ALERT: {'24h': 15, '15m': 3},
+    POST_PRIORITY_REPLY: {'24h': 25, '15m': 5},
+    POST_PRIORITY_BROADCAST: {'24h': 0, '15m': 0}
+}
+
+
+class WriteBudget:
+    """
+    Sliding-window tracker for the account's Twitter write quota (thread-safe)
+
+    Every write is logged with its priority class and job name and persisted
+    to WRITE_BUDGET_FILE, so a restart does not forget the last 24 hours.
+    """
+
+    def __init__(self, filename):
+        self._filename = filename
+        self._lock = threading.Lock()
+        self._writes = deque()  # (timestamp, priority, job), oldest first
+        for entry in self._load():
+            self._writes.append(tuple(entry))
+
+    def can_spend(self, priority, count=1):
+        """True if `count` writes fit without eating into higher-class reserves."""
+        with self._lock:
+            now = time.time()
+            self._prune_locked(now)
+            for window in WRITE_BUDGET_WINDOWS:
+                if self._available_locked(window, priority, now) < count:
+                    return False
+            return True
+
+    def record(self, priority, job):
+        with self._lock:
+            self._writes.append((time.time(), priority, job))
+            self._prune_locked(time.time())
+            self._save_locked()
+
+    def available(self, priority):
+        """Number of writes the class can still make in the tightest window."""
+        with self._lock:
+            now = time.time()
+            self._prune_locked(now)
+            return min(
+                self._available_locked(window, priority, now)
+                for window in WRITE_BUDGET_WINDOWS
+            )
+
+    def get_stats(self):
+        with self._lock:
+            now = time.time()
+            self._prune_locked(now)
+            windows = {}
+            for window, (seconds, limit) in WRITE_BUDGET_WINDOWS.items():
+                in_window = [w for w in self._writes if now - w[0] < seconds]
+                windows[window] = {
+                    'limit': limit,
+                    'used': len(in_window),
+                    'remaining': max(limit - len(in_window), 0),
+                    'next_release': datetime.fromtimestamp(in_window[0][0] + seconds).isoformat()
+                    if in_window else None
+                }
+            classes = {
+                POST_PRIORITY_NAMES[priority]: {
+                    'reserve': WRITE_BUDGET_RESERVES[priority],
+                    'available': {
+                        window: self._available_locked(window, priority, now)
+                        for window in WRITE_BUDGET_WINDOWS
+                    }
+                }
+                for priority in sorted(POST_PRIORITY_NAMES)
+            }
+            jobs = {}
+            for _, _, job in self._writes:
+                jobs[job] = jobs.get(job, 0) + 1
+            return {'windows': windows, 'classes': classes, 'jobs_24h': jobs}
+
+    def _available_locked(self, window, priority, now):
+        seconds, limit = WRITE_BUDGET_WINDOWS[window]
+        used = sum(1 for w in self._writes if now - w[0] < seconds)
+        reserved = sum(
+            reserve[window] for p, reserve in WRITE_BUDGET_RESERVES.items() if p < priority
+        )
+        return max(limit - used - reserved, 0)
+
+    def _prune_locked(self, now):
+        horizon = max(seconds for seconds, _ in WRITE_BUDGET_WINDOWS.values())
+        while self._writes and now - self._writes[0][0] >= horizon:
+            self._writes.popleft()
+
+    def _load(self):
+        if not os.path.exists(self._filename):
+            return []
+        try:
+            with open(self._filename, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not load write budget log: {e}")
+            return []
+
+    def _save_locked(self):
+        try:
+            with open(self._filename, 'w') as f:
+                json.dump(list(self._writes), f)
+        except OSError as e:
+            logging.warning(f"Could not save write budget log: {e}")
+
+
+WRITE_BUDGET = WriteBudget(WRITE_BUDGET_FILE)
+
+def budget_allows(priority, job, count=1):
+    """Check the write budget for an optional job, logging when it skips."""
+    if WRITE_BUDGET.can_spend(priority, count):
+        return True
+    logging.info(f"Skipping {job}: write budget reserved for higher-priority posts")
+    return False
+
+# ------------------------------------------------------------
+# OUTBOUND DEDUPE CACHE
+# ------------------------------------------------------------
+# Twitter rejects a status identical to a recent one, but only after the
+# call has been made and counted. Hashes of recent posts are kept (and
+# persisted, so the activation tweet survives restarts) and checked locally.
+# Like Twitter's own check they only cover a recent window: hashes expire
+# after RECENT_POSTS_TTL seconds, so small template pools come back around.
+RECENT_POSTS_FILE = "recent_posts.json"
+RECENT_POSTS_MAX = int(os.getenv('RECENT_POSTS_MAX', '500'))
+RECENT_POSTS_TTL = int(os.getenv('RECENT_POSTS_TTL', str(24 * 3600)))  # seconds
+DEDUPE_RERENDER_ATTEMPTS = 5  # fresh renders tried before giving up on a duplicate
+# Lanes whose duplicates are stamped with the time instead of dropped
+DEDUPE_NEVER_DROP = (POST_PRIORITY_CRITICAL, POST_PRIORITY_REPLY)
+
+
+class RecentPosts:
+    """Bounded, persisted set of content hashes of recent posts (thread-safe)."""
+
+    def __init__(self, filename, max_size, ttl):
+        self._filename = filename
+        self._max_size = max_size
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._hashes = OrderedDict()  # hash -> posted_at, oldest first
+        self._outcomes = {'dropped': 0, 'stamped': 0, 'rerendered': 0}
+        for digest, posted_at in sorted(self._load(), key=lambda item: item[1]):
+            self._hashes[digest] = posted_at
+        self._expire_locked()
+
+    @staticmethod
+    def content_hash(text):
+        # Twitter ignores surrounding and repeated whitespace when comparing
+        normalized = ' '.join(text.split())
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:32]
+
+    def __contains__(self, text):
+        with self._lock:
+            self._expire_locked()
+            return self.content_hash(text) in self._hashes
+
+    def is_duplicate(self, text, outcome):
+        """
+        Like `in`, but counts a collision under what the caller does about
+        it: 'dropped', 'stamped' (sent with make_post_unique) or 'rerendered'.
+        """
+        with self._lock:
+            self._expire_locked()
+            if self.content_hash(text) not in self._hashes:
+                return False
+            self._outcomes[outcome] += 1
+            return True
+
+    def add(self, text):
+        with self._lock:
+            digest = self.content_hash(text)
+            self._hashes.pop(digest, None)
+            self._hashes[digest] = time.time()
+            while len(self._hashes) > self._max_size:
+                self._hashes.popitem(last=False)
+            self._expire_locked()
+            self._save_locked()
+
+    def get_stats(self):
+        with self._lock:
+            self._expire_locked()
+            return {
+                'size': len(self._hashes),
+                'max_size': self._max_size,
+                'ttl_seconds': self._ttl,
+                'rerenders': self._outcomes['rerendered'],
+                'duplicates_dropped': self._outcomes['dropped'],
+                'duplicates_stamped': self._outcomes['stamped']
+            }
+
+    def _expire_locked(self):
+        # Hashes are kept in posting order, so expired ones are at the front
+        cutoff = time.time() - self._ttl
+        while self._hashes and next(iter(self._hashes.values())) < cutoff:
+            self._hashes.popitem(last=False)
+
+    def _load(self):
+        if not os.path.exists(self._filename):
+            return []
+        try:
+            with open(self._filename, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not load recent post hashes: {e}")
+            return []
+
+    def _save_locked(self):
+        tmp_filename = f"{self._filename}.tmp"
+        try:
+            with open(tmp_filename, 'w') as f:
+                json.dump(list(self._hashes.items()), f)
+            os.replace(tmp_filename, self._filename)
+        except OSError as e:
+            logging.warning(f"Could not save recent post hashes: {e}")
+
+
+RECENT_POSTS = RecentPosts(RECENT_POSTS_FILE, RECENT_POSTS_MAX, RECENT_POSTS_TTL)
+
 # ------------------------------------------------------------
 # TOKEN SCALPER MODULE - PRICE MONITORING
 # ------------------------------------------------------------
@@ -276,7 +809,7 @@ def get_token_price_coingecko(symbol):
     backoff = COINGECKO_BACKOFF
     while True:
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
             if coin_id not in data:
@@ -398,69 +931,47 @@ def check_price_alerts():
 
 def create_fallback_alert_message(token_name, price_change, price):
     """Create a guaranteed short fallback alert message."""
-    direction = "SURGE" if price_change > 0 else "DIP"
-    emoji = "📈" if price_change > 0 else "📉"
-    return (
-        f"🔔 ${token_name} {direction}: {price_change:+.2f}% {emoji}\n"
-        f"Price: ${price:.2f}\n\n"
-        f"The wasteland economy shifts.\n\n"
-        f"{GAME_LINK}"
+    return render_tweet(
+        'price_alert_fallback',
+        token_name=token_name,
+        direction="SURGE" if price_change > 0 else "DIP",
+        trend="📈" if price_change > 0 else "📉",
+        price_change=price_change,
+        price=price
     )
 
 def post_price_alert(symbol, price_data, price_change):
-    """Post a price alert to Twitter with Overseer personality."""
-    try:
-        token_name = symbol.split('/')[0]
-        direction = "SURGE" if price_change > 0 else "DIP"
-        emoji = "📈🚀" if price_change > 0 else "📉⚠️"
-        
-        personality_line = random.choice([
-            "The wasteland economy shifts.",
-            "Market radiation detected.",
-            "FizzCo Analytics reporting.",
-            "Vault-Tec market surveillance active.",
-            "The caps flow differently now."
-        ])
-        
-        alert_messages = [
-            (
-                f"🔔 MARKET ALERT {emoji}\n\n"
-                f"${token_name} {direction}: {price_change:+.2f}%\n"
-                f"Current: ${price_data['price']:.2f}\n"
-                f"24h Change: {price_data['change_24h']:+.2f}%\n\n"
-                f"{personality_line}\n\n"
-                f"🎮 {GAME_LINK}"
-            ),
-            (
-                f"⚡ PRICE MOVEMENT DETECTED {emoji}\n\n"
-                f"Token: ${token_name}\n"
-                f"Change: {price_change:+.2f}%\n"
-                f"Price: ${price_data['price']:.2f}\n\n"
-                f"{random.choice(LORES)}\n\n"
-                f"🎮 {GAME_LINK}"
-            )
-        ]
-        
-        message = random.choice(alert_messages)
-        
-        # Ensure message fits Twitter limit with proper fallback
-        if len(message) > TWITTER_CHAR_LIMIT:
-            message = create_fallback_alert_message(
-                token_name, price_change, price_data['price']
-            )
-        
-        client.create_tweet(text=message)
-        logging.info(f"Posted price alert for {symbol}: {price_change:+.2f}%")
-        add_activity("PRICE_ALERT", f"{symbol} {price_change:+.2f}% - ${price_data['price']:.2f}")
-        
-    except tweepy.TweepyException as e:
-        logging.error(f"Failed to post price alert: {e}")
-        add_activity("ERROR", f"Price alert failed for {symbol}: {str(e)}")
+    """Queue a price alert tweet with Overseer personality."""
+    token_name = symbol.split('/')[0]
+    
+    message = render_tweet(
+        random.choice(['price_alert_market', 'price_alert_movement']),
+        'price_alert_fallback',
+        token_name=token_name,
+        direction="SURGE" if price_change > 0 else "DIP",
+        emoji="📈🚀" if price_change > 0 else "📉⚠️",
+        trend="📈" if price_change > 0 else "📉",
+        price_change=price_change,
+        price=price_data['price'],
+        change_24h=price_data['change_24h']
+    )
+    
+    enqueue_post(
+        message, POST_PRIORITY_ALERT, f"price alert for {symbol}: {price_change:+.2f}%",
+        job="check_price_alerts",
+        activity=("PRICE_ALERT", f"{symbol} {price_change:+.2f}% - ${price_data['price']:.2f}")
+    )
 
 def post_market_summary():
-    """Post a market summary with multiple token prices."""
+    """Queue a market summary with multiple token prices."""
+    if not client:
+        logging.debug("Skipping post_market_summary: Twitter client not initialized")
+        return
+    if not budget_allows(POST_PRIORITY_BROADCAST, "post_market_summary"):
+        return
+
     try:
-        summary_lines = ["📊 WASTELAND MARKET REPORT 📊\n"]
+        summary_lines = []
         
         for symbol, config in MONITORED_TOKENS.items():
             data = get_token_price(symbol, config['exchange'])
@@ -471,47 +982,20 @@ def post_market_summary():
                     f"{emoji} ${token_name}: ${data['price']:.2f} ({data['change_24h']:+.2f}%)"
                 )
         
-        personality = random.choice([
-            "The economy glows. Caps flow.",
-            "Market surveillance: nominal.",
-            "Vault-Tec approves these numbers.",
-            "FizzCo Industries: Making caps sparkle."
-        ])
-        
-        # Build message with length checking
-        message = "\n".join(summary_lines) + f"\n\n{personality}\n\n🎮 {GAME_LINK}"
-        
-        # Truncate if needed by removing token lines from the end
-        if len(message) > TWITTER_CHAR_LIMIT:
-            # Keep header and build with fewer tokens
-            truncated_lines = [summary_lines[0]]
-            footer = f"\n\n{personality}\n\n🎮 {GAME_LINK}"
-            
-            for line in summary_lines[1:]:
-                test_message = "\n".join(truncated_lines + [line]) + footer
-                if len(test_message) <= TWITTER_CHAR_LIMIT:
-                    truncated_lines.append(line)
-                else:
-                    break
-            
-            # Ensure we have at least one token, use simplified format if needed
-            if len(truncated_lines) < 2:  # Only header, no tokens
-                # Use a super simple format with just one token
-                if len(summary_lines) > 1:
-                    first_token = summary_lines[1]
-                    message = f"{summary_lines[0]}{first_token}\n\n{personality}\n\n{GAME_LINK}"
-                else:
-                    # No token data available at all
-                    message = f"{summary_lines[0]}No market data available.\n\n{personality}\n\n{GAME_LINK}"
-            else:
-                message = "\n".join(truncated_lines) + footer
+        # Token lines are dropped from the end until the report fits
+        message = render_tweet(
+            'market_summary', 'market_summary_short',
+            lines=Shrinkable(summary_lines or ["No market data available."])
+        )
         
-        client.create_tweet(text=message)
-        logging.info("Posted market summary")
-        add_activity("MARKET_SUMMARY", f"Posted summary with {len(MONITORED_TOKENS)} tokens")
+        enqueue_post(
+            message, POST_PRIORITY_BROADCAST, "market summary",
+            job="post_market_summary",
+            activity=("MARKET_SUMMARY", f"Posted summary with {len(MONITORED_TOKENS)} tokens")
+        )
         
-    except tweepy.TweepyException as e:
-        logging.error(f"Failed to post market summary: {e}")
+    except Exception as e:
+        logging.error(f"Failed to build market summary: {e}")
         add_activity("ERROR", f"Market summary failed: {str(e)}")
 
 # ------------------------------------------------------------
@@ -548,15 +1032,443 @@ def verify_webhook_auth():
     
     return provided_key == WEBHOOK_API_KEY
 
+# ------------------------------------------------------------
+# EVENT PIPELINE - HANDLER REGISTRY & MIDDLEWARE
+# ------------------------------------------------------------
+# Game events and Token-scalper alerts flow through an EventPipeline:
+# middleware stages run in EVENT_PIPELINE_STAGES order, then the handler
+# registered for the event type. Handlers and middleware register with
+# decorators next to their code, so a new event type or throughput tweak is
+# a plug-in rather than another if/elif branch.
+EVENT_PIPELINE_STAGES = ('filter', 'enrich', 'rate_gate', 'coalesce')
+
+
+class EventPipeline:
+    """
+    Registry of per-type handlers plus ordered middleware (thread-safe stats)
+
+    Middleware is called as fn(event) and returns the event to pass on (it
+    may return a modified copy) or None to stop processing, e.g. because
+    the event was filtered out or absorbed into a digest. Every stage and
+    handler call is timed.
+    """
+
+    def __init__(self, name, stages=EVENT_PIPELINE_STAGES):
+        self.name = name
+        self.handlers = {}
+        self._middleware = {stage: [] for stage in stages}
+        self._lock = threading.Lock()
+        self._stage_stats = {}  # stage name -> {'calls', 'stopped', 'total_ms', 'max_ms'}
+        self._type_counts = {}
+
+    def handler(self, *event_types):
+        """Decorator registering a handler for one or more event types."""
+        def register(fn):
+            for event_type in event_types:
+                self.handlers[event_type] = fn
+            return fn
+        return register
+
+    def middleware(self, stage):
+        """Decorator adding middleware to one of the pipeline's stages."""
+        def register(fn):
+            self._middleware[stage].append(fn)
+            return fn
+        return register
+
+    def process(self, event):
+        """Run event through every middleware stage and then its handler."""
+        # Unregistered types share one counter so senders cannot grow the stats
+        event_type = event.get("type") if event.get("type") in self.handlers else 'unknown'
+        with self._lock:
+            self._type_counts[event_type] = self._type_counts.get(event_type, 0) + 1
+        for stage, stage_middleware in self._middleware.items():
+            for fn in stage_middleware:
+                started = time.perf_counter()
+                result = None
+                try:
+                    result = fn(event)
+                finally:
+                    # A middleware that raised is recorded as having stopped the event
+                    self._record(f"{stage}:{fn.__name__}", started, stopped=result is None)
+                if result is None:
+                    return
+                event = result
+        self.dispatch(event)
+
+    def dispatch(self, event):
+        """Run only the registered handler (for events already past middleware)."""
+        handler = self.handlers.get(event.get("type"))
+        if handler is None:
+            logging.warning(f"No {self.name} handler for event type: {event.get('type')}")
+            return
+        started = time.perf_counter()
+        try:
+            handler(event)
+        finally:
+            self._record(f"handler:{event.get('type')}", started)
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                'handlers': sorted(self.handlers),
+                'stages': [
+                    f"{stage}:{fn.__name__}"
+                    for stage, stage_middleware in self._middleware.items()
+                    for fn in stage_middleware
+                ],
+                'events': dict(self._type_counts),
+                'timings': {
+                    name: dict(
+                        stats,
+                        avg_ms=round(stats['total_ms'] / stats['calls'], 3),
+                        total_ms=round(stats['total_ms'], 3),
+                        max_ms=round(stats['max_ms'], 3)
+                    )
+                    for name, stats in self._stage_stats.items()
+                }
+            }
+
+    def _record(self, name, started, stopped=False):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            stats = self._stage_stats.setdefault(
+                name, {'calls': 0, 'stopped': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+            )
+            stats['calls'] += 1
+            stats['stopped'] += int(stopped)
+            stats['total_ms'] += elapsed_ms
+            stats['max_ms'] = max(stats['max_ms'], elapsed_ms)
+
+
+GAME_EVENTS = EventPipeline("overseer_event")
+SCALPER_ALERTS = EventPipeline("token_scalper_alert")
+
+@GAME_EVENTS.middleware('filter')
+def drop_unknown_game_events(event):
+    """Filter out game event types no handler is registered for."""
+    if event.get("type") in GAME_EVENTS.handlers:
+        return event
+    logging.warning(f"Unknown overseer event type: {event.get('type')}")
+    return None
+
+@SCALPER_ALERTS.middleware('filter')
+def drop_unknown_alerts(event):
+    """Filter out alert types no handler is registered for."""
+    if event.get("type") in SCALPER_ALERTS.handlers:
+        return event
+    logging.warning(f"Unknown alert type: {event.get('type')}")
+    return None
+
+@SCALPER_ALERTS.middleware('rate_gate')
+def gate_optional_alerts(event):
+    """Skip non-critical alerts when the write budget is reserved for critical posts."""
+    if event.get("type") == 'rug_pull':
+        return event
+    return event if budget_allows(POST_PRIORITY_ALERT, "token_scalper_alert") else None
+
+# ------------------------------------------------------------
+# WEBHOOK INGESTION QUEUE
+# ------------------------------------------------------------
+# Webhooks are validated, queued and acknowledged with 202 straight away;
+# formatting, safety lookups and posting happen on a small worker pool so
+# senders never time out and retry. A full queue answers 429 + Retry-After.
+WEBHOOK_QUEUE_SIZE = int(os.getenv('WEBHOOK_QUEUE_SIZE', '1000'))
+WEBHOOK_WORKERS = int(os.getenv('WEBHOOK_WORKERS', '2'))
+WEBHOOK_RETRY_AFTER = 30  # seconds suggested to senders when the queue is full
+
+# Senders retry on timeouts. A delivery whose Idempotency-Key header (or,
+# without one, whose body hash) was accepted recently is acknowledged again
+# without being processed. Body hashes expire sooner because two genuine
+# events can carry identical payloads.
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', str(24 * 3600)))
+IDEMPOTENCY_HASH_TTL = int(os.getenv('IDEMPOTENCY_HASH_TTL', '300'))
+IDEMPOTENCY_MAX_KEYS = 10000
+
+# Batch endpoints take a JSON array or an NDJSON stream (one event per line)
+WEBHOOK_BATCH_MAX_ITEMS = int(os.getenv('WEBHOOK_BATCH_MAX_ITEMS', '1000'))
+NDJSON_CONTENT_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+
+WEBHOOK_QUEUE = queue.Queue(maxsize=WEBHOOK_QUEUE_SIZE)
+WEBHOOK_STATS = {'accepted': 0, 'replayed': 0, 'rejected_full': 0, 'rejected_invalid': 0, 'processed': 0, 'failed': 0}
+WEBHOOK_STATS_LOCK = threading.Lock()
+_WEBHOOK_WORKERS_STARTED = False
+_WEBHOOK_WORKERS_LOCK = threading.Lock()
+
+
+class IdempotencyStore:
+    """Bounded TTL set of recently accepted delivery keys (thread-safe)."""
+
+    def __init__(self, max_keys):
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        # One ordered dict per TTL (key -> expires_at), so within each the
+        # oldest key always expires first and pruning only looks at the fronts
+        self._buckets = {}
+        self._size = 0
+        self._hits = {}             # endpoint -> {'header': n, 'hash': n}
+
+    def claim(self, key, ttl):
+        """Record key as accepted. Returns False if it is already live (a replay)."""
+        with self._lock:
+            now = time.time()
+            self._prune_locked(now)
+            if any(key in bucket for bucket in self._buckets.values()):
+                return False
+            self._buckets.setdefault(ttl, OrderedDict())[key] = now + ttl
+            self._size += 1
+            while self._size > self._max_keys:
+                # Over capacity: drop the key closest to expiring
+                bucket = min(
+                    (bucket for bucket in self._buckets.values() if bucket),
+                    key=lambda b: next(iter(b.values()))
+                )
+                bucket.popitem(last=False)
+                self._size -= 1
+            return True
+
+    def release(self, key):
+        """Forget a claimed key whose delivery was not accepted after all."""
+        with self._lock:
+            for bucket in self._buckets.values():
+                if bucket.pop(key, None) is not None:
+                    self._size -= 1
+                    return
+
+    def count_hit(self, endpoint, source):
+        with self._lock:
+            hits = self._hits.setdefault(endpoint, {'header': 0, 'hash': 0})
+            hits[source] += 1
+
+    def get_stats(self):
+        with self._lock:
+            self._prune_locked(time.time())
+            return {
+                'live_keys': self._size,
+                'replays': {endpoint: dict(hits) for endpoint, hits in self._hits.items()},
+                'replays_total': sum(sum(hits.values()) for hits in self._hits.values())
+            }
+
+    def _prune_locked(self, now):
+        for bucket in self._buckets.values():
+            while bucket and next(iter(bucket.values())) <= now:
+                bucket.popitem(last=False)
+                self._size -= 1
+
+
+IDEMPOTENCY_STORE = IdempotencyStore(IDEMPOTENCY_MAX_KEYS)
+
+def event_idempotency_key(payload, header_key=None, index=None):
+    """
+    Sender-supplied key for one event, or None.
+
+    An `idempotency_key` field in the event wins, so the same event is
+    recognised whether it is retried alone or inside a batch. Otherwise the
+    Idempotency-Key header is used, suffixed with the item index in a batch.
+    """
+    body_key = payload.get('idempotency_key') if isinstance(payload, dict) else None
+    if body_key:
+        return str(body_key)
+    if header_key and index is not None:
+        return f"{header_key}:{index}"
+    return header_key or None
+
+def webhook_idempotency_key(endpoint, payload, header_key=None):
+    """
+    Key identifying a delivery, as (key, source, ttl).
+
+    Uses the sender's idempotency key when given (see event_idempotency_key),
+    otherwise a hash of the canonical JSON body.
+    """
+    if header_key:
+        return f"{endpoint}:key:{header_key}", 'header', IDEMPOTENCY_KEY_TTL
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+    digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return f"{endpoint}:hash:{digest}", 'hash', IDEMPOTENCY_HASH_TTL
+
+def count_webhook(outcome):
+    with WEBHOOK_STATS_LOCK:
+        WEBHOOK_STATS[outcome] += 1
+
+def validate_webhook_payload(payload):
+    """Return an error message for an unusable webhook body, or None."""
+    if not isinstance(payload, dict):
+        return "Body must be a JSON object"
+    if not isinstance(payload.get('type'), str) or not payload['type']:
+        return "Missing event type"
+    return None
+
+def submit_webhook(processor, payload, idempotency_key=None):
+    """
+    Queue a validated payload for the workers. Returns False if the queue is full.
+
+    `idempotency_key` is released if processing fails, so the sender's retry
+    is processed instead of being acknowledged as a replay.
+    """
+    try:
+        WEBHOOK_QUEUE.put_nowait((processor, payload, time.time(), idempotency_key))
+    except queue.Full:
+        count_webhook('rejected_full')
+        return False
+    count_webhook('accepted')
+    return True
+
+def webhook_worker_loop():
+    """Process queued webhook payloads forever (runs as a daemon thread)."""
+    while True:
+        processor, payload, received_at, idempotency_key = WEBHOOK_QUEUE.get()
+        try:
+            processor(payload)
+            count_webhook('processed')
+            logging.debug(f"Processed {payload.get('type')} webhook {time.time() - received_at:.2f}s after receipt")
+        except Exception as e:
+            count_webhook('failed')
+            logging.error(f"Webhook processing failed for {payload.get('type')}: {e}")
+            if idempotency_key:
+                IDEMPOTENCY_STORE.release(idempotency_key)
+        finally:
+            WEBHOOK_QUEUE.task_done()
+
+def start_webhook_workers():
+    """Start the webhook worker threads (idempotent)."""
+    global _WEBHOOK_WORKERS_STARTED
+    with _WEBHOOK_WORKERS_LOCK:
+        if _WEBHOOK_WORKERS_STARTED:
+            return
+        for _ in range(WEBHOOK_WORKERS):
+            threading.Thread(target=webhook_worker_loop, daemon=True).start()
+        _WEBHOOK_WORKERS_STARTED = True
+    logging.info(f"Started {WEBHOOK_WORKERS} webhook worker threads")
+
+def get_webhook_stats():
+    with WEBHOOK_STATS_LOCK:
+        stats = dict(WEBHOOK_STATS, depth=WEBHOOK_QUEUE.qsize(), capacity=WEBHOOK_QUEUE_SIZE)
+    stats['idempotency'] = IDEMPOTENCY_STORE.get_stats()
+    stats['safety_enrichment'] = get_safety_enrichment_stats()
+    stats['pipelines'] = {
+        pipeline.name: pipeline.get_stats() for pipeline in (GAME_EVENTS, SCALPER_ALERTS)
+    }
+    return stats
+
+def ingest_webhook(endpoint, processor, payload, idempotency_key=None, prepare=None):
+    """
+    Validate, dedupe and queue one event. Returns (result, http_status).
+
+    `endpoint` is the single-event path, so keys from batch items and single
+    deliveries share one namespace; only an event's own `idempotency_key`
+    (or an identical body, for hashes) matches across the two. `prepare`,
+    if given, is applied to a newly accepted payload before it is queued and
+    must not block (e.g. start_safety_check).
+    """
+    error = validate_webhook_payload(payload)
+    if error:
+        count_webhook('rejected_invalid')
+        return {"ok": False, "error": error}, 400
+    key, source, ttl = webhook_idempotency_key(endpoint, payload, idempotency_key)
+    if not IDEMPOTENCY_STORE.claim(key, ttl):
+        # Already accepted: acknowledge the retry without processing it again
+        IDEMPOTENCY_STORE.count_hit(endpoint, source)
+        count_webhook('replayed')
+        logging.info(f"Ignoring replayed {payload['type']} webhook ({source} match)")
+        return {"ok": True, "duplicate": True}, 200
+    if prepare:
+        payload = prepare(payload)
+    if not submit_webhook(processor, payload, key):
+        IDEMPOTENCY_STORE.release(key)
+        discard_safety_check(payload)
+        logging.warning(f"Webhook queue full; rejecting {payload['type']} event")
+        return {"ok": False, "error": "Ingestion queue full"}, 429
+    return {"ok": True, "queued": True}, 202
+
+def accept_webhook(processor, prepare=None):
+    """Validate the request body, queue it and build the HTTP response."""
+    payload = request.get_json(silent=True)
+    result, status = ingest_webhook(
+        request.path, processor, payload,
+        event_idempotency_key(payload, request.headers.get(IDEMPOTENCY_HEADER, '').strip()),
+        prepare
+    )
+    if status == 429:
+        return result, status, {"Retry-After": str(WEBHOOK_RETRY_AFTER)}
+    return result, status
+
+class BatchItemError:
+    """Placeholder for a batch item that could not be parsed."""
+
+    def __init__(self, message):
+        self.message = message
+
+def iter_ndjson_payloads():
+    """Yield the events of an NDJSON request stream, or a BatchItemError per bad line."""
+    for line in request.stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield BatchItemError("Invalid JSON line")
+
+def read_batch_payloads():
+    """
+    Read the events of a batch request body, at most WEBHOOK_BATCH_MAX_ITEMS + 1.
+
+    JSON arrays are parsed in one go; NDJSON bodies are read line by line
+    from the request stream and stop one past the cap, so an oversized batch
+    is detected before any of it is ingested.
+    """
+    content_type = (request.mimetype or '').lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        return list(itertools.islice(iter_ndjson_payloads(), WEBHOOK_BATCH_MAX_ITEMS + 1))
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, list):
+        raise ValueError("Body must be a JSON array or NDJSON")
+    return payload
+
+def accept_webhook_batch(endpoint, processor, prepare=None):
+    """Ingest every event of a batch request and report a result per item."""
+    batch_key = request.headers.get(IDEMPOTENCY_HEADER, '').strip()
+    results = []
+    counts = {}
+    try:
+        payloads = read_batch_payloads()
+    except ValueError as e:
+        return {"ok": False, "error": str(e)}, 400
+    # Reject oversized batches whole, before anything is queued
+    if len(payloads) > WEBHOOK_BATCH_MAX_ITEMS:
+        return {"ok": False, "error": f"Batch larger than {WEBHOOK_BATCH_MAX_ITEMS} events"}, 413
+
+    for index, payload in enumerate(payloads):
+        if isinstance(payload, BatchItemError) or not isinstance(payload, dict):
+            count_webhook('rejected_invalid')
+            error = payload.message if isinstance(payload, BatchItemError) else "Event must be a JSON object"
+            result, status = {"ok": False, "error": error}, 400
+        else:
+            item_key = event_idempotency_key(payload, batch_key, index)
+            result, status = ingest_webhook(endpoint, processor, payload, item_key, prepare)
+        results.append(dict(result, index=index, status=status))
+        counts[status] = counts.get(status, 0) + 1
+
+    response = {
+        "ok": all(result['ok'] for result in results),
+        "received": len(results),
+        "queued": counts.get(202, 0),
+        "duplicates": counts.get(200, 0),
+        "rejected": len(results) - counts.get(202, 0) - counts.get(200, 0),
+        "results": results
+    }
+    if counts.get(429):
+        return response, 200, {"Retry-After": str(WEBHOOK_RETRY_AFTER)}
+    return response, 200
+
 @app.post("/overseer-event")
 def overseer_event():
     """Webhook endpoint for overseer events"""
     if not verify_webhook_auth():
         return {"ok": False, "error": "Unauthorized"}, 401
     
-    event = request.json
-    overseer_event_bridge(event)
-    return {"ok": True}
+    return accept_webhook(overseer_event_bridge)
 
 @app.post("/token-scalper-alert")
 def token_scalper_alert():
@@ -564,43 +1476,77 @@ def token_scalper_alert():
     if not verify_webhook_auth():
         return {"ok": False, "error": "Unauthorized"}, 401
     
-    try:
-        alert_data = request.json
-        alert_type = alert_data.get('type', 'unknown')
-        
-        if alert_type == 'rug_pull':
-            handle_rug_pull_alert(alert_data)
-        elif alert_type == 'high_potential':
-            handle_high_potential_alert(alert_data)
-        elif alert_type == 'airdrop':
-            handle_airdrop_alert(alert_data)
-        else:
-            logging.warning(f"Unknown alert type: {alert_type}")
-        
-        return {"ok": True, "processed": True}
-    except Exception as e:
-        logging.error(f"Token scalper alert failed: {e}")
-        return {"ok": False, "error": str(e)}, 500
+    return accept_webhook(SCALPER_ALERTS.process, prepare=start_safety_check)
+
+@app.post("/overseer-event/batch")
+def overseer_event_batch():
+    """Batch webhook endpoint for overseer events (JSON array or NDJSON)"""
+    if not verify_webhook_auth():
+        return {"ok": False, "error": "Unauthorized"}, 401
+    
+    return accept_webhook_batch("/overseer-event", overseer_event_bridge)
+
+@app.post("/token-scalper-alert/batch")
+def token_scalper_alert_batch():
+    """Batch webhook endpoint for Token-scalper alerts (JSON array or NDJSON)"""
+    if not verify_webhook_auth():
+        return {"ok": False, "error": "Unauthorized"}, 401
+    
+    return accept_webhook_batch("/token-scalper-alert", SCALPER_ALERTS.process, prepare=start_safety_check)
+
+@app.post("/api/push/<upstream>")
+def api_push(upstream):
+    """Signed push endpoint for upstream alerts (polling pauses while pushes arrive)"""
+    return api_client.ingest_push(
+        upstream,
+        request.get_data(),
+        request.headers.get(api_client.PUSH_SIGNATURE_HEADER, ''),
+        request.headers.get(api_client.PUSH_TIMESTAMP_HEADER, '')
+    )
+
+@app.route("/api/webhooks/stats")
+@auth.login_required
+def api_webhook_stats():
+    """JSON endpoint for webhook ingestion and idempotency (retry) statistics"""
+    return get_webhook_stats()
 
 # ------------------------------------------------------------
 # MONITORING UI ROUTES
 # ------------------------------------------------------------
 BOT_START_TIME = datetime.now()
-RECENT_ACTIVITIES = []
+MAX_ACTIVITIES = 50
+ACTIVITY_DESCRIPTION_MAX_CHARS = 300
+RECENT_ACTIVITIES = deque(maxlen=MAX_ACTIVITIES)  # ActivityRecord, oldest first
 RECENT_ACTIVITIES_LOCK = threading.Lock()
 
+class ActivityRecord:
+    """Compact activity log entry (fixed attributes, no per-instance __dict__)."""
+    __slots__ = ('timestamp', 'type', 'description')
+
+    def __init__(self, timestamp, activity_type, description):
+        self.timestamp = timestamp
+        self.type = activity_type
+        self.description = description
+
+    def to_dict(self):
+        return {'timestamp': self.timestamp, 'type': self.type, 'description': self.description}
+
 def add_activity(activity_type, description):
     """Track bot activities for monitoring UI (thread-safe)"""
-    global RECENT_ACTIVITIES
+    record = ActivityRecord(
+        datetime.now().isoformat(),
+        activity_type,
+        str(description)[:ACTIVITY_DESCRIPTION_MAX_CHARS]
+    )
     with RECENT_ACTIVITIES_LOCK:
-        RECENT_ACTIVITIES.append({
-            'timestamp': datetime.now().isoformat(),
-            'type': activity_type,
-            'description': description
-        })
-        # Keep only last 50 activities
-        if len(RECENT_ACTIVITIES) > 50:
-            RECENT_ACTIVITIES = RECENT_ACTIVITIES[-50:]
+        # Fixed-size deque: the oldest activity drops off in O(1)
+        RECENT_ACTIVITIES.append(record)
+    alert_archive.record_activity(record.to_dict())
+
+def get_recent_activities():
+    """Recent activities as dictionaries, newest first (thread-safe)"""
+    with RECENT_ACTIVITIES_LOCK:
+        return [record.to_dict() for record in reversed(RECENT_ACTIVITIES)]
 
 @app.route("/")
 @auth.login_required
@@ -958,9 +1904,18 @@ def monitoring_dashboard():
                 }
             }
             
+            // Alerts currently shown (newest first) and the newest seq seen,
+            // so each poll only asks /api/alerts for alerts after it
+            const ALERTS_SHOWN = 50;
+            let shownAlerts = [];
+            let latestAlertSeq = null;
+            
             async function loadAlertsAndHealth() {
                 try {
-                    const response = await fetch('/api/alerts', {
+                    const url = latestAlertSeq === null
+                        ? '/api/alerts?limit=' + ALERTS_SHOWN
+                        : '/api/alerts?limit=' + ALERTS_SHOWN + '&after=' + latestAlertSeq;
+                    const response = await fetch(url, {
                         credentials: 'include'
                     });
                     const data = await response.json();
@@ -969,11 +1924,56 @@ def monitoring_dashboard():
                     updateHealthStatus('overseer-ai', data.health.overseer_bot_ai);
                     updateHealthStatus('token-scalper', data.health.token_scalper);
                     
+                    // Additional upstreams from the registry (UPSTREAMS_JSON / UPSTREAMS_FILE)
+                    const extraUpstreams = document.getElementById('extra-upstreams');
+                    Object.entries(data.health)
+                        .filter(([name]) => name !== 'overseer_bot_ai' && name !== 'token_scalper')
+                        .forEach(([name, health]) => {
+                            const prefix = 'upstream-' + name;
+                            if (!document.getElementById(prefix + '-status')) {
+                                const card = document.createElement('div');
+                                card.className = 'status-card';
+                                const title = document.createElement('h3');
+                                title.textContent = health.label || name;
+                                const status = document.createElement('div');
+                                status.id = prefix + '-status';
+                                status.className = 'health-status';
+                                const lastCheck = document.createElement('small');
+                                lastCheck.id = prefix + '-last-check';
+                                lastCheck.className = 'timestamp';
+                                card.append(title, status, lastCheck);
+                                extraUpstreams.appendChild(card);
+                            }
+                            updateHealthStatus(prefix, health);
+                        });
+                    
+                    // Update ingestion rate (new alerts per minute, duplicates skipped)
+                    const ingestion = Object.entries(data.ingestion || {}).map(([source, stats]) =>
+                        source + ': ' + stats.new_per_minute + ' new/min, ' +
+                        stats.new + ' ingested, ' + stats.duplicates_skipped + ' duplicates skipped');
+                    document.getElementById('alerts-ingestion').textContent =
+                        ingestion.length ? 'Ingestion — ' + ingestion.join(' | ') : '';
+                    
+                    // Merge new alerts; a lower latest_seq means the server restarted
+                    if (latestAlertSeq !== null && data.latest_seq < latestAlertSeq) {
+                        shownAlerts = [];
+                        latestAlertSeq = null;
+                        return loadAlertsAndHealth();
+                    }
+                    // A full page means there may be a gap between it and the
+                    // alerts already shown; the page holds the newest
+                    // ALERTS_SHOWN alerts, so it replaces the list outright
+                    const newAlerts = data.alerts || [];
+                    shownAlerts = newAlerts.length >= ALERTS_SHOWN
+                        ? newAlerts
+                        : newAlerts.concat(shownAlerts).slice(0, ALERTS_SHOWN);
+                    latestAlertSeq = data.latest_seq;
+                    
                     // Update alerts display
                     const alertsLog = document.getElementById('alerts-log');
-                    if (data.alerts && data.alerts.length > 0) {
+                    if (shownAlerts.length > 0) {
                         let alertsHTML = '';
-                        data.alerts.forEach(alert => {
+                        shownAlerts.forEach(alert => {
                             const alertClass = 'alert-' + alert.type;
                             alertsHTML += '<div class="alert-item ' + alertClass + '">';
                             // Safely extract timestamp string (first 19 chars for YYYY-MM-DD HH:MM:SS)
@@ -1022,6 +2022,23 @@ def monitoring_dashboard():
                     lastCheckElem.textContent = 'Not checked yet';
                 }
                 
+                // Per-endpoint poll cycle durations, e.g. "status 120ms, alerts 95ms"
+                const durations = Object.entries(health.endpoints || {})
+                    .filter(([, stats]) => stats.last_duration_ms !== null)
+                    .map(([name, stats]) => name + ' ' + Math.round(stats.last_duration_ms) + 'ms');
+                if (durations.length) {
+                    lastCheckElem.textContent += ' (' + durations.join(', ') + ')';
+                }
+                
+                // Adaptive poll interval (backed off while failing, tightened after new alerts)
+                if (health.polling_paused && health.polling_paused.length) {
+                    lastCheckElem.textContent += ' - push mode (' + health.polling_paused.join(', ') + ' polling paused)';
+                }
+                if (health.effective_interval) {
+                    lastCheckElem.textContent += ' - every ' + Math.round(health.effective_interval) + 's'
+                        + (health.boosted ? ' (boosted)' : '');
+                }
+                
                 if (health.error) {
                     lastCheckElem.textContent += ' - ' + health.error;
                 }
@@ -1085,10 +2102,12 @@ def monitoring_dashboard():
                             <small id="token-scalper-last-check" class="timestamp">-</small>
                         </div>
                     </div>
+                    <div class="status-grid" id="extra-upstreams"></div>
                 </div>
 
                 <div class="section">
                     <h2>🚨 RECENT ALERTS</h2>
+                    <small id="alerts-ingestion" class="timestamp"></small>
                     <div class="activity-log" id="alerts-log">
                         <p>Loading alerts...</p>
                     </div>
@@ -1233,6 +2252,12 @@ def monitoring_dashboard():
                         <li><a href="/api/activities">/api/activities</a> - Recent activities JSON</li>
                         <li><a href="/api/alerts">/api/alerts</a> - Aggregated alerts from external systems (NEW)</li>
                         <li><a href="/api/health">/api/health</a> - Health status of external systems (NEW)</li>
+                        <li><a href="/api/upstream-status">/api/upstream-status</a> - Latest status snapshot of each external system</li>
+                        <li><a href="/api/twitter/budget">/api/twitter/budget</a> - Twitter write quota used/remaining</li>
+                        <li><a href="/api/webhooks/stats">/api/webhooks/stats</a> - Webhook queue, replays and pipeline stage timings</li>
+                        <li><a href="/api/archive/alerts">/api/archive/alerts</a> - Archived alerts (?start=&amp;end=&amp;type=&amp;source=&amp;limit=)</li>
+                        <li><a href="/api/archive/activities">/api/archive/activities</a> - Archived activities (?start=&amp;end=&amp;type=&amp;limit=)</li>
+                        <li><a href="/api/archive/stats">/api/archive/stats</a> - Archive writer and partition stats</li>
                     </ul>
                     
                     <h3>Wallet APIs:</h3>
@@ -1261,8 +2286,7 @@ curl -u {{ admin_user }}:PASSWORD https://your-domain.com/api/status
     '''
     
     
-    with RECENT_ACTIVITIES_LOCK:
-        activities_copy = list(reversed(RECENT_ACTIVITIES))
+    activities_copy = get_recent_activities()
     
     return render_template_string(
         template,
@@ -1289,7 +2313,12 @@ def api_status():
         "vault_number": VAULT_NUMBER,
         "start_time": BOT_START_TIME.isoformat(),
         "scheduler_running": scheduler.running,
-        "jobs_count": len(scheduler.get_jobs())
+        "jobs_count": len(scheduler.get_jobs()),
+        "post_queue": POST_QUEUE.get_stats(),
+        "media_pool": MEDIA_POOL.get_stats(),
+        "recent_posts": RECENT_POSTS.get_stats(),
+        "event_coalescer": EVENT_COALESCER.get_stats(),
+        "webhooks": get_webhook_stats()
     }
 
 @app.route("/api/prices")
@@ -1320,20 +2349,86 @@ def api_jobs():
 @auth.login_required
 def api_activities():
     """JSON endpoint for recent activities"""
-    with RECENT_ACTIVITIES_LOCK:
-        activities_copy = list(reversed(RECENT_ACTIVITIES))
-    return {"activities": activities_copy}
+    return {"activities": get_recent_activities()}
+
+@app.route("/api/twitter/budget")
+@auth.login_required
+def api_twitter_budget():
+    """JSON endpoint for Twitter write quota usage and per-class reserves"""
+    return WRITE_BUDGET.get_stats()
+
+def int_arg(value):
+    """Parse an optional non-negative integer query parameter (raises ValueError)."""
+    if value is None or value == "":
+        return None
+    if not value.isdigit():
+        raise ValueError(f"Expected a non-negative integer, got {value!r}")
+    return int(value)
 
 @app.route("/api/alerts")
 @auth.login_required
 def api_alerts():
-    """JSON endpoint for aggregated alerts from external systems"""
-    alerts = api_client.get_alerts(limit=50)
-    health = api_client.get_health_status()
-    return {
-        "alerts": alerts,
-        "health": health
-    }
+    """
+    JSON endpoint for aggregated alerts from external systems
+
+    Query parameters (all optional): type, source, since (ISO timestamp),
+    limit (default 50), after (seq: only newer alerts, for incremental polls)
+    and cursor (next_cursor of a previous page: only older alerts).
+    """
+    try:
+        query = {
+            "alert_type": request.args.get("type") or None,
+            "source": request.args.get("source") or None,
+            "since": request.args.get("since") or None,
+            "limit": int_arg(request.args.get("limit")),
+            "after": int_arg(request.args.get("after")),
+            "cursor": int_arg(request.args.get("cursor"))
+        }
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    if query["limit"] is None:
+        query["limit"] = 50
+    result = api_client.query_alerts(**query)
+    result["health"] = api_client.get_health_status()
+    result["ingestion"] = api_client.get_ingestion_stats()
+    return result
+
+@app.route("/api/archive/<kind>")
+@auth.login_required
+def api_archive(kind):
+    """
+    JSON endpoint for the persistent alert / activity archive
+
+    Query parameters (all optional): start and end (ISO timestamps, end
+    exclusive), type, source (alerts only) and limit (default 100).
+    """
+    if kind == "stats":
+        return alert_archive.get_stats()
+    if kind not in alert_archive.ARCHIVE_COLUMNS:
+        return {"error": f"Unknown archive: {kind}"}, 404
+    try:
+        limit = int_arg(request.args.get("limit"))
+        rows = alert_archive.query(
+            kind,
+            start=request.args.get("start") or None,
+            end=request.args.get("end") or None,
+            record_type=request.args.get("type") or None,
+            source=request.args.get("source") or None,
+            limit=100 if limit is None else limit
+        )
+    except ValueError as e:
+        return {"error": str(e)}, 400
+    except sqlite3.Error as e:
+        # Locked database, or a partition dropped by retention mid-query
+        logging.warning(f"Archive query failed: {e}")
+        return {"error": "Archive temporarily unavailable"}, 503
+    return {kind: rows, "count": len(rows)}
+
+@app.route("/api/upstream-status")
+@auth.login_required
+def api_upstream_status():
+    """JSON endpoint for the latest status snapshot of each external system"""
+    return api_client.get_upstream_status()
 
 @app.route("/api/health")
 @auth.login_required
@@ -1481,6 +2576,8 @@ def check_token_safety(token_address: str, chain: str = 'eth') -> dict:
         - risk_score: 0-100 (higher = more risky)
         - warnings: list of issues found
         - honeypot: bool
+        - verified: bool (False when honeypot.is gave no usable answer; such
+          results are not cached and their risk_score means nothing)
     """
     cache_key = f"{chain}:{token_address}"
     
@@ -1498,17 +2595,22 @@ def check_token_safety(token_address: str, chain: str = 'eth') -> dict:
         'warnings': [],
         'honeypot': False,
         'liquidity_ok': True,
-        'contract_verified': None
+        'contract_verified': None,
+        'verified': False
     }
     
     try:
         # Use honeypot.is API for basic checks
         chain_id = CHAIN_IDS.get(chain, '1')
         honeypot_api = f"https://api.honeypot.is/v2/IsHoneypot?address={token_address}&chainID={chain_id}"
-        response = requests.get(honeypot_api, timeout=5)
+        response = http_client.get(honeypot_api, timeout=5)
         
-        if response.status_code == 200:
+        if response.status_code != 200:
+            logging.warning(f"Token safety check for {token_address}: honeypot.is returned HTTP {response.status_code}")
+            result['warnings'].append('Unable to verify safety')
+        else:
             data = response.json()
+            result['verified'] = True
             if data.get('honeypotResult', {}).get('isHoneypot'):
                 result['honeypot'] = True
                 result['is_safe'] = False
@@ -1531,13 +2633,16 @@ def check_token_safety(token_address: str, chain: str = 'eth') -> dict:
     
     except Exception as e:
         logging.error(f"Token safety check failed for {token_address}: {e}")
+        result['verified'] = False
         result['warnings'].append('Unable to verify safety')
     
     # Determine overall safety
     if result['risk_score'] > 70:
         result['is_safe'] = False
     
-    # Cache result with thread safety
+    # Only cache real answers; an outage should be retried on the next check
+    if not result['verified']:
+        return result
     with TOKEN_SAFETY_CACHE_LOCK:
         TOKEN_SAFETY_CACHE[cache_key] = {
             'timestamp': time.time(),
@@ -1546,6 +2651,115 @@ def check_token_safety(token_address: str, chain: str = 'eth') -> dict:
     
     return result
 
+# Optional enrichment: our own safety check for the alert's token starts on a
+# small pool as soon as the webhook is accepted, while the alert waits in the
+# ingestion queue. The handler waits only for what is left of
+# SAFETY_ENRICHMENT_BUDGET, counted from acceptance, and posts without the
+# score if the check is late. Pending checks live in a side map keyed by the
+# alert payload, so the payload itself stays plain JSON data.
+SAFETY_ENRICHMENT_ENABLED = os.getenv('SAFETY_ENRICHMENT_ENABLED', 'true').lower() == 'true'
+SAFETY_ENRICHMENT_BUDGET = float(os.getenv('SAFETY_ENRICHMENT_BUDGET', '1.5'))  # seconds
+SAFETY_ENRICHMENT_WORKERS = 4
+SAFETY_CHECK_MAX_AGE = 600  # seconds before an uncollected check is forgotten
+SAFETY_ENRICHED_ALERTS = ('rug_pull', 'high_potential')
+EVM_ADDRESS_PATTERN = re.compile(r'^0x[0-9a-fA-F]{40}$')
+
+SAFETY_EXECUTOR = ThreadPoolExecutor(max_workers=SAFETY_ENRICHMENT_WORKERS, thread_name_prefix="safety")
+SAFETY_ENRICHMENT_STATS = {'started': 0, 'attached': 0, 'not_ready': 0, 'unavailable': 0}
+SAFETY_ENRICHMENT_STATS_LOCK = threading.Lock()
+PENDING_SAFETY_CHECKS = {}  # id(payload) -> (payload, future, accepted_at)
+PENDING_SAFETY_CHECKS_LOCK = threading.Lock()
+
+def count_safety_enrichment(outcome):
+    with SAFETY_ENRICHMENT_STATS_LOCK:
+        SAFETY_ENRICHMENT_STATS[outcome] += 1
+
+def get_safety_enrichment_stats():
+    with SAFETY_ENRICHMENT_STATS_LOCK:
+        stats = dict(
+            SAFETY_ENRICHMENT_STATS,
+            enabled=SAFETY_ENRICHMENT_ENABLED,
+            budget_seconds=SAFETY_ENRICHMENT_BUDGET
+        )
+    with PENDING_SAFETY_CHECKS_LOCK:
+        stats['pending'] = len(PENDING_SAFETY_CHECKS)
+    return stats
+
+def start_safety_check(alert_data):
+    """
+    Kick off check_token_safety for the alert's token without waiting for it.
+
+    Called when the webhook is accepted (see ingest_webhook), so the check
+    overlaps the time the alert spends queued. Returns the payload unchanged;
+    the check is registered against it for collect_safety_check.
+    """
+    token_address = alert_data.get('token_address', '')
+    if (not SAFETY_ENRICHMENT_ENABLED
+            or alert_data.get('type') not in SAFETY_ENRICHED_ALERTS
+            or not isinstance(token_address, str)
+            or not EVM_ADDRESS_PATTERN.match(token_address)):
+        return alert_data
+    count_safety_enrichment('started')
+    future = SAFETY_EXECUTOR.submit(check_token_safety, token_address, alert_data.get('chain', 'eth'))
+    now = time.monotonic()
+    with PENDING_SAFETY_CHECKS_LOCK:
+        # Alerts filtered out before their handler never collect their check
+        for key, (_, _, accepted_at) in list(PENDING_SAFETY_CHECKS.items()):
+            if now - accepted_at > SAFETY_CHECK_MAX_AGE:
+                del PENDING_SAFETY_CHECKS[key]
+        # The entry holds the payload itself, so its id cannot be reused while pending
+        PENDING_SAFETY_CHECKS[id(alert_data)] = (alert_data, future, now)
+    return alert_data
+
+def discard_safety_check(alert_data):
+    """Forget the pending check for an alert that will not be processed."""
+    with PENDING_SAFETY_CHECKS_LOCK:
+        entry = PENDING_SAFETY_CHECKS.get(id(alert_data))
+        if entry and entry[0] is alert_data:
+            del PENDING_SAFETY_CHECKS[id(alert_data)]
+
+def collect_safety_check(alert_data):
+    """
+    Result of the safety check started by start_safety_check, or None.
+
+    Waits at most until SAFETY_ENRICHMENT_BUDGET seconds after the webhook
+    was accepted; a check still running then is left to finish (and warm
+    the cache) while the alert goes out without it. Unverified checks
+    (honeypot.is unreachable or erroring) are treated as unavailable.
+    """
+    with PENDING_SAFETY_CHECKS_LOCK:
+        entry = PENDING_SAFETY_CHECKS.get(id(alert_data))
+        if entry is None or entry[0] is not alert_data:
+            return None
+        del PENDING_SAFETY_CHECKS[id(alert_data)]
+    _, future, accepted_at = entry
+    remaining = max(0.0, SAFETY_ENRICHMENT_BUDGET - (time.monotonic() - accepted_at))
+    try:
+        result = future.result(timeout=remaining)
+    except FutureTimeoutError:
+        count_safety_enrichment('not_ready')
+        logging.info(f"Safety check for {alert_data.get('token_address')} missed the {SAFETY_ENRICHMENT_BUDGET}s budget; posting without it")
+        return None
+    except Exception as e:
+        count_safety_enrichment('unavailable')
+        logging.warning(f"Safety check for {alert_data.get('token_address')} failed: {e}")
+        return None
+    if not result.get('verified'):
+        count_safety_enrichment('unavailable')
+        return None
+    count_safety_enrichment('attached')
+    return result
+
+def format_safety_line(safety):
+    """Extra alert line with our risk score and top warning, or '' without data."""
+    if not safety:
+        return ''
+    line = f"\n🛡️ Overseer scan: risk {safety['risk_score']}/100"
+    if safety['warnings']:
+        line += f" ({safety['warnings'][0]})"
+    return line
+
+@SCALPER_ALERTS.handler('rug_pull')
 def handle_rug_pull_alert(alert_data: dict):
     """Handle rug pull alert from Token-scalper"""
     token_name = alert_data.get('token_name', 'Unknown Token')
@@ -1559,122 +2773,51 @@ def handle_rug_pull_alert(alert_data: dict):
         'high': '🔴',
         'critical': '🛑'
     }
-    emoji = emoji_map.get(severity, '⚠️')
-    
-    personality = random.choice([
-        "The wasteland claims another scam.",
-        "Vault-Tec Market Surveillance detected suspicious activity.",
-        "FizzCo Intelligence: Threat confirmed.",
-        "Overseer protocols: Avoid this contamination.",
-        "The caps aren't worth the radiation here."
-    ])
+    emoji = emoji_map.get(severity, '⚠️')
     
     # Better address truncation: show start and end
     address_display = f"{token_address[:6]}...{token_address[-4:]}" if len(token_address) > 10 else token_address
     
-    message = (
-        f"{emoji} RUG PULL WARNING {emoji}\n\n"
-        f"Token: {token_name}\n"
-        f"Contract: {address_display}\n"
-        f"Severity: {severity.upper()}\n\n"
-        f"{details}\n\n"
-        f"{personality}\n\n"
-        f"#RugPull #CryptoScam #StaySafe\n\n"
-        f"🎮 {GAME_LINK}"
+    safety = format_safety_line(collect_safety_check(alert_data))
+    message = render_tweet(
+        'rug_pull', ('rug_pull', {'safety': ''}),
+        ('rug_pull_short', {'details': Shrinkable(details, min_weight=20)}),
+        emoji=emoji, token_name=token_name, address=address_display,
+        severity=severity.upper(), details=details, safety=safety
     )
     
-    try:
-        if len(message) > TWITTER_CHAR_LIMIT:
-            message = (
-                f"{emoji} RUG PULL WARNING {emoji}\n\n"
-                f"{token_name}: {details[:80]}...\n\n"
-                f"{personality}\n\n"
-                f"{GAME_LINK}"
-            )[:TWITTER_CHAR_LIMIT]
-        
-        client.create_tweet(text=message)
-        logging.info(f"Posted rug pull alert for {token_name}")
-    except tweepy.TweepyException as e:
-        logging.error(f"Failed to post rug pull alert: {e}")
+    enqueue_post(message, POST_PRIORITY_CRITICAL, f"rug pull alert for {token_name}", job="token_scalper_alert")
 
+@SCALPER_ALERTS.handler('high_potential')
 def handle_high_potential_alert(alert_data: dict):
     """Handle high potential token alert from Token-scalper"""
     token_name = alert_data.get('token_name', 'Unknown Token')
     score = alert_data.get('opportunity_score', 0)
     reasons = alert_data.get('reasons', [])
     
-    personality = random.choice([
-        "Opportunity detected in the wasteland.",
-        "FizzCo Analytics: Potential moonshot identified.",
-        "Vault-Tec recommends: Investigation warranted.",
-        "The Overseer sees potential here.",
-        "Caps flow toward opportunity."
-    ])
-    
     reasons_str = ' • '.join(reasons[:3]) if reasons else 'Multiple positive indicators'
     
-    message = (
-        f"🚀 HIGH POTENTIAL TOKEN 🚀\n\n"
-        f"Token: {token_name}\n"
-        f"Score: {score}/100\n"
-        f"Signals: {reasons_str}\n\n"
-        f"{personality}\n\n"
-        f"DYOR • Not Financial Advice\n\n"
-        f"🎮 {GAME_LINK}"
+    safety = format_safety_line(collect_safety_check(alert_data))
+    message = render_tweet(
+        'high_potential', ('high_potential', {'safety': ''}), 'high_potential_short',
+        token_name=token_name, score=score, reasons=reasons_str, safety=safety
     )
     
-    try:
-        if len(message) > TWITTER_CHAR_LIMIT:
-            message = (
-                f"🚀 {token_name} - Score: {score}/100\n\n"
-                f"{personality}\n\n"
-                f"DYOR • NFA\n"
-                f"{GAME_LINK}"
-            )[:TWITTER_CHAR_LIMIT]
-        
-        client.create_tweet(text=message)
-        logging.info(f"Posted high potential alert for {token_name}")
-    except tweepy.TweepyException as e:
-        logging.error(f"Failed to post high potential alert: {e}")
+    enqueue_post(message, POST_PRIORITY_ALERT, f"high potential alert for {token_name}", job="token_scalper_alert")
 
+@SCALPER_ALERTS.handler('airdrop')
 def handle_airdrop_alert(alert_data: dict):
     """Handle airdrop opportunity alert"""
     airdrop_name = alert_data.get('name', 'Unknown Airdrop')
     website = alert_data.get('website', '')
     value_estimate = alert_data.get('value_estimate', 'TBD')
     
-    personality = random.choice([
-        "Free caps detected. The wasteland provides.",
-        "Vault-Tec Airdrop Alert: Opportunity incoming.",
-        "FizzCo Intelligence: Legitimate airdrop found.",
-        "The Overseer approves this distribution.",
-        "Claim your share of the wasteland economy."
-    ])
-    
-    message = (
-        f"🎁 AIRDROP OPPORTUNITY 🎁\n\n"
-        f"Project: {airdrop_name}\n"
-        f"Est. Value: {value_estimate}\n"
-        f"Link: {website}\n\n"
-        f"{personality}\n\n"
-        f"Verify legitimacy • DYOR\n\n"
-        f"🎮 {GAME_LINK}"
+    message = render_tweet(
+        'airdrop', ('airdrop_short', {'airdrop_name': Shrinkable(airdrop_name, min_weight=10)}),
+        airdrop_name=airdrop_name, value_estimate=value_estimate, website=website
     )
     
-    try:
-        if len(message) > TWITTER_CHAR_LIMIT:
-            message = (
-                f"🎁 {airdrop_name}\n"
-                f"Value: {value_estimate}\n\n"
-                f"{personality}\n\n"
-                f"{website}\n"
-                f"{GAME_LINK}"
-            )[:TWITTER_CHAR_LIMIT]
-        
-        client.create_tweet(text=message)
-        logging.info(f"Posted airdrop alert for {airdrop_name}")
-    except tweepy.TweepyException as e:
-        logging.error(f"Failed to post airdrop alert: {e}")
+    enqueue_post(message, POST_PRIORITY_ALERT, f"airdrop alert for {airdrop_name}", job="token_scalper_alert")
 
 # ------------------------------------------------------------
 # FILES & MEDIA
@@ -1689,23 +2832,123 @@ def load_json_set(filename):
     return set()
 
 def save_json_set(data, filename):
-    with open(filename, 'w') as f:
+    # Write to a temp file and swap it in so a crash never leaves a torn file
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, 'w') as f:
         json.dump(list(data), f)
+    os.replace(tmp_filename, filename)
+
+MEDIA_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.mp4')
+MEDIA_POOL_SIZE = int(os.getenv('MEDIA_POOL_SIZE', '3'))  # pre-uploaded media ids kept ready
+MEDIA_DEFAULT_TTL = 24 * 3600   # Twitter media ids expire a day after upload
+MEDIA_EXPIRY_MARGIN = 3600      # discard ids an hour before Twitter does
+MEDIA_REFILL_INTERVAL = 10      # minutes between scheduled pool top-ups
+
+
+class MediaCatalog:
+    """Index of MEDIA_FOLDER, rescanned only when the directory changes (thread-safe)."""
+
+    def __init__(self, folder):
+        self._folder = folder
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._files = []
+
+    def files(self):
+        """Return the current list of media file paths."""
+        try:
+            mtime = os.stat(self._folder).st_mtime_ns
+        except OSError:
+            return []
+        with self._lock:
+            if mtime != self._mtime:
+                self._files = [
+                    os.path.join(self._folder, f) for f in sorted(os.listdir(self._folder))
+                    if f.lower().endswith(MEDIA_EXTENSIONS)
+                ]
+                self._mtime = mtime
+                logging.info(f"Media catalog indexed: {len(self._files)} files")
+            return list(self._files)
+
+
+class MediaPool:
+    """
+    Pre-uploaded media ids ready to attach to a broadcast (thread-safe)
+
+    Uploads happen on a background thread, so the broadcast path only pops
+    an id that Twitter already has. Ids are single-use and dropped before
+    they expire; failed uploads are retried on the next refill.
+    """
+
+    def __init__(self, catalog, size):
+        self._catalog = catalog
+        self._size = size
+        self._lock = threading.Lock()
+        self._ready = []  # (media_id, path, expires_at)
+        self._refilling = False
+
+    def take(self):
+        """Pop a valid pre-uploaded media id, or None if the pool is empty."""
+        with self._lock:
+            self._prune_locked()
+            entry = self._ready.pop(random.randrange(len(self._ready))) if self._ready else None
+        self.kick()
+        return entry[0] if entry else None
+
+    def kick(self):
+        """Start a background refill unless one is already running."""
+        with self._lock:
+            if self._refilling or not api_v1:
+                return
+            self._refilling = True
+        threading.Thread(target=self.refill, daemon=True).start()
+
+    def refill(self):
+        """Upload media until the pool is full (runs off the broadcast path)."""
+        try:
+            files = self._catalog.files()
+            if not files:
+                return
+            with self._lock:
+                self._prune_locked()
+                missing = self._size - len(self._ready)
+                pooled = {path for _, path, _ in self._ready}
+            # Prefer files not already in the pool so broadcasts stay varied
+            choices = [f for f in files if f not in pooled] or files
+            for path in random.sample(choices, min(missing, len(choices))):
+                try:
+                    media = api_v1.media_upload(path)
+                except Exception as e:
+                    logging.error(f"Media upload failed for {path}: {e}")
+                    continue
+                ttl = getattr(media, 'expires_after_secs', None) or MEDIA_DEFAULT_TTL
+                with self._lock:
+                    self._ready.append((media.media_id_string, path, time.time() + ttl - MEDIA_EXPIRY_MARGIN))
+                logging.debug(f"Pre-uploaded media {path}")
+        finally:
+            with self._lock:
+                self._refilling = False
+
+    def get_stats(self):
+        with self._lock:
+            self._prune_locked()
+            return {'ready': len(self._ready), 'target': self._size, 'refilling': self._refilling}
+
+    def _prune_locked(self):
+        now = time.time()
+        current = set(self._catalog.files())
+        self._ready = [
+            entry for entry in self._ready
+            if entry[2] > now and entry[1] in current
+        ]
+
+
+MEDIA_CATALOG = MediaCatalog(MEDIA_FOLDER)
+MEDIA_POOL = MediaPool(MEDIA_CATALOG, MEDIA_POOL_SIZE)
 
 def get_random_media_id():
-    media_files = [
-        f for f in os.listdir(MEDIA_FOLDER)
-        if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.mp4'))
-    ]
-    if not media_files:
-        return None
-    media_path = os.path.join(MEDIA_FOLDER, random.choice(media_files))
-    try:
-        media = api_v1.media_upload(media_path)
-        return media.media_id_string
-    except Exception as e:
-        logging.error(f"Media upload failed: {e}")
-        return None
+    """Take a pre-uploaded media id from the pool (no upload on the hot path)."""
+    return MEDIA_POOL.take()
 
 # ------------------------------------------------------------
 # OVERSEER PERSONALITY TONES
@@ -1890,6 +3133,479 @@ THREAT_LEVELS = [
     {'level': 'PURPLE', 'desc': 'EXTREME DANGER. Recommend immediate evacuation or prayer.'}
 ]
 
+# ------------------------------------------------------------
+# TWEET TEMPLATE ENGINE - LENGTH-BUCKETED CONTENT
+# ------------------------------------------------------------
+# Twitter limits tweets by weighted length, not len(): URLs always count 23,
+# an emoji sequence counts 2, and characters outside the Latin/punctuation
+# ranges below count 2. Templates and content pools are measured once at
+# startup so a fitting tweet is assembled in one step.
+TWITTER_URL_WEIGHT = 23
+TWITTER_EMOJI_WEIGHT = 2
+URL_PATTERN = re.compile(r'https?://\S+')
+_EMOJI_BASE = (
+    '\u00a9\u00ae\u203c\u2049\u2122\u2139\u2190-\u21ff\u2300-\u23ff\u24c2'
+    '\u25a0-\u25ff\u2600-\u27bf\u2934\u2935\u2b00-\u2bff\u3030\u303d\u3297\u3299'
+    '\U0001f000-\U0001faff'
+)
+_EMOJI_MODIFIERS = '\ufe0e\ufe0f\U0001f3fb-\U0001f3ff\U000e0020-\U000e007f'
+EMOJI_PATTERN = re.compile(
+    '[\U0001f1e6-\U0001f1ff]{2}'                          # flags
+    '|[0-9#*]\ufe0f?\u20e3'                               # keycaps
+    f'|[{_EMOJI_BASE}][{_EMOJI_MODIFIERS}]*'
+    f'(?:\u200d[{_EMOJI_BASE}][{_EMOJI_MODIFIERS}]*)*'    # ZWJ sequences
+)
+# Characters that count 2 (everything outside twitter-text's weight-1 ranges)
+HEAVY_CHAR_PATTERN = re.compile('[^\u0000-\u10ff\u2000-\u200d\u2010-\u201f\u2032-\u2037]')
+TRUNCATION_MARK = '\u2026'
+
+# Folded into templates at compile time
+TEMPLATE_CONSTANTS = {
+    'game_link': GAME_LINK,
+    'bot_name': BOT_NAME,
+    'vault_number': VAULT_NUMBER
+}
+
+
+def twitter_weighted_length(text):
+    """Length of text as Twitter counts it against TWITTER_CHAR_LIMIT."""
+    text, url_count = URL_PATTERN.subn('', text)
+    text, emoji_count = EMOJI_PATTERN.subn('', text)
+    return (
+        url_count * TWITTER_URL_WEIGHT
+        + emoji_count * TWITTER_EMOJI_WEIGHT
+        + len(text) + len(HEAVY_CHAR_PATTERN.findall(text))
+    )
+
+
+def truncate_to_weight(text, max_weight):
+    """Shorten text (with a trailing '…') until its weighted length fits."""
+    if twitter_weighted_length(text) <= max_weight:
+        return text
+    kept = []
+    weight = twitter_weighted_length(TRUNCATION_MARK)
+    for char in text:
+        char_weight = 2 if HEAVY_CHAR_PATTERN.match(char) else 1
+        if weight + char_weight > max_weight:
+            break
+        kept.append(char)
+        weight += char_weight
+    result = ''.join(kept).rstrip() + TRUNCATION_MARK
+    # Per-character weights undercount short URLs; trim until Twitter agrees
+    while kept and twitter_weighted_length(result) > max_weight:
+        kept.pop()
+        result = ''.join(kept).rstrip() + TRUNCATION_MARK
+    return result if kept else ''
+
+
+class FragmentPool:
+    """Content fragments indexed by weighted length for one-step fitting."""
+
+    def __init__(self, fragments):
+        measured = sorted((twitter_weighted_length(f), f) for f in fragments)
+        self._weights = [weight for weight, _ in measured]
+        self._fragments = [fragment for _, fragment in measured]
+
+    @property
+    def min_weight(self):
+        return self._weights[0] if self._weights else 0
+
+    def choose(self, max_weight):
+        """Random fragment no heavier than max_weight, as (text, weight), or None."""
+        count = bisect.bisect_right(self._weights, max_weight)
+        if not count:
+            return None
+        index = random.randrange(count)
+        return self._fragments[index], self._weights[index]
+
+
+class Shrinkable:
+    """
+    A runtime value that may be shortened to fit the space left over.
+
+    Strings are truncated with '…'; lists are joined with `separator` and
+    lose whole lines from the end. `min_weight` is the smallest acceptable
+    result (for lists, at least one line is always required).
+    """
+
+    def __init__(self, value, min_weight=1, separator='\n'):
+        self.value = value
+        self.min_weight = min_weight
+        self.separator = separator
+
+    def fit(self, max_weight):
+        if isinstance(self.value, list):
+            for count in range(len(self.value), 0, -1):
+                text = self.separator.join(self.value[:count])
+                weight = twitter_weighted_length(text)
+                if weight <= max_weight:
+                    return text, weight
+            return None
+        weight = twitter_weighted_length(self.value)
+        if weight <= max_weight:
+            return self.value, weight
+        if max_weight < self.min_weight:
+            return None
+        text = truncate_to_weight(self.value, max_weight)
+        return (text, twitter_weighted_length(text)) if text else None
+
+
+class TweetTemplate:
+    """
+    A tweet layout compiled once: constants folded in, fixed text measured.
+
+    Fields are filled from keyword values or, when not given, from the
+    CONTENT_POOLS entry of the same name. Plain values are formatted as-is,
+    FragmentPool values get a random fragment that fits, and Shrinkable
+    values absorb whatever space is left.
+    """
+
+    def __init__(self, layout):
+        self.parts = []  # (literal, slot) where slot = (field, spec, conversion) or None
+        literal = ''
+        for text, field, spec, conversion in string.Formatter().parse(layout):
+            literal += text
+            if field is None:
+                continue
+            if field in TEMPLATE_CONSTANTS:
+                literal += format(TEMPLATE_CONSTANTS[field], spec or '')
+                continue
+            self.parts.append((literal, (field, spec or '', conversion)))
+            literal = ''
+        self.parts.append((literal, None))
+        self.fixed_weight = twitter_weighted_length(''.join(text for text, _ in self.parts))
+        self.slots = {}  # slot -> occurrences
+        for _, slot in self.parts:
+            if slot:
+                self.slots[slot] = self.slots.get(slot, 0) + 1
+
+    def render(self, limit=TWITTER_CHAR_LIMIT, **values):
+        """Return the filled tweet, or None if it cannot fit within limit."""
+        budget = limit - self.fixed_weight
+        resolved, pools, shrinkables = {}, [], []
+        for slot, count in self.slots.items():
+            field, spec, conversion = slot
+            value = values[field] if field in values else CONTENT_POOLS[field]
+            if isinstance(value, FragmentPool):
+                pools.append((slot, count, value))
+            elif isinstance(value, Shrinkable):
+                shrinkables.append((slot, count, value))
+            else:
+                if conversion == 'r':
+                    value = repr(value)
+                elif conversion == 's':
+                    value = str(value)
+                text = format(value, spec)
+                resolved[slot] = text
+                budget -= twitter_weighted_length(text) * count
+        if budget < 0:
+            return None
+
+        # Pools first, keeping room for the smallest option of every later slot
+        pending = [(slot, count, value, 'pool') for slot, count, value in pools]
+        pending += [(slot, count, value, 'shrink') for slot, count, value in shrinkables]
+        reserved = sum(value.min_weight * count for _, count, value, _ in pending)
+        for slot, count, value, kind in pending:
+            reserved -= value.min_weight * count
+            available = (budget - reserved) // count
+            chosen = value.choose(available) if kind == 'pool' else value.fit(available)
+            if chosen is None:
+                return None
+            resolved[slot], weight = chosen
+            budget -= weight * count
+
+        return ''.join(text + (resolved[slot] if slot else '') for text, slot in self.parts)
+
+
+def render_tweet(*names, **values):
+    """
+    Render the first of the named templates that fits the tweet limit.
+
+    A name may also be a (name, overrides) tuple whose values replace the
+    shared ones for that template only. Renders that match a recent post
+    (see RECENT_POSTS) are drawn again, up to DEDUPE_RERENDER_ATTEMPTS times.
+    """
+    templates = [
+        (entry, {}) if isinstance(entry, str) else entry
+        for entry in names
+    ]
+    for _ in range(DEDUPE_RERENDER_ATTEMPTS):
+        message = _render_first_fit(templates, values)
+        if not RECENT_POSTS.is_duplicate(message, 'rerendered'):
+            return message
+    logging.warning(f"Could not render a fresh {templates[0][0]}; every attempt was a recent duplicate")
+    return message
+
+def _render_first_fit(templates, values):
+    for name, overrides in templates:
+        message = TWEET_TEMPLATES[name].render(**dict(values, **overrides))
+        if message is not None:
+            return message
+    name, overrides = templates[-1]
+    logging.warning(f"No template fits for {templates[0][0]}; truncating")
+    return truncate_to_weight(
+        TWEET_TEMPLATES[name].render(limit=10 ** 6, **dict(values, **overrides)),
+        TWITTER_CHAR_LIMIT
+    )
+
+
+# Personality lines used by the market and Token-scalper alert templates
+MARKET_ALERT_LINES = [
+    "The wasteland economy shifts.",
+    "Market radiation detected.",
+    "FizzCo Analytics reporting.",
+    "Vault-Tec market surveillance active.",
+    "The caps flow differently now."
+]
+
+MARKET_SUMMARY_LINES = [
+    "The economy glows. Caps flow.",
+    "Market surveillance: nominal.",
+    "Vault-Tec approves these numbers.",
+    "FizzCo Industries: Making caps sparkle."
+]
+
+RUG_PULL_LINES = [
+    "The wasteland claims another scam.",
+    "Vault-Tec Market Surveillance detected suspicious activity.",
+    "FizzCo Intelligence: Threat confirmed.",
+    "Overseer protocols: Avoid this contamination.",
+    "The caps aren't worth the radiation here."
+]
+
+HIGH_POTENTIAL_LINES = [
+    "Opportunity detected in the wasteland.",
+    "FizzCo Analytics: Potential moonshot identified.",
+    "Vault-Tec recommends: Investigation warranted.",
+    "The Overseer sees potential here.",
+    "Caps flow toward opportunity."
+]
+
+AIRDROP_LINES = [
+    "Free caps detected. The wasteland provides.",
+    "Vault-Tec Airdrop Alert: Opportunity incoming.",
+    "FizzCo Intelligence: Legitimate airdrop found.",
+    "The Overseer approves this distribution.",
+    "Claim your share of the wasteland economy."
+]
+
+CONTENT_POOLS = {
+    'lore': FragmentPool(LORES),
+    'threat': FragmentPool(THREATS),
+    'event': FragmentPool(FACTION_EVENTS + WASTELAND_EVENTS),
+    'faction_event': FragmentPool(FACTION_EVENTS),
+    'vault_log': FragmentPool(VAULT_LOGS),
+    'fizzco_ad': FragmentPool(FIZZCO_ADS),
+    'survivor_note': FragmentPool(SURVIVOR_NOTES),
+    'deep_lore': FragmentPool(DEEP_LORE),
+    'market_alert_line': FragmentPool(MARKET_ALERT_LINES),
+    'market_summary_line': FragmentPool(MARKET_SUMMARY_LINES),
+    'rug_pull_line': FragmentPool(RUG_PULL_LINES),
+    'high_potential_line': FragmentPool(HIGH_POTENTIAL_LINES),
+    'airdrop_line': FragmentPool(AIRDROP_LINES)
+}
+for _tone, _lines in PERSONALITY_TONES.items():
+    CONTENT_POOLS[f"tone_{_tone}"] = FragmentPool(_lines)
+
+LORE_DROP_POOLS = ['vault_log', 'fizzco_ad', 'survivor_note', 'deep_lore', 'lore']
+
+def get_personality_pool():
+    """Content pool for a randomly picked personality tone (see pick_tone)."""
+    return CONTENT_POOLS[f"tone_{pick_tone()}"]
+
+TWEET_TEMPLATES = {name: TweetTemplate(layout) for name, layout in {
+    # Broadcasts
+    'broadcast_status_report': (
+        "☢️ OVERSEER STATUS REPORT ☢️\n\n"
+        "📡 {time_phrase}\n\n"
+        "⚠️ {event}\n\n"
+        "{threat}\n\n"
+        "🎮 {game_link}"
+    ),
+    'broadcast_event_alert': (
+        "🚨 ALERT LEVEL RED 🚨\n\n"
+        "{event}\n\n"
+        "{personality}\n\n"
+        "First to claim wins: {game_link}"
+    ),
+    'broadcast_lore_drop': (
+        "📜 WASTELAND ARCHIVES 📜\n\n"
+        "{lore_drop}\n\n"
+        "{lore}\n\n"
+        "🎮 {game_link}"
+    ),
+    'broadcast_threat_scan': (
+        "🔍 THREAT SCAN COMPLETE 🔍\n\n"
+        "Status: {threat_level}\n"
+        "{threat_desc}\n\n"
+        "{time_phrase}\n\n"
+        "Stay vigilant: {game_link}"
+    ),
+    'broadcast_faction_news': (
+        "📻 FACTION INTEL 📻\n\n"
+        "{faction_event}\n\n"
+        "Cross-timeline activity detected.\n"
+        "{lore}\n\n"
+        "🎮 {game_link}"
+    ),
+    'broadcast_fizzco_ad': (
+        "📺 FIZZCO INDUSTRIES™ PRESENTS 📺\n\n"
+        "{fizzco_ad}\n\n"
+        "Brought to you by Vault-Tec.\n"
+        "☢️ {game_link}"
+    ),
+    'broadcast_vault_log': (
+        "🔐 VAULT 77 ARCHIVES 🔐\n\n"
+        "{vault_log}\n\n"
+        "{tone_ominous}\n\n"
+        "🎮 {game_link}"
+    ),
+    'broadcast_philosophical': (
+        "💭 OVERSEER REFLECTION 💭\n\n"
+        "{lore}\n\n"
+        "{deep}\n\n"
+        "🎮 {game_link}"
+    ),
+    'broadcast_fallback': (
+        "☢️ {event}\n\n"
+        "{lore}\n\n"
+        "{game_link}"
+    ),
+    'diagnostic': (
+        "☢️ OVERSEER DIAGNOSTIC ☢️\n\n"
+        "System Status: ONLINE\n"
+        "Vault 77 Uplink: STABLE\n"
+        "Threat Level: {threat_level}\n\n"
+        "{lore}\n\n"
+        "🎮 {game_link}"
+    ),
+    # Market
+    'price_alert_market': (
+        "🔔 MARKET ALERT {emoji}\n\n"
+        "${token_name} {direction}: {price_change:+.2f}%\n"
+        "Current: ${price:.2f}\n"
+        "24h Change: {change_24h:+.2f}%\n\n"
+        "{market_alert_line}\n\n"
+        "🎮 {game_link}"
+    ),
+    'price_alert_movement': (
+        "⚡ PRICE MOVEMENT DETECTED {emoji}\n\n"
+        "Token: ${token_name}\n"
+        "Change: {price_change:+.2f}%\n"
+        "Price: ${price:.2f}\n\n"
+        "{lore}\n\n"
+        "🎮 {game_link}"
+    ),
+    'price_alert_fallback': (
+        "🔔 ${token_name} {direction}: {price_change:+.2f}% {trend}\n"
+        "Price: ${price:.2f}\n\n"
+        "The wasteland economy shifts.\n\n"
+        "{game_link}"
+    ),
+    'market_summary': (
+        "📊 WASTELAND MARKET REPORT 📊\n\n"
+        "{lines}\n\n"
+        "{market_summary_line}\n\n"
+        "🎮 {game_link}"
+    ),
+    'market_summary_short': (
+        "📊 WASTELAND MARKET REPORT 📊\n"
+        "{lines}\n\n"
+        "{market_summary_line}\n\n"
+        "{game_link}"
+    ),
+    # Token-scalper alerts
+    'rug_pull': (
+        "{emoji} RUG PULL WARNING {emoji}\n\n"
+        "Token: {token_name}\n"
+        "Contract: {address}\n"
+        "Severity: {severity}{safety}\n\n"
+        "{details}\n\n"
+        "{rug_pull_line}\n\n"
+        "#RugPull #CryptoScam #StaySafe\n\n"
+        "🎮 {game_link}"
+    ),
+    'rug_pull_short': (
+        "{emoji} RUG PULL WARNING {emoji}\n\n"
+        "{token_name}: {details}\n\n"
+        "{rug_pull_line}\n\n"
+        "{game_link}"
+    ),
+    'high_potential': (
+        "🚀 HIGH POTENTIAL TOKEN 🚀\n\n"
+        "Token: {token_name}\n"
+        "Score: {score}/100{safety}\n"
+        "Signals: {reasons}\n\n"
+        "{high_potential_line}\n\n"
+        "DYOR • Not Financial Advice\n\n"
+        "🎮 {game_link}"
+    ),
+    'high_potential_short': (
+        "🚀 {token_name} - Score: {score}/100\n\n"
+        "{high_potential_line}\n\n"
+        "DYOR • NFA\n"
+        "{game_link}"
+    ),
+    'airdrop': (
+        "🎁 AIRDROP OPPORTUNITY 🎁\n\n"
+        "Project: {airdrop_name}\n"
+        "Est. Value: {value_estimate}\n"
+        "Link: {website}\n\n"
+        "{airdrop_line}\n\n"
+        "Verify legitimacy • DYOR\n\n"
+        "🎮 {game_link}"
+    ),
+    'airdrop_short': (
+        "🎁 {airdrop_name}\n"
+        "Value: {value_estimate}\n\n"
+        "{airdrop_line}\n\n"
+        "{website}\n"
+        "{game_link}"
+    ),
+    # Game events
+    'overseer_update': (
+        "☢️ {bot_name} UPDATE ☢️\n\n"
+        "{text}\n\n"
+        "{personality}\n\n"
+        "{game_link}"
+    ),
+    'overseer_update_short': (
+        "☢️ {text}\n\n"
+        "{game_link}"
+    ),
+    # Activation
+    'activation_activated': (
+        "☢️ {bot_name} ACTIVATED ☢️\n\n"
+        "Vault {vault_number} uplink established.\n"
+        "Cross-timeline synchronization complete.\n"
+        "The Mojave remembers. The wasteland awaits.\n\n"
+        "{lore}\n\n"
+        "🎮 {game_link}"
+    ),
+    'activation_boot': (
+        "🔌 SYSTEM BOOT COMPLETE 🔌\n\n"
+        "{bot_name} online.\n"
+        "Neural echo stable. Memory fragments intact.\n"
+        "Scanning wasteland frequencies...\n\n"
+        "{personality}\n\n"
+        "🎮 {game_link}"
+    ),
+    'activation_signal': (
+        "📡 SIGNAL RESTORED 📡\n\n"
+        "Vault {vault_number} Overseer Terminal active.\n"
+        "Atomic Fizz Caps economy: operational.\n"
+        "Scavenger protocols: engaged.\n\n"
+        "{lore}\n\n"
+        "🎮 {game_link}"
+    ),
+    'activation_fallback': (
+        "☢️ {bot_name} ONLINE ☢️\n\n"
+        "Vault {vault_number} uplink: ACTIVE\n"
+        "{lore}\n\n"
+        "🎮 {game_link}"
+    )
+}.items()}
+
 # ------------------------------------------------------------
 # LLM SUPPORT - ENHANCED FOR OVERSEER PERSONALITY
 # ------------------------------------------------------------
@@ -1916,7 +3632,7 @@ def generate_llm_response(prompt, max_tokens=100):
         headers = {"Authorization": f"Bearer {HUGGING_FACE_TOKEN}"}
         full_prompt = f"{OVERSEER_SYSTEM_PROMPT}\n\nUser: {prompt}\nOverseer:"
         data = {"inputs": full_prompt, "parameters": {"max_new_tokens": max_tokens}}
-        response = requests.post(url, headers=headers, json=data, timeout=HUGGING_FACE_TIMEOUT)
+        response = http_client.post(url, headers=headers, json=data, timeout=HUGGING_FACE_TIMEOUT)
         if response.status_code == 200:
             result = response.json()
             if isinstance(result, list) and len(result) > 0:
@@ -1928,26 +3644,100 @@ def generate_llm_response(prompt, max_tokens=100):
 # ------------------------------------------------------------
 # EVENT BRIDGE (FROM WALLET) - ENHANCED WITH PERSONALITY
 # ------------------------------------------------------------
+# High-volume event types are collected for a short window and posted as one
+# digest, so write calls stay at one per type per window however busy the
+# game gets. An event sent with "immediate": true skips the window.
+EVENT_COALESCE_WINDOW = int(os.getenv('EVENT_COALESCE_WINDOW', '120'))  # seconds
+EVENT_COALESCE_WINDOWS = {
+    'swap': EVENT_COALESCE_WINDOW,
+    'nft': EVENT_COALESCE_WINDOW,
+    'claim': EVENT_COALESCE_WINDOW,
+    'level_up': EVENT_COALESCE_WINDOW
+}
+EVENT_COALESCE_MAX_EVENTS = 200  # events kept per window; the rest are only counted
+EVENT_DIGEST_MAX_NAMES = 3       # items named in a digest before "+N more"
+
+
+class EventCoalescer:
+    """
+    Collects bursts of same-type events and flushes them as one post (thread-safe)
+
+    The first event of a type opens a window of EVENT_COALESCE_WINDOWS[type]
+    seconds; when it closes, a single event is posted as usual and several
+    are summarised by the type's digest builder.
+    """
+
+    def __init__(self, windows):
+        self._windows = windows
+        self._lock = threading.Lock()
+        self._pending = {}  # type -> {'events': [...], 'count': n, 'opened_at': ts}
+        self._stats = {etype: {'events': 0, 'posts': 0, 'failed': 0} for etype in windows}
+
+    def handles(self, event):
+        return event.get("type") in self._windows and not event.get("immediate")
+
+    def add(self, event):
+        etype = event["type"]
+        with self._lock:
+            self._stats[etype]['events'] += 1
+            window = self._pending.get(etype)
+            if window is None:
+                window = {'events': [], 'count': 0, 'opened_at': time.time()}
+                self._pending[etype] = window
+                timer = threading.Timer(self._windows[etype], self.flush, args=(etype,))
+                timer.daemon = True
+                timer.start()
+            window['count'] += 1
+            if len(window['events']) < EVENT_COALESCE_MAX_EVENTS:
+                window['events'].append(event)
+
+    def flush(self, etype):
+        with self._lock:
+            window = self._pending.pop(etype, None)
+            if window is None:
+                return
+        try:
+            if window['count'] == 1:
+                # Already past the middleware; only the handler is left to run
+                GAME_EVENTS.dispatch(window['events'][0])
+            else:
+                build_digest = EVENT_DIGEST_BUILDERS[etype]
+                post_overseer_update(build_digest(window['events'], window['count']))
+                logging.info(f"Coalesced {window['count']} {etype} events into one digest")
+            outcome = 'posts'
+        except Exception as e:
+            logging.error(f"Failed to flush {etype} events: {e}")
+            outcome = 'failed'
+        with self._lock:
+            self._stats[etype][outcome] += 1
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                etype: dict(
+                    stats,
+                    window_seconds=self._windows[etype],
+                    pending=self._pending[etype]['count'] if etype in self._pending else 0
+                )
+                for etype, stats in self._stats.items()
+            }
+
+
+EVENT_COALESCER = EventCoalescer(EVENT_COALESCE_WINDOWS)
+
+@GAME_EVENTS.middleware('coalesce')
+def coalesce_event_bursts(event):
+    """Absorb high-volume event types into the current digest window."""
+    if not EVENT_COALESCER.handles(event):
+        return event
+    EVENT_COALESCER.add(event)
+    logging.info(f"Overseer queued {event['type']} event for digest")
+    return None
+
 def overseer_event_bridge(event: dict):
     """Process events from the game wallet with Overseer personality."""
     try:
-        etype = event.get("type")
-
-        if etype == "perk":
-            handle_perk_event(event)
-        elif etype == "quest":
-            handle_quest_event(event)
-        elif etype == "swap":
-            handle_swap_event(event)
-        elif etype == "moonpay":
-            handle_moonpay_event(event)
-        elif etype == "nft":
-            handle_nft_event(event)
-        elif etype == "claim":
-            handle_claim_event(event)
-        elif etype == "level_up":
-            handle_level_up_event(event)
-
+        GAME_EVENTS.process(event)
         logging.info(f"Overseer processed event: {event}")
 
     except KeyError as e:
@@ -1956,18 +3746,14 @@ def overseer_event_bridge(event: dict):
         logging.error(f"Overseer event bridge - type error: {e}")
 
 def post_overseer_update(text):
-    """Post an update with Overseer branding."""
-    try:
-        personality_tag = get_personality_line()
-        full_text = f"☢️ {BOT_NAME} UPDATE ☢️\n\n{text}\n\n{personality_tag}\n\n{GAME_LINK}"
-        # Truncate if too long for Twitter
-        if len(full_text) > TWITTER_CHAR_LIMIT:
-            full_text = f"☢️ {text}\n\n{GAME_LINK}"[:TWITTER_CHAR_LIMIT]
-        client.create_tweet(text=full_text)
-        logging.info(f"Posted Overseer update: {text}")
-    except tweepy.TweepyException as e:
-        logging.error(f"Failed to post Overseer update: {e}")
+    """Queue an update with Overseer branding."""
+    full_text = render_tweet(
+        'overseer_update', ('overseer_update_short', {'text': Shrinkable(text)}),
+        text=text, personality=get_personality_pool()
+    )
+    enqueue_post(full_text, POST_PRIORITY_BROADCAST, f"Overseer update: {text}", job="overseer_event")
 
+@GAME_EVENTS.handler('perk')
 def handle_perk_event(event):
     """Handle perk unlock events with personality."""
     perk = event.get("perk", "Unknown Perk")
@@ -1979,6 +3765,7 @@ def handle_perk_event(event):
     ]
     post_overseer_update(random.choice(messages))
 
+@GAME_EVENTS.handler('quest')
 def handle_quest_event(event):
     """Handle quest trigger events."""
     code = event.get('code', 'UNKNOWN')
@@ -1990,6 +3777,7 @@ def handle_quest_event(event):
     ]
     post_overseer_update(random.choice(messages))
 
+@GAME_EVENTS.handler('swap')
 def handle_swap_event(event):
     """Handle token swap events."""
     amount = event.get('amount', '?')
@@ -2002,6 +3790,7 @@ def handle_swap_event(event):
     ]
     post_overseer_update(random.choice(messages))
 
+@GAME_EVENTS.handler('moonpay')
 def handle_moonpay_event(event):
     """Handle MoonPay funding events."""
     amount = event.get('amount', '?')
@@ -2012,6 +3801,7 @@ def handle_moonpay_event(event):
     ]
     post_overseer_update(random.choice(messages))
 
+@GAME_EVENTS.handler('nft')
 def handle_nft_event(event):
     """Handle NFT events."""
     action = event.get('action', 'detected')
@@ -2023,6 +3813,7 @@ def handle_nft_event(event):
     ]
     post_overseer_update(random.choice(messages))
 
+@GAME_EVENTS.handler('claim')
 def handle_claim_event(event):
     """Handle location claim events."""
     location = event.get('location', 'Unknown Location')
@@ -2034,6 +3825,7 @@ def handle_claim_event(event):
     ]
     post_overseer_update(random.choice(messages))
 
+@GAME_EVENTS.handler('level_up')
 def handle_level_up_event(event):
     """Handle player level up events."""
     level = event.get('level', '?')
@@ -2045,6 +3837,62 @@ def handle_level_up_event(event):
     ]
     post_overseer_update(random.choice(messages))
 
+def summarize_names(names, total):
+    """'a, b, c +N more' for the first EVENT_DIGEST_MAX_NAMES distinct names."""
+    distinct = list(dict.fromkeys(str(name) for name in names))
+    shown = distinct[:EVENT_DIGEST_MAX_NAMES]
+    # Events past EVENT_COALESCE_MAX_EVENTS were only counted, not kept
+    extra = len(distinct) - len(shown) + total - len(names)
+    return ', '.join(shown) + (f" +{extra} more" if extra > 0 else '')
+
+def build_swap_digest(events, count):
+    """Digest for a window of swap events."""
+    pairs = {}
+    for event in events:
+        pair = f"{event.get('from', 'UNKNOWN')} → {event.get('to', 'UNKNOWN')}"
+        pairs[pair] = pairs.get(pair, 0) + 1
+    top_pair, top_count = max(pairs.items(), key=lambda item: item[1])
+    return random.choice([
+        f"SWAP SURGE: {count} trades executed. Top route: {top_pair} (x{top_count}). The economy glows.",
+        f"Trade volume spike: {count} swaps logged. Most popular: {top_pair}. Capitalism survives.",
+        f"{count} currency exchanges detected. {top_pair} leads the market. FizzCo approves."
+    ])
+
+def build_nft_digest(events, count):
+    """Digest for a window of NFT events."""
+    names = summarize_names([event.get('name', 'Unknown Item') for event in events], count)
+    return random.choice([
+        f"NFT ACTIVITY: {count} artifacts logged. {names}. The Overseer acknowledges.",
+        f"{count} digital artifacts changed hands: {names}. Logged in Vault-Tec archives."
+    ])
+
+def build_claim_digest(events, count):
+    """Digest for a window of location claim events."""
+    locations = summarize_names([event.get('location', 'Unknown Location') for event in events], count)
+    caps = sum(event.get('caps', 0) for event in events if isinstance(event.get('caps'), (int, float)))
+    caps_line = f" {caps}{'+' if count > len(events) else ''} CAPS distributed." if caps else ''
+    return random.choice([
+        f"LAND RUSH: {count} locations claimed. {locations}.{caps_line} The map updates.",
+        f"{count} territories secured: {locations}.{caps_line} The wasteland is crowded today."
+    ])
+
+def build_level_up_digest(events, count):
+    """Digest for a window of level up events."""
+    players = summarize_names(
+        [f"{event.get('player', 'Dweller')} (Lv {event.get('level', '?')})" for event in events], count
+    )
+    return random.choice([
+        f"MASS ADVANCEMENT: {count} level ups. {players}. Evolution confirmed.",
+        f"{count} dwellers leveled up: {players}. The wasteland notices."
+    ])
+
+EVENT_DIGEST_BUILDERS = {
+    'swap': build_swap_digest,
+    'nft': build_nft_digest,
+    'claim': build_claim_digest,
+    'level_up': build_level_up_digest
+}
+
 # ------------------------------------------------------------
 # BROADCAST + REPLY SYSTEM - ENHANCED WITH FULL PERSONALITY
 # ------------------------------------------------------------
@@ -2061,212 +3909,281 @@ def get_time_phrase():
         return TIME_PHRASES['evening']
     return TIME_PHRASES['night']
 
-def get_random_event():
-    """Get a random event from faction or wasteland events."""
-    all_events = FACTION_EVENTS + WASTELAND_EVENTS
-    return random.choice(all_events)
-
 def get_threat_level():
     """Get a random threat level status."""
     return random.choice(THREAT_LEVELS)
 
-def get_lore_drop():
-    """Get a random lore drop from various categories."""
-    lore_pools = [VAULT_LOGS, FIZZCO_ADS, SURVIVOR_NOTES, DEEP_LORE, LORES]
-    pool = random.choice(lore_pools)
-    return random.choice(pool)
-
 def overseer_broadcast():
     """Main broadcast function with varied message types."""
     if not client:
         logging.debug("Skipping overseer_broadcast: Twitter client not initialized")
         return
+    if not budget_allows(POST_PRIORITY_BROADCAST, "overseer_broadcast"):
+        return
 
     broadcast_type = random.choice([
         'status_report', 'event_alert', 'lore_drop', 'threat_scan',
         'faction_news', 'fizzco_ad', 'vault_log', 'philosophical'
     ])
     
+    # Runtime values per broadcast type; other fields come from CONTENT_POOLS
+    if broadcast_type == 'status_report':
+        values = {'time_phrase': get_time_phrase()}
+    elif broadcast_type == 'event_alert':
+        values = {'personality': get_personality_pool()}
+    elif broadcast_type == 'lore_drop':
+        values = {'lore_drop': CONTENT_POOLS[random.choice(LORE_DROP_POOLS)]}
+    elif broadcast_type == 'threat_scan':
+        threat = get_threat_level()
+        values = {
+            'threat_level': threat['level'],
+            'threat_desc': threat['desc'],
+            'time_phrase': get_time_phrase()
+        }
+    elif broadcast_type == 'philosophical':
+        values = {
+            'deep': CONTENT_POOLS['deep_lore'] if random.random() < 0.3 else get_personality_pool()
+        }
+    else:  # faction_news, fizzco_ad, vault_log
+        values = {}
+    
+    message = render_tweet(f"broadcast_{broadcast_type}", 'broadcast_fallback', **values)
+    
+    media_ids = None
+    if random.random() > 0.4:
+        media_id = get_random_media_id()
+        if media_id:
+            media_ids = [media_id]
+    
+    enqueue_post(
+        message, POST_PRIORITY_BROADCAST, f"broadcast: {broadcast_type}",
+        job="overseer_broadcast",
+        media_ids=media_ids,
+        activity=("BROADCAST", f"{broadcast_type} - {len(message)} chars")
+    )
+    
+
+REPLY_WORKERS = int(os.getenv('REPLY_WORKERS', '4'))  # concurrent reply builders
+PENDING_REPLIES = {}  # mention id -> queued OutboundPost
+PROCESSED_MENTIONS_LOCK = threading.Lock()
+
+def mark_mention_processed(mention_id):
+    """Record a replied-to mention in the processed file (thread-safe)."""
+    with PROCESSED_MENTIONS_LOCK:
+        processed = load_json_set(PROCESSED_MENTIONS_FILE)
+        processed.add(str(mention_id))
+        save_json_set(processed, PROCESSED_MENTIONS_FILE)
+
+def on_reply_sent(post):
+    """Like the mention and mark it processed once its reply is posted."""
+    mention_id = post.in_reply_to_tweet_id
     try:
-        if broadcast_type == 'status_report':
-            # Classic status report with time, event, and call to action
-            message = (
-                f"☢️ OVERSEER STATUS REPORT ☢️\n\n"
-                f"📡 {get_time_phrase()}\n\n"
-                f"⚠️ {get_random_event()}\n\n"
-                f"{random.choice(THREATS)}\n\n"
-                f"🎮 {GAME_LINK}"
-            )
-        
-        elif broadcast_type == 'event_alert':
-            # Breaking news style event
-            event = get_random_event()
-            personality = get_personality_line()
-            message = (
-                f"🚨 ALERT LEVEL RED 🚨\n\n"
-                f"{event}\n\n"
-                f"{personality}\n\n"
-                f"First to claim wins: {GAME_LINK}"
-            )
-        
-        elif broadcast_type == 'lore_drop':
-            # Lore/story content
-            lore = get_lore_drop()
-            message = (
-                f"📜 WASTELAND ARCHIVES 📜\n\n"
-                f"{lore}\n\n"
-                f"{random.choice(LORES)}\n\n"
-                f"🎮 {GAME_LINK}"
-            )
-        
-        elif broadcast_type == 'threat_scan':
-            # Threat level update
-            threat = get_threat_level()
-            message = (
-                f"🔍 THREAT SCAN COMPLETE 🔍\n\n"
-                f"Status: {threat['level']}\n"
-                f"{threat['desc']}\n\n"
-                f"{get_time_phrase()}\n\n"
-                f"Stay vigilant: {GAME_LINK}"
-            )
-        
-        elif broadcast_type == 'faction_news':
-            # Faction-specific news
-            faction_event = random.choice(FACTION_EVENTS)
-            message = (
-                f"📻 FACTION INTEL 📻\n\n"
-                f"{faction_event}\n\n"
-                f"Cross-timeline activity detected.\n"
-                f"{random.choice(LORES)}\n\n"
-                f"🎮 {GAME_LINK}"
-            )
-        
-        elif broadcast_type == 'fizzco_ad':
-            # Corporate advertisement style
-            ad = random.choice(FIZZCO_ADS)
-            message = (
-                f"📺 FIZZCO INDUSTRIES™ PRESENTS 📺\n\n"
-                f"{ad}\n\n"
-                f"Brought to you by Vault-Tec.\n"
-                f"☢️ {GAME_LINK}"
-            )
-        
-        elif broadcast_type == 'vault_log':
-            # Vault log discovery
-            log = random.choice(VAULT_LOGS)
-            message = (
-                f"🔐 VAULT 77 ARCHIVES 🔐\n\n"
-                f"{log}\n\n"
-                f"{random.choice(PERSONALITY_TONES['ominous'])}\n\n"
-                f"🎮 {GAME_LINK}"
-            )
-        
-        else:  # philosophical
-            # Deep thoughts from the Overseer
-            lore = random.choice(LORES)
-            deep = random.choice(DEEP_LORE) if random.random() < 0.3 else get_personality_line()
-            message = (
-                f"💭 OVERSEER REFLECTION 💭\n\n"
-                f"{lore}\n\n"
-                f"{deep}\n\n"
-                f"🎮 {GAME_LINK}"
-            )
-        
-        # Ensure message fits Twitter's character limit
-        if len(message) > TWITTER_CHAR_LIMIT:
-            # Fallback to shorter format
-            message = (
-                f"☢️ {get_random_event()}\n\n"
-                f"{random.choice(LORES)}\n\n"
-                f"{GAME_LINK}"
-            )[:TWITTER_CHAR_LIMIT]
-        
-        media_ids = None
-        if random.random() > 0.4:
-            media_id = get_random_media_id()
-            if media_id:
-                media_ids = [media_id]
-        
-        client.create_tweet(text=message, media_ids=media_ids)
-        logging.info(f"Broadcast sent: {broadcast_type}")
-        add_activity("BROADCAST", f"{broadcast_type} - {len(message)} chars")
-        
+        client.like(mention_id)
     except tweepy.TweepyException as e:
-        logging.error(f"Broadcast failed: {e}")
-        add_activity("ERROR", f"Broadcast failed: {str(e)}")
+        logging.warning(f"Like failed for mention {mention_id}: {e}")
+    mark_mention_processed(mention_id)
+    PENDING_REPLIES.pop(str(mention_id), None)
+
+def build_mention_reply(mention, username, bot_username):
+    """
+    Build the reply for one mention (runs on the reply worker pool).
+
+    This is where the slow I/O happens: price lookups, honeypot.is checks
+    and the user lookup fallback. Returns (mention, username, user_message,
+    response), or None if the mention should be skipped.
+    """
+    try:
+        if not username:
+            user_data = client.get_user(id=mention.author_id)
+            if not user_data or not user_data.data:
+                return None
+            username = user_data.data.username
+        user_message = mention.text.replace(f"@{bot_username}", "").strip().lower()
+        # Generate contextual response based on user message
+        response = generate_contextual_response(username, user_message)
+        return mention, username, user_message, response
+    except Exception as e:
+        logging.error(f"Failed to build reply for mention {mention.id}: {e}")
+        return None
 
 def overseer_respond():
-    """Respond to mentions with personality-driven responses."""
+    """Queue personality-driven replies to new mentions."""
     if not client:
         logging.debug("Skipping overseer_respond: Twitter client not initialized")
         return
+    if not budget_allows(POST_PRIORITY_REPLY, "overseer_respond"):
+        return
 
     processed = load_json_set(PROCESSED_MENTIONS_FILE)
+    # Forget replies that failed or were dropped so they can be retried
+    for mention_id, post in list(PENDING_REPLIES.items()):
+        if post.status != 'queued':
+            PENDING_REPLIES.pop(mention_id, None)
     try:
         me = client.get_me()
         if not me or not me.data:
             logging.error("Failed to get bot user info")
             return
             
+        # Expand authors so usernames come back with the page instead of
+        # costing one get_user call per mention
         mentions = client.get_users_mentions(
             me.data.id,
             max_results=50,
-            tweet_fields=["author_id", "text"]
+            tweet_fields=["author_id", "text"],
+            expansions=["author_id"],
+            user_fields=["username"]
         )
         
         if not mentions.data:
             return
-            
+
+        usernames = {
+            user.id: user.username
+            for user in (mentions.includes or {}).get('users', [])
+        }
+        candidates = []
         for mention in mentions.data:
             if str(mention.id) in processed:
                 continue
-
-            user_id = mention.author_id
-            user_data = client.get_user(id=user_id)
-            if not user_data or not user_data.data:
+            pending = PENDING_REPLIES.get(str(mention.id))
+            if pending and pending.status == 'queued':
                 continue
-                
-            username = user_data.data.username
-            user_message = mention.text.replace(
-                f"@{me.data.username}", ""
-            ).strip().lower()
+            candidates.append(mention)
 
-            # Generate contextual response based on user message
-            response = generate_contextual_response(username, user_message)
+        # Only build as many replies as the write budget can post; the rest
+        # stay unprocessed for the next run
+        candidates = candidates[:WRITE_BUDGET.available(POST_PRIORITY_REPLY)]
+        if not candidates:
+            return
 
-            try:
-                client.create_tweet(
-                    text=response,
-                    in_reply_to_tweet_id=mention.id
+        # Build replies concurrently; map() yields in mention order, so the
+        # replies enter the FIFO reply lane (and get posted) in order
+        with ThreadPoolExecutor(max_workers=REPLY_WORKERS) as executor:
+            built = executor.map(
+                lambda mention: build_mention_reply(
+                    mention, usernames.get(mention.author_id), me.data.username
+                ),
+                candidates
+            )
+            for result in built:
+                if not result:
+                    continue
+                mention, username, user_message, response = result
+                # The mention is only marked processed by on_reply_sent once
+                # its reply is posted, so a crash here just means a retry
+                post = enqueue_post(
+                    response, POST_PRIORITY_REPLY, f"reply to @{username}",
+                    job="overseer_respond",
+                    in_reply_to_tweet_id=mention.id,
+                    activity=("MENTION_REPLY", f"@{username}: {user_message[:50]}..."),
+                    on_sent=on_reply_sent
                 )
-                client.like(mention.id)
-                processed.add(str(mention.id))
-                logging.info(f"Replied to @{username}")
-                add_activity("MENTION_REPLY", f"@{username}: {user_message[:50]}...")
-            except tweepy.TweepyException as e:
-                logging.error(f"Reply failed: {e}")
-                add_activity("ERROR", f"Reply failed to @{username}: {str(e)}")
-
-        save_json_set(processed, PROCESSED_MENTIONS_FILE)
+                if post:
+                    PENDING_REPLIES[str(mention.id)] = post
 
     except tweepy.TweepyException as e:
         logging.error(f"Mentions fetch failed: {e}")
 
+# Mention intents in precedence order. Keywords match whole words only;
+# a trailing '*' also matches longer words ("scam*" -> "scammers").
+INTENT_KEYWORDS = {
+    'price': ['price*', 'market*'],
+    'safety': ['safe*', 'scam*', 'rug*', 'honeypot*', 'check*', 'verif*'],
+    'airdrop': ['airdrop*', 'free', 'claim*', 'giveaway*'],
+    'help': ['help', 'how', 'what is', 'explain*'],
+    'caps': ['caps', 'earn*', 'money', 'token*'],
+    'game': ['game*', 'play*', 'start*', 'join*'],
+    'vault': ['vault*', '77', 'overseer'],
+    'fallout': ['fallout', 'wasteland*', 'mojave', 'ncr', 'legion*'],
+    'gm': ['gm', 'good morning', 'morning'],
+    'gn': ['gn', 'good night', 'night*']
+}
+
+# Ticker keywords in precedence order when a mention names several
+TICKER_KEYWORDS = {
+    'SOL/USDT': ['sol', 'solana'],
+    'BTC/USDT': ['btc', 'bitcoin'],
+    'ETH/USDT': ['eth', 'ethereum']
+}
+
+def compile_keyword_trie(keywords):
+    """Build a regex alternation shaped like a trie, so a failed match costs one character test."""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if '' in node else body
+
+    return build(trie)
+
+def compile_intent_matcher():
+    """
+    Compile every intent and ticker keyword into one word-boundary regex.
+
+    Group 1 matches whole-word keywords, group 2 matches prefix keywords
+    (plus any "0x" string, which counts as a safety query). Each keyword
+    maps to a bitmask: bits 0..n-1 are intents in precedence order, the
+    bits above them are tickers in precedence order.
+    """
+    exact, prefix, bits = [], ['0x'], {'0x': 1 << list(INTENT_KEYWORDS).index('safety')}
+    for index, keywords in enumerate(INTENT_KEYWORDS.values()):
+        for keyword in keywords:
+            word = keyword.rstrip('*')
+            (prefix if keyword.endswith('*') else exact).append(word)
+            bits[word] = 1 << index
+    price_bit = 1 << list(INTENT_KEYWORDS).index('price')
+    for index, keywords in enumerate(TICKER_KEYWORDS.values()):
+        for keyword in keywords:
+            exact.append(keyword)
+            bits[keyword] = (1 << (len(INTENT_KEYWORDS) + index)) | price_bit
+    pattern = re.compile(
+        rf"\b(?:({compile_keyword_trie(exact)})\b|({compile_keyword_trie(prefix)})\w*)"
+    )
+    return pattern, bits
+
+INTENT_PATTERN, INTENT_KEYWORD_BITS = compile_intent_matcher()
+INTENT_NAMES = list(INTENT_KEYWORDS)
+INTENT_MASK = (1 << len(INTENT_NAMES)) - 1
+TICKER_SYMBOLS = list(TICKER_KEYWORDS)
+CONTRACT_ADDRESS_PATTERN = re.compile(r'0x[a-fA-F0-9]{40}')
+
+def classify_message(message):
+    """
+    Extract intents and tickers from a mention in a single regex pass.
+
+    Returns (intent, token_symbol, address): the highest-precedence intent
+    (or None), the highest-precedence ticker symbol (or None), and the
+    first contract address for safety queries (or None).
+    """
+    mask = 0
+    for exact, prefix in INTENT_PATTERN.findall(message.lower()):
+        mask |= INTENT_KEYWORD_BITS[exact or prefix]
+    intents = mask & INTENT_MASK
+    tickers = mask >> len(INTENT_NAMES)
+    # Lowest set bit = highest precedence
+    intent = INTENT_NAMES[(intents & -intents).bit_length() - 1] if intents else None
+    token_symbol = TICKER_SYMBOLS[(tickers & -tickers).bit_length() - 1] if tickers else None
+    address = None
+    if intent == 'safety':
+        address_match = CONTRACT_ADDRESS_PATTERN.search(message)
+        address = address_match.group(0) if address_match else None
+    return intent, token_symbol, address
+
 def generate_contextual_response(username, message):
     """Generate a response based on message content with Overseer personality."""
-    message_lower = message.lower()
+    intent, token_symbol, address = classify_message(message)
     
     # Check for price queries
-    if any(word in message_lower for word in ['price', 'btc', 'eth', 'sol', 'bitcoin', 'ethereum', 'solana', 'market']):
-        # Extract which token they're asking about
-        token_symbol = None
-        if 'sol' in message_lower or 'solana' in message_lower:
-            token_symbol = 'SOL/USDT'
-        elif 'btc' in message_lower or 'bitcoin' in message_lower:
-            token_symbol = 'BTC/USDT'
-        elif 'eth' in message_lower or 'ethereum' in message_lower:
-            token_symbol = 'ETH/USDT'
-        
+    if intent == 'price':
         if token_symbol and token_symbol in MONITORED_TOKENS:
             config = MONITORED_TOKENS[token_symbol]
             price_data = get_token_price(token_symbol, config['exchange'])
@@ -2278,7 +4195,7 @@ def generate_contextual_response(username, message):
                     f"@{username} Market intel: ${token_name} at ${price_data['price']:.2f}. Change: {price_data['change_24h']:+.2f}%. Vault-Tec Analytics reporting. {GAME_LINK}",
                     f"@{username} ${token_name} price: ${price_data['price']:.2f}. 24h: {price_data['change_24h']:+.2f}%. The economy glows. {GAME_LINK}"
                 ]
-                return random.choice(responses)[:TWITTER_CHAR_LIMIT]
+                return truncate_to_weight(random.choice(responses), TWITTER_CHAR_LIMIT)
         
         # General market query
         responses = [
@@ -2286,15 +4203,12 @@ def generate_contextual_response(username, message):
             f"@{username} Wasteland market intel: Monitoring major tokens. FizzCo Analytics at your service. {GAME_LINK}",
             f"@{username} Token prices tracked. The caps flow differently now. {GAME_LINK}"
         ]
-        return random.choice(responses)[:TWITTER_CHAR_LIMIT]
+        return truncate_to_weight(random.choice(responses), TWITTER_CHAR_LIMIT)
     
     # Check for token safety queries (contract address or "safe" keywords)
-    if any(word in message_lower for word in ['safe', 'scam', 'rug', 'honeypot', 'check', 'verify']) or '0x' in message_lower:
-        # Try to extract contract address
-        address_match = re.search(r'0x[a-fA-F0-9]{40}', message)
-        
-        if address_match:
-            token_address = address_match.group(0)
+    if intent == 'safety':
+        if address:
+            token_address = address
             safety_result = check_token_safety(token_address)
             
             if safety_result['honeypot']:
@@ -2314,7 +4228,7 @@ def generate_contextual_response(username, message):
                     f"@{username} 🔍 Preliminary scan complete. Risk: {safety_result['risk_score']}/100. Looks cleaner than most. DYOR. {GAME_LINK}"
                 ]
             
-            return random.choice(responses)[:TWITTER_CHAR_LIMIT]
+            return truncate_to_weight(random.choice(responses), TWITTER_CHAR_LIMIT)
         else:
             # Generic safety advice without address
             responses = [
@@ -2322,55 +4236,55 @@ def generate_contextual_response(username, message):
                 f"@{username} Vault-Tec safety protocol: Verify contracts, check dev wallets, test with small amounts. Stay vigilant. {GAME_LINK}",
                 f"@{username} The Overseer advises: DYOR, avoid honeypots, watch for rug pulls. Survival requires caution. {GAME_LINK}"
             ]
-            return random.choice(responses)[:TWITTER_CHAR_LIMIT]
+            return truncate_to_weight(random.choice(responses), TWITTER_CHAR_LIMIT)
     
     # Check for airdrop queries
-    if any(word in message_lower for word in ['airdrop', 'free', 'claim', 'giveaway']):
+    if intent == 'airdrop':
         responses = [
             f"@{username} 🎁 Airdrop intel coming soon. The Overseer monitors opportunities. Stay alert. {GAME_LINK}",
             f"@{username} Free caps? The wasteland provides. Check back for legitimate airdrops. {GAME_LINK}",
             f"@{username} Vault-Tec Airdrop Division active. Announcements forthcoming. Patience, dweller. {GAME_LINK}"
         ]
-        return random.choice(responses)[:TWITTER_CHAR_LIMIT]
+        return truncate_to_weight(random.choice(responses), TWITTER_CHAR_LIMIT)
     
     # Keyword-based contextual responses
-    if any(word in message_lower for word in ['help', 'how', 'what is', 'explain']):
+    if intent == 'help':
         responses = [
             f"@{username} Ah, seeking knowledge? The wasteland rewards the curious. Check {GAME_LINK} — answers await.",
             f"@{username} Processing query... Vault-Tec recommends: {GAME_LINK}. The Overseer has spoken.",
             f"@{username} Help? In the wasteland? That's adorable. Start here: {GAME_LINK}"
         ]
-    elif any(word in message_lower for word in ['caps', 'earn', 'money', 'token']):
+    elif intent == 'caps':
         responses = [
             f"@{username} CAPS flow to those who claim. Scavenge the Mojave: {GAME_LINK} ☢️",
             f"@{username} Currency with a half-life. Earn CAPS at {GAME_LINK} — the economy glows.",
             f"@{username} Want CAPS? Walk into irradiated zones. Sign messages. Profit. {GAME_LINK}"
         ]
-    elif any(word in message_lower for word in ['game', 'play', 'start', 'join']):
+    elif intent == 'game':
         responses = [
             f"@{username} Ready to explore the wasteland? Your Pip-Boy awaits: {GAME_LINK} 🎮",
             f"@{username} Initialize scavenger protocols at {GAME_LINK}. The Mojave is calling.",
             f"@{username} Join the hunt. Claim locations. Earn CAPS. Begin: {GAME_LINK}"
         ]
-    elif any(word in message_lower for word in ['vault', '77', 'overseer']):
+    elif intent == 'vault':
         responses = [
             f"@{username} Vault 77... I remember things. Cold hands. Metal doors. {GAME_LINK}",
             f"@{username} The Overseer speaks. Are you listening? {GAME_LINK} ☢️",
             f"@{username} Vault 77 was never meant to open. And yet... here we are. {GAME_LINK}"
         ]
-    elif any(word in message_lower for word in ['fallout', 'wasteland', 'mojave', 'ncr', 'legion']):
+    elif intent == 'fallout':
         responses = [
             f"@{username} Cross-timeline activity detected. The Mojave remembers. {GAME_LINK}",
             f"@{username} NCR, Legion, Brotherhood... all paths lead to {GAME_LINK}",
             f"@{username} The wasteland forges survivors. Are you one? {GAME_LINK}"
         ]
-    elif any(word in message_lower for word in ['gm', 'good morning', 'morning']):
+    elif intent == 'gm':
         responses = [
             f"@{username} Dawn radiation nominal. Another day in the wasteland. {GAME_LINK} ☀️☢️",
             f"@{username} GM, dweller. The Mojave awaits. {GAME_LINK}",
             f"@{username} Morning protocols engaged. Survival odds: recalculating. {GAME_LINK}"
         ]
-    elif any(word in message_lower for word in ['gn', 'good night', 'night']):
+    elif intent == 'gn':
         responses = [
             f"@{username} Nocturnal horrors prowl. Sleep with one eye open. {GAME_LINK} 🌙☢️",
             f"@{username} GN, survivor. The Overseer watches while you rest. {GAME_LINK}",
@@ -2388,30 +4302,117 @@ def generate_contextual_response(username, message):
     
     response = random.choice(responses)
     # Ensure response fits Twitter limit
-    if len(response) > TWITTER_CHAR_LIMIT:
-        response = f"@{username} {get_personality_line()} {GAME_LINK}"[:TWITTER_CHAR_LIMIT]
+    if twitter_weighted_length(response) > TWITTER_CHAR_LIMIT:
+        response = truncate_to_weight(f"@{username} {get_personality_line()} {GAME_LINK}", TWITTER_CHAR_LIMIT)
     
     return response
 
+RETWEET_STATE_FILE = "retweet_state.json"
+RETWEET_SEEN_MAX_AGE = 7 * 24 * 3600  # search_recent_tweets only reaches back 7 days
+TWITTER_EPOCH_MS = 1288834974657      # snowflake id epoch
+
+def tweet_id_timestamp(tweet_id):
+    """Creation time (epoch seconds) encoded in a snowflake tweet id."""
+    return ((int(tweet_id) >> 22) + TWITTER_EPOCH_MS) / 1000
+
+def tweet_id_floor(timestamp):
+    """Smallest snowflake id that could have been created at `timestamp`."""
+    return max(int(timestamp * 1000) - TWITTER_EPOCH_MS, 0) << 22
+
+
+class SeenTweetIds:
+    """
+    Compact persisted set of tweet ids already retweeted, plus the search
+    since_id watermark.
+
+    Ids are kept in a sorted 64-bit integer array. Snowflake ids grow with
+    time, so ageing out everything older than the search window is a single
+    slice off the front, and membership is a binary search.
+    """
+
+    def __init__(self, filename):
+        self._filename = filename
+        self._ids = array('q')
+        self.since_id = None
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r') as f:
+                    state = json.load(f)
+                self._ids = array('q', sorted(state.get('seen', [])))
+                self.since_id = state.get('since_id')
+            except (OSError, ValueError) as e:
+                logging.warning(f"Could not load retweet state: {e}")
+        self.prune()
+
+    def __contains__(self, tweet_id):
+        tweet_id = int(tweet_id)
+        index = bisect.bisect_left(self._ids, tweet_id)
+        return index < len(self._ids) and self._ids[index] == tweet_id
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, tweet_id):
+        if tweet_id not in self:
+            bisect.insort(self._ids, int(tweet_id))
+
+    def advance(self, newest_id):
+        """Move the since_id watermark forward."""
+        if newest_id and (not self.since_id or int(newest_id) > int(self.since_id)):
+            self.since_id = str(newest_id)
+
+    def prune(self):
+        """Age out ids (and a watermark) older than the search window."""
+        cutoff = tweet_id_floor(time.time() - RETWEET_SEEN_MAX_AGE)
+        del self._ids[:bisect.bisect_left(self._ids, cutoff)]
+        if self.since_id and int(self.since_id) < cutoff:
+            self.since_id = None
+
+    def save(self):
+        # The JSON dump goes through a temp file like the processed mentions
+        tmp_filename = f"{self._filename}.tmp"
+        with open(tmp_filename, 'w') as f:
+            json.dump({'since_id': self.since_id, 'seen': self._ids.tolist()}, f)
+        os.replace(tmp_filename, self._filename)
+
+
+RETWEET_SEEN = SeenTweetIds(RETWEET_STATE_FILE)
+
 def overseer_retweet_hunt():
-    """Search and retweet relevant content."""
+    """Search for new relevant content and retweet some of it."""
     if not client:
         logging.debug("Skipping overseer_retweet_hunt: Twitter client not initialized")
         return
+    if not budget_allows(POST_PRIORITY_BROADCAST, "overseer_retweet_hunt"):
+        return
 
     query = "(Fallout OR Solana OR NFT OR wasteland OR Mojave OR \"Atomic Fizz\" OR \"bottle caps\" OR gaming) filter:media min_faves:5 -is:retweet"
+    RETWEET_SEEN.prune()
     try:
-        tweets = client.search_recent_tweets(query=query, max_results=20)
+        # since_id limits the search to tweets newer than the last run
+        tweets = client.search_recent_tweets(
+            query=query, max_results=20, since_id=RETWEET_SEEN.since_id
+        )
+        RETWEET_SEEN.advance((tweets.meta or {}).get('newest_id'))
         if not tweets.data:
+            RETWEET_SEEN.save()
             return
             
         for tweet in tweets.data:
+            if tweet.id in RETWEET_SEEN:
+                continue
             if random.random() > 0.75:
+                if not budget_allows(POST_PRIORITY_BROADCAST, "overseer_retweet_hunt"):
+                    break
                 try:
                     client.retweet(tweet.id)
                     logging.info(f"Retweeted: {tweet.id}")
                 except tweepy.TweepyException:
                     pass
+                # Remember the attempt either way; "already retweeted" is final
+                RETWEET_SEEN.add(tweet.id)
+                WRITE_BUDGET.record(POST_PRIORITY_BROADCAST, "overseer_retweet_hunt")
+        RETWEET_SEEN.save()
     except tweepy.TweepyException as e:
         logging.error(f"Search failed: {e}")
 
@@ -2420,21 +4421,11 @@ def overseer_diagnostic():
     if not client:
         logging.debug("Skipping overseer_diagnostic: Twitter client not initialized")
         return
+    if not budget_allows(POST_PRIORITY_BROADCAST, "overseer_diagnostic"):
+        return
 
-    threat = get_threat_level()
-    diag = (
-        f"☢️ OVERSEER DIAGNOSTIC ☢️\n\n"
-        f"System Status: ONLINE\n"
-        f"Vault 77 Uplink: STABLE\n"
-        f"Threat Level: {threat['level']}\n\n"
-        f"{random.choice(LORES)}\n\n"
-        f"🎮 {GAME_LINK}"
-    )
-    try:
-        client.create_tweet(text=diag[:TWITTER_CHAR_LIMIT])
-        logging.info("Diagnostic posted")
-    except tweepy.TweepyException as e:
-        logging.error(f"Diagnostic failed: {e}")
+    diag = render_tweet('diagnostic', threat_level=get_threat_level()['level'])
+    enqueue_post(diag, POST_PRIORITY_BROADCAST, "diagnostic", job="overseer_diagnostic")
 
 # ------------------------------------------------------------
 # SCHEDULER - ADJUSTED FOR BETTER ENGAGEMENT
@@ -2469,55 +4460,30 @@ def initialize_bot():
     scheduler.add_job(check_price_alerts, 'interval', minutes=5)
     # Post market summary 3 times a day (8 AM, 2 PM, 8 PM)
     scheduler.add_job(post_market_summary, 'cron', hour='8,14,20', minute=0)
+    # Keep pre-uploaded broadcast media topped up
+    scheduler.add_job(MEDIA_POOL.kick, 'interval', minutes=MEDIA_REFILL_INTERVAL)
     
     scheduler.start()
     logging.info("Scheduler started with all jobs configured")
 
+    # Start the outbound post dispatcher before anything is queued
+    start_post_dispatcher()
+    start_webhook_workers()
+    MEDIA_POOL.kick()
+
     # Post activation tweet
     logging.info(f"VAULT-TEC {BOT_NAME} ONLINE ☢️🔥")
     if client:
-        try:
-            activation_messages = [
-                (
-                    f"☢️ {BOT_NAME} ACTIVATED ☢️\n\n"
-                    f"Vault {VAULT_NUMBER} uplink established.\n"
-                    f"Cross-timeline synchronization complete.\n"
-                    f"The Mojave remembers. The wasteland awaits.\n\n"
-                    f"{random.choice(LORES)}\n\n"
-                    f"🎮 {GAME_LINK}"
-                ),
-                (
-                    f"🔌 SYSTEM BOOT COMPLETE 🔌\n\n"
-                    f"{BOT_NAME} online.\n"
-                    f"Neural echo stable. Memory fragments intact.\n"
-                    f"Scanning wasteland frequencies...\n\n"
-                    f"{get_personality_line()}\n\n"
-                    f"🎮 {GAME_LINK}"
-                ),
-                (
-                    f"📡 SIGNAL RESTORED 📡\n\n"
-                    f"Vault {VAULT_NUMBER} Overseer Terminal active.\n"
-                    f"Atomic Fizz Caps economy: operational.\n"
-                    f"Scavenger protocols: engaged.\n\n"
-                    f"{random.choice(LORES)}\n\n"
-                    f"🎮 {GAME_LINK}"
-                )
-            ]
-            activation_msg = random.choice(activation_messages)
-            # Ensure fits in tweet
-            if len(activation_msg) > TWITTER_CHAR_LIMIT:
-                activation_msg = (
-                    f"☢️ {BOT_NAME} ONLINE ☢️\n\n"
-                    f"Vault {VAULT_NUMBER} uplink: ACTIVE\n"
-                    f"{random.choice(LORES)}\n\n"
-                    f"🎮 {GAME_LINK}"
-                )[:TWITTER_CHAR_LIMIT]
-            client.create_tweet(text=activation_msg)
-            logging.info("Activation message posted")
-            add_activity("STARTUP", f"Bot activated - {BOT_NAME}")
-        except tweepy.TweepyException as e:
-            logging.warning(f"Activation tweet failed (may be duplicate): {e}")
-            add_activity("ERROR", f"Activation tweet failed: {str(e)}")
+        activation_msg = render_tweet(
+            random.choice(['activation_activated', 'activation_boot', 'activation_signal']),
+            'activation_fallback',
+            personality=get_personality_pool()
+        )
+        enqueue_post(
+            activation_msg, POST_PRIORITY_BROADCAST, "activation message",
+            job="initialize_bot",
+            activity=("STARTUP", f"Bot activated - {BOT_NAME}")
+        )
     else:
         logging.info("Skipping activation tweet: Twitter client not available")
 
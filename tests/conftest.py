@@ -0,0 +1,12 @@
+"""
+Shared test setup
+Imports the bot modules from the repository root without side effects on
+the working tree: no overseer_ai.log and no archive.db.
+"""
+import os
+import sys
+
+os.environ['OVERSEER_LOG_FILE'] = ''
+os.environ['ARCHIVE_ENABLED'] = 'false'
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,95 @@
+"""
+Tests for the day-partitioned SQLite archive (alert_archive)
+"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import alert_archive
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    """Writer connection to an archive in a temporary directory"""
+    monkeypatch.setattr(alert_archive, 'ARCHIVE_PATH', str(tmp_path / 'archive.db'))
+    conn = alert_archive.connect()
+    yield conn
+    conn.close()
+
+
+def alert_row(seq, timestamp, alert_type='rugpull', source='token-scalper'):
+    return ('alerts', (seq, timestamp, alert_type, source, f'alert {seq}', json.dumps({'seq': seq})))
+
+
+def days_ago(days, time='12:00:00'):
+    return f"{(datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')}T{time}"
+
+
+def test_rows_are_written_to_one_table_per_kind_and_day(archive):
+    alert_archive.write_batch(archive, [
+        alert_row(1, '2026-10-18T23:59:59'),
+        alert_row(2, '2026-10-19T00:00:00'),
+        ('activities', ('2026-10-19T08:00:00', 'BROADCAST', 'Posted lore')),
+    ], set())
+
+    assert alert_archive.list_partitions(archive, 'alerts') == ['alerts_20261019', 'alerts_20261018']
+    assert alert_archive.list_partitions(archive, 'activities') == ['activities_20261019']
+
+
+def test_query_spans_partitions_newest_first_with_filters(archive):
+    alert_archive.write_batch(archive, [
+        alert_row(1, '2026-10-17T10:00:00'),
+        alert_row(2, '2026-10-18T10:00:00', alert_type='airdrop'),
+        alert_row(3, '2026-10-18T11:00:00', source='overseer-bot-ai'),
+        alert_row(4, '2026-10-19T10:00:00'),
+    ], set())
+
+    everything = alert_archive.query('alerts')
+    window = alert_archive.query('alerts', start='2026-10-18T00:00:00', end='2026-10-19T10:00:00')
+    rugpulls = alert_archive.query('alerts', record_type='rugpull', source='token-scalper')
+
+    assert [row['seq'] for row in everything] == [4, 3, 2, 1]
+    assert everything[0]['data'] == {'seq': 4}
+    assert [row['seq'] for row in window] == [3, 2]
+    assert [row['seq'] for row in rugpulls] == [4, 1]
+    assert [row['seq'] for row in alert_archive.query('alerts', limit=2)] == [4, 3]
+
+
+def test_query_validates_kind_and_handles_a_missing_archive(archive, tmp_path, monkeypatch):
+    with pytest.raises(ValueError):
+        alert_archive.query('tweets')
+
+    monkeypatch.setattr(alert_archive, 'ARCHIVE_PATH', str(tmp_path / 'missing.db'))
+    assert alert_archive.query('alerts') == []
+
+
+def test_prune_drops_only_partitions_past_retention(archive, monkeypatch):
+    monkeypatch.setattr(alert_archive, 'ARCHIVE_RETENTION_DAYS', 7)
+    known = set()
+    alert_archive.write_batch(archive, [
+        alert_row(1, days_ago(30)),
+        alert_row(2, days_ago(8)),
+        alert_row(3, days_ago(7)),
+        alert_row(4, days_ago(0)),
+        ('activities', (days_ago(9), 'BROADCAST', 'old')),
+    ], known)
+    old = {alert_archive.partition_name('alerts', days_ago(30)), alert_archive.partition_name('alerts', days_ago(8))}
+
+    dropped = alert_archive.prune_partitions(archive, known)
+
+    assert dropped == 3
+    assert [row['seq'] for row in alert_archive.query('alerts')] == [4, 3]
+    assert alert_archive.list_partitions(archive, 'activities') == []
+    assert not old & known
+
+
+def test_dropped_partitions_are_recreated_on_the_next_write(archive, monkeypatch):
+    monkeypatch.setattr(alert_archive, 'ARCHIVE_RETENTION_DAYS', 1)
+    known = set()
+    alert_archive.write_batch(archive, [alert_row(1, days_ago(5))], known)
+    alert_archive.prune_partitions(archive, known)
+
+    alert_archive.write_batch(archive, [alert_row(2, days_ago(5))], known)
+
+    assert [row['seq'] for row in alert_archive.query('alerts')] == [2]
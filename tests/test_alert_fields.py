@@ -0,0 +1,74 @@
+"""
+Tests for bounding stored alert payloads (compact_value, extract_alert_fields)
+"""
+import pytest
+
+import api_client
+
+MAX_CHARS = api_client.ALERT_FIELD_MAX_CHARS
+MAX_ITEMS = api_client.ALERT_FIELD_MAX_ITEMS
+
+
+@pytest.mark.parametrize('value', [None, True, 0, 1.5, 'short'])
+def test_small_scalars_are_kept(value):
+    assert api_client.compact_value(value) == value
+
+
+def test_long_strings_are_truncated():
+    assert api_client.compact_value('x' * (MAX_CHARS + 50)) == 'x' * MAX_CHARS
+
+
+def test_containers_are_cut_and_deeper_levels_stringified():
+    nested = {f'k{i}': [i, {'deep': i}] for i in range(MAX_ITEMS + 5)}
+
+    compacted = api_client.compact_value(nested)
+
+    assert list(compacted) == [f'k{i}' for i in range(MAX_ITEMS)]
+    assert compacted['k1'] == str([1, {'deep': 1}])
+    assert api_client.compact_value(list(range(50)), depth=1) == list(range(MAX_ITEMS))
+    assert api_client.compact_value([[1, 2]], depth=0) == '[[1, 2]]'
+
+
+def test_token_scalper_alerts_keep_their_token_identity():
+    alert = {
+        'token_address': '0xabc',
+        'token_name': 'SCAM',
+        'token_symbol': 'S',
+        'severity': 'critical',
+        'details': 'Liquidity pulled',
+        'raw_trace': 'x' * 10000,
+    }
+
+    assert api_client.extract_alert_fields('rugpull', alert) == {
+        'token_name': 'SCAM',
+        'token_symbol': 'S',
+        'token_address': '0xabc',
+        'severity': 'critical',
+        'details': 'Liquidity pulled',
+    }
+    assert api_client.extract_alert_fields('high_potential', {
+        'token_name': 'GEM', 'opportunity_score': 91, 'reasons': ['Locked liquidity']
+    }) == {'token_name': 'GEM', 'opportunity_score': 91, 'reasons': ['Locked liquidity']}
+
+
+def test_field_list_override():
+    alert = {'token_address': '0xabc', 'severity': 'low', 'pool': 'uni-v3'}
+
+    assert api_client.extract_alert_fields('rugpull', alert, ['pool', 'severity']) == {
+        'pool': 'uni-v3', 'severity': 'low'
+    }
+
+
+def test_unknown_types_keep_known_fields_first_and_stay_bounded():
+    alert = {f'extra{i}': 'v' * (MAX_CHARS * 2) for i in range(MAX_ITEMS * 2)}
+    alert['token_name'] = 'LATE'
+
+    stored = api_client.extract_alert_fields('mapped_by_upstream', alert)
+
+    assert len(stored) == MAX_ITEMS
+    assert next(iter(stored)) == 'token_name'
+    assert all(len(value) <= MAX_CHARS for value in stored.values())
+
+
+def test_non_dict_payloads_store_nothing():
+    assert api_client.extract_alert_fields('rugpull', ['token_address']) == {}
@@ -0,0 +1,135 @@
+"""
+Tests for the alert store queries (api_client.query_alerts) and /api/alerts
+"""
+import base64
+from collections import deque
+from datetime import datetime
+
+import pytest
+
+import api_client
+import overseer_bot
+
+
+@pytest.fixture
+def history(monkeypatch):
+    """Empty alert history; add(type, source, timestamp) stores one alert"""
+    monkeypatch.setattr(api_client, 'ALERT_HISTORY', deque(maxlen=api_client.MAX_ALERTS))
+    monkeypatch.setattr(api_client, 'ALERT_INDEX_BY_TYPE', {})
+    monkeypatch.setattr(api_client, 'ALERT_INDEX_BY_SOURCE', {})
+    monkeypatch.setattr(api_client, 'ALERT_SEQ', 0)
+    monkeypatch.setattr(api_client.alert_archive, 'record_alert', lambda alert: None)
+
+    def add(alert_type='trade', source='token-scalper', timestamp='2026-10-19T10:00:00'):
+        class FixedClock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime.fromisoformat(timestamp)
+        monkeypatch.setattr(api_client, 'datetime', FixedClock)
+        api_client.add_alert(alert_type, source, {'id': api_client.ALERT_SEQ + 1})
+        monkeypatch.setattr(api_client, 'datetime', datetime)
+        return api_client.ALERT_SEQ
+    return add
+
+
+def seqs(result):
+    return [alert['seq'] for alert in result['alerts']]
+
+
+def test_newest_first_with_limit_and_cursor_paging(history):
+    for _ in range(5):
+        history()
+
+    first = api_client.query_alerts(limit=2)
+    second = api_client.query_alerts(cursor=first['next_cursor'], limit=2)
+    last = api_client.query_alerts(cursor=second['next_cursor'], limit=2)
+
+    assert (seqs(first), first['next_cursor']) == ([5, 4], 4)
+    assert (seqs(second), second['next_cursor']) == ([3, 2], 2)
+    assert (seqs(last), last['next_cursor']) == ([1], None)
+    assert first['latest_seq'] == 5
+
+
+def test_after_returns_only_newer_alerts(history):
+    for _ in range(4):
+        history()
+
+    assert seqs(api_client.query_alerts(after=2)) == [4, 3]
+    assert seqs(api_client.query_alerts(after=4)) == []
+
+
+def test_type_and_source_filters_page_within_matches(history):
+    history('trade', 'a')
+    history('rugpull', 'a')
+    history('trade', 'b')
+    history('trade', 'a')
+    history('trade', 'a')
+
+    page = api_client.query_alerts(alert_type='trade', source='a', limit=2)
+    rest = api_client.query_alerts(alert_type='trade', source='a', cursor=page['next_cursor'])
+
+    assert (seqs(page), page['next_cursor']) == ([5, 4], 4)
+    assert (seqs(rest), rest['next_cursor']) == ([1], None)
+    assert seqs(api_client.query_alerts(alert_type='airdrop')) == []
+
+
+def test_since_survives_a_clock_step_back(history):
+    history(timestamp='2026-10-19T10:00:00')
+    history(timestamp='2026-10-19T10:00:05')
+    history(timestamp='2026-10-19T09:59:00')  # wall clock stepped back
+    history(timestamp='2026-10-19T10:00:10')
+
+    result = api_client.query_alerts(since='2026-10-19T10:00:01')
+
+    assert (seqs(result), result['next_cursor']) == ([4, 2], None)
+
+
+def test_limit_is_capped(history):
+    history()
+
+    assert seqs(api_client.query_alerts(limit=10 ** 6)) == [1]
+    assert seqs(api_client.query_alerts(limit=0)) == []
+
+
+@pytest.mark.parametrize('value, expected', [
+    (None, None),
+    ('', None),
+    ('0', 0),
+    ('25', 25),
+])
+def test_int_arg_parses_optional_integers(value, expected):
+    assert overseer_bot.int_arg(value) == expected
+
+
+@pytest.mark.parametrize('value', ['-1', '1.5', 'abc', ' 5', '0x10'])
+def test_int_arg_rejects_other_values(value):
+    with pytest.raises(ValueError):
+        overseer_bot.int_arg(value)
+
+
+@pytest.fixture
+def dashboard():
+    credentials = f"{overseer_bot.ADMIN_USERNAME}:{overseer_bot.ADMIN_PASSWORD}".encode('utf-8')
+    headers = {'Authorization': 'Basic ' + base64.b64encode(credentials).decode('ascii')}
+    client = overseer_bot.app.test_client()
+    return lambda url: client.get(url, headers=headers)
+
+
+@pytest.mark.parametrize('query', ['', '?limit=', '?limit=2', '?after=1&limit=5', '?cursor=3'])
+def test_api_alerts_accepts_valid_parameters(history, dashboard, query):
+    for _ in range(3):
+        history()
+
+    response = dashboard('/api/alerts' + query)
+
+    assert response.status_code == 200
+    assert response.get_json()['latest_seq'] == 3
+
+
+@pytest.mark.parametrize('query', ['?limit=abc', '?after=-1', '?cursor=1.5'])
+def test_api_alerts_rejects_bad_parameters(history, dashboard, query):
+    assert dashboard('/api/alerts' + query).status_code == 400
+
+
+def test_api_alerts_requires_auth(history):
+    assert overseer_bot.app.test_client().get('/api/alerts').status_code == 401
@@ -0,0 +1,79 @@
+"""
+Tests for webhook idempotency (IdempotencyStore and key release on failure)
+"""
+import queue
+import threading
+
+import pytest
+
+import overseer_bot
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the store"""
+    now = [1000.0]
+    monkeypatch.setattr(overseer_bot.time, 'time', lambda: now[0])
+    return now
+
+
+def test_claimed_keys_are_replays_until_they_expire(clock):
+    store = overseer_bot.IdempotencyStore(10)
+
+    assert store.claim('a', ttl=60)
+    assert not store.claim('a', ttl=60)
+    clock[0] += 61
+    assert store.claim('a', ttl=60)
+
+
+def test_short_lived_keys_expire_behind_long_lived_ones(clock):
+    store = overseer_bot.IdempotencyStore(10)
+    store.claim('header', ttl=86400)
+    store.claim('hash', ttl=300)
+
+    clock[0] += 301
+
+    assert store.get_stats()['live_keys'] == 1
+    assert store.claim('hash', ttl=300)
+
+
+def test_over_capacity_evicts_the_key_closest_to_expiring(clock):
+    store = overseer_bot.IdempotencyStore(2)
+    store.claim('long', ttl=86400)
+    store.claim('short', ttl=300)
+    store.claim('newest', ttl=300)
+
+    assert store.get_stats()['live_keys'] == 2
+    assert not store.claim('long', ttl=86400)
+    assert store.claim('short', ttl=300)
+
+
+def test_released_keys_can_be_claimed_again(clock):
+    store = overseer_bot.IdempotencyStore(10)
+    store.claim('a', ttl=60)
+
+    store.release('a')
+
+    assert store.get_stats()['live_keys'] == 0
+    assert store.claim('a', ttl=60)
+
+
+def test_failed_processing_lets_the_retry_through(monkeypatch):
+    monkeypatch.setattr(overseer_bot, 'WEBHOOK_QUEUE', queue.Queue(maxsize=10))
+    monkeypatch.setattr(overseer_bot, 'IDEMPOTENCY_STORE', overseer_bot.IdempotencyStore(10))
+    calls = []
+
+    def flaky(payload):
+        calls.append(payload)
+        if len(calls) == 1:
+            raise RuntimeError('handler failed')
+
+    threading.Thread(target=overseer_bot.webhook_worker_loop, daemon=True).start()
+    first = overseer_bot.ingest_webhook('/t', flaky, {'type': 'perk'}, 'evt-1')
+    overseer_bot.WEBHOOK_QUEUE.join()
+    retry = overseer_bot.ingest_webhook('/t', flaky, {'type': 'perk'}, 'evt-1')
+    overseer_bot.WEBHOOK_QUEUE.join()
+    replay = overseer_bot.ingest_webhook('/t', flaky, {'type': 'perk'}, 'evt-1')
+
+    assert [status for _, status in (first, retry, replay)] == [202, 202, 200]
+    assert len(calls) == 2
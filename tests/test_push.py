@@ -0,0 +1,108 @@
+"""
+Tests for signed upstream pushes (api_client.ingest_push)
+"""
+import json
+import time
+
+import pytest
+
+import api_client
+
+SECRET = 'push-test-secret'
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """A push-only upstream registered for the duration of one test"""
+    entry = api_client.normalize_upstream({
+        'name': 'push_test',
+        'push_secret': SECRET,
+        'endpoints': {'status': '/api/status', 'alerts': '/api/alerts'}
+    })
+    monkeypatch.setitem(api_client.UPSTREAMS, 'push_test', entry)
+    monkeypatch.setitem(api_client.HEALTH_STATUS, 'push_test', api_client._new_health_record())
+    monkeypatch.setattr(api_client.alert_archive, 'record_alert', lambda alert: None)
+    yield entry
+    for endpoint in ('alerts', 'status'):
+        api_client.PUSH_LAST_SEEN.pop(('push_test', endpoint), None)
+
+
+def signed(body, timestamp=None, secret=SECRET):
+    """(body, signature, timestamp) as an upstream would send them"""
+    raw = json.dumps(body).encode('utf-8')
+    timestamp = str(int(time.time()) if timestamp is None else timestamp)
+    return raw, api_client.sign_push(secret, timestamp, raw), timestamp
+
+
+def test_valid_push_is_ingested(upstream):
+    raw, signature, timestamp = signed([{'id': 'valid-1', 'type': 'rugpull', 'token_name': 'SCAM'}])
+
+    result, status = api_client.ingest_push('push_test', raw, signature, timestamp)
+
+    assert status == 200
+    assert result == {'ok': True, 'received': 1, 'new': 1}
+    assert api_client.push_active('push_test', 'alerts')
+    assert not api_client.push_active('push_test', 'status')
+
+
+def test_unknown_upstream_is_rejected(upstream):
+    raw, signature, timestamp = signed([])
+
+    assert api_client.ingest_push('no_such_upstream', raw, signature, timestamp)[1] == 404
+
+
+@pytest.mark.parametrize('tamper', ['body', 'signature', 'secret', 'missing'])
+def test_bad_signature_is_rejected(upstream, tamper):
+    raw, signature, timestamp = signed([{'id': f'bad-{tamper}'}])
+    if tamper == 'body':
+        raw = raw.replace(b'bad', b'bag')
+    elif tamper == 'signature':
+        signature = signature[:-1] + ('0' if signature[-1] != '0' else '1')
+    elif tamper == 'secret':
+        raw, signature, timestamp = signed([{'id': 'bad-secret'}], secret='other-secret')
+    else:
+        signature = ''
+
+    result, status = api_client.ingest_push('push_test', raw, signature, timestamp)
+
+    assert status == 401
+    assert result['ok'] is False
+    assert api_client.HEALTH_STATUS['push_test']['push']['rejected'] == 1
+
+
+@pytest.mark.parametrize('timestamp', [
+    int(time.time()) - api_client.PUSH_MAX_SKEW - 60,
+    int(time.time()) + api_client.PUSH_MAX_SKEW + 60,
+    'nan',
+    'inf',
+    'yesterday',
+])
+def test_timestamp_outside_window_is_rejected(upstream, timestamp):
+    raw, signature, timestamp = signed([{'id': f'skew-{timestamp}'}], timestamp=timestamp)
+
+    assert api_client.ingest_push('push_test', raw, signature, timestamp)[1] == 401
+
+
+def test_replayed_push_is_rejected(upstream):
+    raw, signature, timestamp = signed([{'id': 'replay-1'}])
+
+    assert api_client.ingest_push('push_test', raw, signature, timestamp)[1] == 200
+    result, status = api_client.ingest_push('push_test', raw, signature, timestamp)
+
+    assert status == 409
+    assert result['error'] == 'Replayed delivery'
+
+
+def test_status_push_pauses_only_status_polling(upstream):
+    raw, signature, timestamp = signed({'status': {'status': 'ok', 'version': '1.0'}})
+
+    assert api_client.ingest_push('push_test', raw, signature, timestamp)[1] == 200
+    assert api_client.push_active('push_test', 'status')
+    assert not api_client.push_active('push_test', 'alerts')
+
+
+@pytest.mark.parametrize('body', [{'unrelated': True}, 'not a list', 42])
+def test_unusable_body_is_rejected(upstream, body):
+    raw, signature, timestamp = signed(body)
+
+    assert api_client.ingest_push('push_test', raw, signature, timestamp)[1] == 400
@@ -0,0 +1,90 @@
+"""
+Tests for attaching our safety check to Token-scalper alerts
+"""
+import threading
+
+import pytest
+
+import overseer_bot
+
+TOKEN = '0x' + 'ab' * 20
+
+
+@pytest.fixture
+def safety(monkeypatch):
+    """Replace check_token_safety; `release` lets the running check finish"""
+    release = threading.Event()
+    result = {'verified': True, 'risk_score': 15, 'warnings': ['High buy tax: 12%']}
+
+    def check(token_address, chain='eth'):
+        release.wait(5)
+        return dict(result)
+
+    monkeypatch.setattr(overseer_bot, 'check_token_safety', check)
+    monkeypatch.setattr(overseer_bot, 'SAFETY_ENRICHMENT_ENABLED', True)
+    monkeypatch.setattr(overseer_bot, 'SAFETY_ENRICHMENT_BUDGET', 0.5)
+    return release, result
+
+
+def rug_pull(**fields):
+    return dict({'type': 'rug_pull', 'token_address': TOKEN, 'token_name': 'SCAM'}, **fields)
+
+
+def test_payload_stays_plain_data(safety):
+    alert = rug_pull()
+
+    assert overseer_bot.start_safety_check(alert) is alert
+    assert alert == rug_pull()
+    overseer_bot.discard_safety_check(alert)
+    safety[0].set()
+
+
+def test_finished_check_is_attached(safety):
+    release, _ = safety
+    alert = overseer_bot.start_safety_check(rug_pull())
+    release.set()
+
+    assert overseer_bot.collect_safety_check(alert)['risk_score'] == 15
+    assert overseer_bot.collect_safety_check(alert) is None  # collected once
+
+
+def test_check_within_the_budget_is_waited_for(safety):
+    release, _ = safety
+    alert = overseer_bot.start_safety_check(rug_pull())
+    threading.Timer(0.05, release.set).start()
+
+    assert overseer_bot.collect_safety_check(alert) is not None
+
+
+def test_late_check_is_skipped(safety, monkeypatch):
+    monkeypatch.setattr(overseer_bot, 'SAFETY_ENRICHMENT_BUDGET', 0.05)
+    alert = overseer_bot.start_safety_check(rug_pull())
+
+    assert overseer_bot.collect_safety_check(alert) is None
+    safety[0].set()
+
+
+def test_unverified_check_is_not_attached(safety):
+    release, result = safety
+    result.update(verified=False, warnings=['Unable to verify safety'])
+    alert = overseer_bot.start_safety_check(rug_pull())
+    release.set()
+
+    assert overseer_bot.collect_safety_check(alert) is None
+
+
+@pytest.mark.parametrize('alert', [
+    rug_pull(type='airdrop'),
+    rug_pull(token_address='not-an-address'),
+    rug_pull(token_address=['0x']),
+])
+def test_other_alerts_are_not_checked(safety, alert):
+    overseer_bot.start_safety_check(alert)
+
+    assert overseer_bot.collect_safety_check(alert) is None
+    safety[0].set()
+
+
+def test_alert_without_a_started_check_gets_nothing(safety):
+    assert overseer_bot.collect_safety_check(rug_pull()) is None
+    safety[0].set()
@@ -0,0 +1,106 @@
+"""
+Tests for the upstream registry (normalize_upstream, load_upstreams, map_upstream_alert)
+"""
+import json
+
+import pytest
+
+import api_client
+
+
+def test_defaults_are_filled_in():
+    upstream = api_client.normalize_upstream({'name': 'scalper_eu', 'url': ' https://eu.example ', 'interval': 30})
+
+    assert upstream['label'] == 'SCALPER-EU'
+    assert upstream['source'] == 'scalper-eu'
+    assert upstream['url'] == 'https://eu.example'
+    assert upstream['endpoints'] == {'status': '/api/status'}
+    assert upstream['interval'] == 30.0
+    assert upstream['alerts'] == {
+        'items_field': 'alerts',
+        'type_field': 'type',
+        'message_field': 'message',
+        'default_type': 'unknown',
+        'type_map': {},
+        'fields': {}
+    }
+
+
+def test_paths_are_rooted_and_secrets_read_from_the_environment(monkeypatch):
+    monkeypatch.setenv('UPSTREAM_TEST_KEY', 'key-from-env')
+
+    upstream = api_client.normalize_upstream({
+        'name': 'x',
+        'api_key_env': 'UPSTREAM_TEST_KEY',
+        'endpoints': {'alerts': 'v1/alerts'}
+    })
+
+    assert upstream['api_key'] == 'key-from-env'
+    assert upstream['endpoints'] == {'alerts': '/v1/alerts'}
+
+
+@pytest.mark.parametrize('entry', [
+    'not an object',
+    {},
+    {'name': 'has-dash'},
+    {'name': 'x', 'endpoints': {'trades': '/api/trades'}},
+    {'name': 'x', 'endpoints': ['/api/status']},
+    {'name': 'x', 'interval': 0},
+    {'name': 'x', 'alerts': ['rugpull']},
+    {'name': 'x', 'alerts': {'type_field': ['kind']}},
+    {'name': 'x', 'alerts': {'type_map': ['rug']}},
+    {'name': 'x', 'alerts': {'type_map': {'rug': ['rugpull']}}},
+    {'name': 'x', 'alerts': {'fields': {'rugpull': 'token_address'}}},
+    {'name': 'x', 'alerts': {'fields': {'rugpull': [1]}}},
+])
+def test_unusable_definitions_are_rejected(entry):
+    with pytest.raises(ValueError):
+        api_client.normalize_upstream(entry)
+
+
+def test_registry_adds_and_replaces_entries_and_skips_bad_ones(monkeypatch):
+    monkeypatch.setattr(api_client, 'UPSTREAMS_JSON', json.dumps([
+        {'name': 'scalper_eu', 'url': 'https://eu.example'},
+        {'name': 'token_scalper', 'url': 'https://replaced.example'},
+        {'name': 'bad name'},
+    ]))
+
+    upstreams = api_client.load_upstreams()
+
+    assert list(upstreams) == ['overseer_bot_ai', 'token_scalper', 'scalper_eu']
+    assert upstreams['token_scalper']['url'] == 'https://replaced.example'
+
+
+def test_invalid_registry_json_keeps_the_built_in_upstreams(monkeypatch):
+    monkeypatch.setattr(api_client, 'UPSTREAMS_JSON', '[{not json')
+
+    assert list(api_client.load_upstreams()) == ['overseer_bot_ai', 'token_scalper']
+
+
+@pytest.fixture
+def mapped():
+    upstream = api_client.normalize_upstream({
+        'name': 'x',
+        'alerts': {'type_field': 'kind', 'message_field': 'text', 'default_type': 'generic',
+                   'type_map': {'rug': 'rugpull', '7': 'seven'}}
+    })
+    return lambda alert: api_client.map_upstream_alert(upstream, alert)
+
+
+@pytest.mark.parametrize('kind, expected', [
+    ('rug', 'rugpull'),
+    ('airdrop', 'airdrop'),
+    (7, 'seven'),
+    (None, 'generic'),
+    ('', 'generic'),
+    (['rug'], 'generic'),
+    ({'rug': 1}, 'generic'),
+])
+def test_alert_types_are_mapped(mapped, kind, expected):
+    alert_type, message = mapped({'kind': kind, 'text': 'hello'})
+
+    assert (alert_type, message) == (expected, 'hello')
+
+
+def test_missing_message_is_generated(mapped):
+    assert mapped({'kind': 'rug'}) == ('rugpull', 'rugpull alert')
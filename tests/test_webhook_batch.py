@@ -0,0 +1,137 @@
+"""
+Tests for webhook ingestion: batch parsing, size limits and idempotency keys
+"""
+import json
+import queue
+
+import pytest
+
+import overseer_bot
+
+
+@pytest.fixture
+def webhooks(monkeypatch):
+    """Test client with an empty ingestion queue and idempotency store (no workers run)"""
+    monkeypatch.setattr(overseer_bot, 'WEBHOOK_API_KEY', '')
+    monkeypatch.setattr(overseer_bot, 'WEBHOOK_QUEUE', queue.Queue(maxsize=100))
+    monkeypatch.setattr(overseer_bot, 'IDEMPOTENCY_STORE', overseer_bot.IdempotencyStore(100))
+    return overseer_bot.app.test_client()
+
+
+def ndjson(*lines):
+    return '\n'.join(lines) + '\n'
+
+
+def statuses(response):
+    return [(item['status'], item.get('error')) for item in response.get_json()['results']]
+
+
+def test_json_array_items_get_one_result_each(webhooks):
+    response = webhooks.post('/overseer-event/batch', json=[
+        {'type': 'perk', 'perk': 'Bloody Mess'},
+        'x',
+        42,
+        {'perk': 'no type'},
+    ])
+
+    assert response.status_code == 200
+    assert statuses(response) == [
+        (202, None),
+        (400, 'Event must be a JSON object'),
+        (400, 'Event must be a JSON object'),
+        (400, 'Missing event type'),
+    ]
+    body = response.get_json()
+    assert (body['received'], body['queued'], body['rejected']) == (4, 1, 3)
+    assert overseer_bot.WEBHOOK_QUEUE.qsize() == 1
+
+
+def test_ndjson_reports_bad_lines_and_skips_blank_ones(webhooks):
+    response = webhooks.post(
+        '/overseer-event/batch',
+        data=ndjson('"hello"', '{not json', '', '{"type": "perk", "perk": "Toughness"}'),
+        content_type='application/x-ndjson'
+    )
+
+    assert response.status_code == 200
+    assert statuses(response) == [
+        (400, 'Event must be a JSON object'),
+        (400, 'Invalid JSON line'),
+        (202, None),
+    ]
+
+
+def test_body_that_is_not_an_array_is_rejected(webhooks):
+    response = webhooks.post('/overseer-event/batch', json={'type': 'perk'})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('content_type', ['application/json', 'application/x-ndjson'])
+def test_oversized_batch_is_rejected_before_anything_is_queued(webhooks, monkeypatch, content_type):
+    monkeypatch.setattr(overseer_bot, 'WEBHOOK_BATCH_MAX_ITEMS', 3)
+    events = [{'type': 'perk', 'perk': f'Perk {i}'} for i in range(4)]
+    if content_type == 'application/json':
+        data = json.dumps(events)
+    else:
+        data = ndjson(*(json.dumps(event) for event in events))
+
+    response = webhooks.post('/overseer-event/batch', data=data, content_type=content_type)
+
+    assert response.status_code == 413
+    assert overseer_bot.WEBHOOK_QUEUE.qsize() == 0
+
+
+def test_batch_at_the_limit_is_accepted(webhooks, monkeypatch):
+    monkeypatch.setattr(overseer_bot, 'WEBHOOK_BATCH_MAX_ITEMS', 3)
+    events = [{'type': 'perk', 'perk': f'Perk {i}'} for i in range(3)]
+
+    response = webhooks.post('/overseer-event/batch', json=events)
+
+    assert response.get_json()['queued'] == 3
+
+
+def test_event_key_matches_a_single_delivery_retry(webhooks):
+    event = {'type': 'perk', 'perk': 'Lady Killer', 'idempotency_key': 'evt-1'}
+
+    first = webhooks.post('/overseer-event/batch', json=[event])
+    retry = webhooks.post('/overseer-event', json=dict(event, perk='Lady Killer (resent)'))
+
+    assert statuses(first) == [(202, None)]
+    assert retry.status_code == 200
+    assert retry.get_json()['duplicate'] is True
+
+
+def test_batch_header_key_matches_the_same_batch_only(webhooks):
+    events = [{'type': 'perk', 'perk': 'Strong Back'}, {'type': 'perk', 'perk': 'Cannibal'}]
+    headers = {overseer_bot.IDEMPOTENCY_HEADER: 'batch-7'}
+
+    first = webhooks.post('/overseer-event/batch', json=events, headers=headers)
+    retry = webhooks.post('/overseer-event/batch', json=events, headers=headers)
+    single = webhooks.post('/overseer-event', json=events[0], headers=headers)
+
+    assert first.get_json()['queued'] == 2
+    assert retry.get_json()['duplicates'] == 2
+    assert single.status_code == 202
+
+
+def test_unauthorized_batch_is_rejected(webhooks, monkeypatch):
+    monkeypatch.setattr(overseer_bot, 'WEBHOOK_API_KEY', 'secret')
+
+    response = webhooks.post('/overseer-event/batch', json=[{'type': 'perk'}])
+
+    assert response.status_code == 401
+    assert overseer_bot.WEBHOOK_QUEUE.qsize() == 0
+
+
+@pytest.mark.parametrize('payload, header_key, index, expected', [
+    ({'idempotency_key': 'evt-9'}, 'hdr', 3, 'evt-9'),
+    ({'idempotency_key': 12}, None, None, '12'),
+    ({'type': 'perk'}, 'hdr', 3, 'hdr:3'),
+    ({'type': 'perk'}, 'hdr', None, 'hdr'),
+    ({'type': 'perk'}, '', None, None),
+    ('not an object', 'hdr', 0, 'hdr:0'),
+])
+def test_event_idempotency_key(payload, header_key, index, expected):
+    assert overseer_bot.event_idempotency_key(payload, header_key, index) == expected
+